@@ -1,6 +1,6 @@
 from pyVHDLModel import DesignUnit
 from pyVHDLModel.Base import Mode
-from pyVHDLModel.Symbol import PackageSymbol
+from pyVHDLModel.Symbol import EntitySymbol, PackageSymbol
 from .VHDLLexer import VHDLLexer
 
 from ..LanguageModel.DesignUnit import Context, Entity, Architecture, Configuration, Package, PackageBody
@@ -89,12 +89,13 @@ class VHDLVisitor(VHDLParserVisitor):
 	def visitRule_Architecture(self, ctx:VHDLParser.Rule_ArchitectureContext):
 		architectureName = self.checkRepeatedName(ctx.name, ctx.name2, "architecture")
 		entityName: str = ctx.entityName.text  # TODO: needs a Name
+		entitySymbol = EntitySymbol(entityName)
 
 		context = []
 		declaredItems = []
 		statements = []
 
-		return Architecture(architectureName, entityName, context, declaredItems, statements)
+		return Architecture(architectureName, entitySymbol, context, declaredItems, statements)
 
 	def visitRule_ConfigurationDeclaration(self, ctx:VHDLParser.Rule_ConfigurationDeclarationContext):
 		configurationName = self.checkRepeatedName(ctx.name, ctx.name2, "configuration")
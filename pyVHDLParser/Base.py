@@ -35,6 +35,11 @@ class ExceptionBase(Exception):
 	def __init__(self, message: str):
 		self._message = message
 
+	@property
+	def Message(self) -> str:
+		"""Returns the error message without additional information like a source position."""
+		return self._message
+
 	def __str__(self) -> str:
 		return self._message
 
@@ -0,0 +1,510 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+A reproducible benchmark suite for all stages of the parser pipeline.
+
+Each input is processed by the native pipeline (tokenizer, blocks, groups and the document model) and by the ANTLR4
+based lexer and parser. Every stage is measured separately on the fully materialized output of its preceding stage.
+The best of all repetitions is reported as duration, together with throughput in characters and items (tokens, blocks,
+groups) per second. Peak memory of a stage is measured in an additional pass by :mod:`tracemalloc`.
+
+If a stage fails, e.g. because the parser doesn't support a language construct yet, the number of items created until
+the error and the error message are recorded and all following stages are skipped.
+
+Results are written as JSON, so results of two commits can be compared:
+
+.. code-block:: Bash
+
+   python -m pyVHDLParser.Benchmark --output baseline.json
+   # ... checkout another commit ...
+   python -m pyVHDLParser.Benchmark --output current.json --compare baseline.json
+"""
+from datetime                     import datetime, timezone
+from enum                         import Enum
+from gc                           import collect
+from json                         import dump, load
+from pathlib                      import Path
+from platform                     import machine, platform, python_implementation, python_version
+from statistics                   import median
+from subprocess                   import run, DEVNULL
+from time                         import perf_counter_ns
+from tracemalloc                  import start as tracemallocStart, stop as tracemallocStop, is_tracing, get_traced_memory, reset_peak
+from typing                       import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pyTooling.Decorators         import export
+from pyTooling.MetaClasses        import ExtendedType
+
+from pyVHDLParser                 import __version__
+from pyVHDLParser.Token.Parser    import Tokenizer
+from pyVHDLParser.Blocks          import TokenToBlockParser, InitializeBlocks
+from pyVHDLParser.Groups          import BlockToGroupParser
+
+
+#: Version of the JSON result format.
+SCHEMA_VERSION = 1
+
+#: Path to the bundled VHDL corpus, if pyVHDLParser is used from a source checkout.
+CORPUS_DIRECTORY = Path(__file__).parent.parent.parent / "vhdl"
+
+
+@export
+class BenchmarkStage(Enum):
+	"""Measured stages of the native and the ANTLR4 pipeline."""
+
+	Tokenizer =            "tokenizer"               #: Character-based tokenizer (:meth:`~pyVHDLParser.Token.Parser.Tokenizer.GetVHDLTokenizer`).
+	TableDrivenTokenizer = "tokenizer-table-driven"  #: Table-driven tokenizer, whose tokens are used by all following stages.
+	Blocks =               "blocks"                  #: Transforming tokens to blocks.
+	Groups =               "groups"                  #: Transforming blocks to groups.
+	DocumentModel =        "dom"                     #: Transforming groups to a document model.
+	ANTLR4Lexer =          "antlr4-lexer"            #: ANTLR4 based lexer.
+	ANTLR4Parser =         "antlr4-parser"           #: ANTLR4 based parser creating a parse tree.
+
+
+#: Unit of the items counted per stage.
+STAGE_UNITS = {
+	BenchmarkStage.Tokenizer:            "tokens",
+	BenchmarkStage.TableDrivenTokenizer: "tokens",
+	BenchmarkStage.Blocks:               "blocks",
+	BenchmarkStage.Groups:               "groups",
+	BenchmarkStage.DocumentModel:        "groups",
+	BenchmarkStage.ANTLR4Lexer:          "tokens",
+	BenchmarkStage.ANTLR4Parser:         "tokens"
+}
+
+NATIVE_STAGES = (BenchmarkStage.Tokenizer, BenchmarkStage.TableDrivenTokenizer, BenchmarkStage.Blocks, BenchmarkStage.Groups, BenchmarkStage.DocumentModel)
+ANTLR4_STAGES = (BenchmarkStage.ANTLR4Lexer, BenchmarkStage.ANTLR4Parser)
+
+
+@export
+class BenchmarkInput(metaclass=ExtendedType, useSlots=True):
+	"""A named VHDL source code used as benchmark input."""
+
+	Name:    str  #: Name of the input in the results, e.g. a relative path.
+	Content: str  #: VHDL source code.
+
+	def __init__(self, name: str, content: str):
+		self.Name =    name
+		self.Content = content
+
+	@property
+	def Characters(self) -> int:
+		return len(self.Content)
+
+	@property
+	def Lines(self) -> int:
+		return self.Content.count("\n") + (0 if self.Content.endswith("\n") else 1)
+
+
+@export
+class StageResult(metaclass=ExtendedType, useSlots=True):
+	"""Measurements of a single stage for a single input."""
+
+	Stage:      BenchmarkStage  #: Measured stage.
+	Characters: int             #: Number of characters of the input.
+	Items:      int             #: Number of items created (or consumed) by this stage. Partial, if an error occurred.
+	Durations:  List[float]     #: Duration of each repetition in seconds. Empty, if the stage was skipped.
+	PeakMemory: Optional[int]   #: Peak of allocated memory while running this stage in bytes, if measured.
+	Error:      Optional[str]   #: Error message, if the stage failed or was skipped.
+
+	def __init__(self, stage: BenchmarkStage, characters: int, error: str = None):
+		self.Stage =      stage
+		self.Characters = characters
+		self.Items =      0
+		self.Durations =  []
+		self.PeakMemory = None
+		self.Error =      error
+
+	@property
+	def Unit(self) -> str:
+		return STAGE_UNITS[self.Stage]
+
+	@property
+	def Skipped(self) -> bool:
+		"""Returns true, if the stage wasn't run."""
+		return len(self.Durations) == 0
+
+	@property
+	def Duration(self) -> Optional[float]:
+		"""Returns the best duration of all repetitions in seconds."""
+		return min(self.Durations) if len(self.Durations) > 0 else None
+
+	@property
+	def CharactersPerSecond(self) -> Optional[float]:
+		duration = self.Duration
+		return self.Characters / duration if duration else None
+
+	@property
+	def ItemsPerSecond(self) -> Optional[float]:
+		duration = self.Duration
+		return self.Items / duration if duration else None
+
+	def ToDict(self) -> Dict[str, Any]:
+		return {
+			"unit":                self.Unit,
+			"items":               self.Items,
+			"duration":            self.Duration,
+			"medianDuration":      median(self.Durations) if len(self.Durations) > 0 else None,
+			"durations":           self.Durations,
+			"charactersPerSecond": self.CharactersPerSecond,
+			"itemsPerSecond":      self.ItemsPerSecond,
+			"peakMemory":          self.PeakMemory,
+			"error":               self.Error
+		}
+
+
+@export
+class InputResult(metaclass=ExtendedType, useSlots=True):
+	"""Measurements of all stages for a single input."""
+
+	Name:       str                                #: Name of the input.
+	Characters: int                                #: Number of characters of the input.
+	Lines:      int                                #: Number of lines of the input.
+	Stages:     Dict[BenchmarkStage, StageResult]  #: Results per stage in pipeline order.
+
+	def __init__(self, input: BenchmarkInput):
+		self.Name =       input.Name
+		self.Characters = input.Characters
+		self.Lines =      input.Lines
+		self.Stages =     {}
+
+	def ToDict(self) -> Dict[str, Any]:
+		return {
+			"name":       self.Name,
+			"characters": self.Characters,
+			"lines":      self.Lines,
+			"stages":     {stage.value: result.ToDict() for stage, result in self.Stages.items()}
+		}
+
+
+@export
+class BenchmarkReport(metaclass=ExtendedType, useSlots=True):
+	"""Results of a benchmark run and the environment it was run in."""
+
+	Metadata: Dict[str, Any]     #: Versions, platform, commit and settings of this run.
+	Inputs:   List[InputResult]  #: Results per input.
+
+	def __init__(self, metadata: Dict[str, Any]):
+		self.Metadata = metadata
+		self.Inputs =   []
+
+	def ToDict(self) -> Dict[str, Any]:
+		return {
+			"schema":   SCHEMA_VERSION,
+			"metadata": self.Metadata,
+			"inputs":   [input.ToDict() for input in self.Inputs]
+		}
+
+	def WriteJSON(self, file: Union[Path, str]) -> None:
+		with Path(file).open("w") as fileHandle:
+			dump(self.ToDict(), fileHandle, indent=2)
+
+
+@export
+class StageComparison(metaclass=ExtendedType, useSlots=True):
+	"""Comparison of a stage's best duration for the same input in two benchmark results."""
+
+	Input:    str    #: Name of the input.
+	Stage:    str    #: Name of the stage.
+	Baseline: float  #: Duration in the baseline result in seconds.
+	Current:  float  #: Duration in the current result in seconds.
+
+	def __init__(self, input: str, stage: str, baseline: float, current: float):
+		self.Input =    input
+		self.Stage =    stage
+		self.Baseline = baseline
+		self.Current =  current
+
+	@property
+	def Speedup(self) -> float:
+		"""Returns how many times faster the current result is (> 1.0) or slower (< 1.0) than the baseline."""
+		return self.Baseline / self.Current if self.Current > 0 else float("inf")
+
+	def __str__(self) -> str:
+		return f"{self.Input} {self.Stage}: {self.Baseline * 1000:.3f} ms -> {self.Current * 1000:.3f} ms ({self.Speedup:.2f}x)"
+
+
+@export
+def CorpusInputs(directory: Union[Path, str] = CORPUS_DIRECTORY, pattern: str = "**/*.vhdl") -> List[BenchmarkInput]:
+	"""
+	Read all VHDL files in a directory as benchmark inputs.
+
+	:param directory: Directory to search for VHDL files. By default, the bundled ``vhdl/`` corpus.
+	:param pattern:   Glob pattern relative to ``directory``.
+	:returns:         Inputs named by their path relative to ``directory``, sorted by name.
+	"""
+	directory = Path(directory)
+	inputs = []
+	for file in sorted(directory.glob(pattern)):
+		with file.open("r") as fileHandle:
+			inputs.append(BenchmarkInput(file.relative_to(directory).as_posix(), fileHandle.read()))
+
+	return inputs
+
+
+_SYNTHETIC_HEADER = """\
+library ieee;
+use     ieee.std_logic_1164.all;
+
+"""
+
+_SYNTHETIC_UNIT = """\
+-- Design unit {index}
+entity e{index} is
+	generic (
+		G : integer := {index}
+	);
+end entity;
+
+architecture rtl of e{index} is
+	signal s{index} : bit;
+begin
+	process (s{index})
+	begin
+		null;
+	end process;
+end architecture;
+
+"""
+
+
+@export
+def SyntheticInput(designUnits: int) -> BenchmarkInput:
+	"""
+	Create a deterministic benchmark input with the given number of entity/architecture pairs.
+
+	:param designUnits: Number of entity/architecture pairs.
+	:returns:           An input named ``synthetic-<designUnits>``.
+	"""
+	content = _SYNTHETIC_HEADER + "".join(_SYNTHETIC_UNIT.format(index=index) for index in range(designUnits))
+	return BenchmarkInput(f"synthetic-{designUnits}", content)
+
+
+def _ErrorMessage(ex: Exception) -> str:
+	return f"{ex.__class__.__name__}: {ex}"
+
+
+def _Measure(consume: Callable[[], None], traceMemory: bool) -> Tuple[float, Optional[int], Optional[str]]:
+	"""Run a stage and return its duration in seconds, its peak memory in bytes (if traced) and an error message."""
+	collect()
+	if traceMemory:
+		reset_peak()
+		baseline = get_traced_memory()[0]
+
+	error = None
+	start = perf_counter_ns()
+	try:
+		consume()
+	except Exception as ex:
+		error = _ErrorMessage(ex)
+	duration = (perf_counter_ns() - start) / 1e9
+
+	peakMemory = (get_traced_memory()[1] - baseline) if traceMemory else None
+	return duration, peakMemory, error
+
+
+_Measurement = Tuple[BenchmarkStage, int, float, Optional[int], Optional[str]]
+
+
+def _NativePipeline(input: BenchmarkInput, traceMemory: bool) -> Iterator[_Measurement]:
+	"""Run all stages of the native pipeline and yield stage, item count, duration, peak memory and error per stage."""
+	from pyVHDLParser.DocumentModel import Document
+
+	tokens: List = []
+	duration, peakMemory, error = _Measure(lambda: tokens.extend(Tokenizer.GetVHDLTokenizer(input.Content)), traceMemory)
+	yield BenchmarkStage.Tokenizer, len(tokens), duration, peakMemory, error
+
+	tokens = []
+	duration, peakMemory, error = _Measure(lambda: tokens.extend(Tokenizer.GetTableDrivenVHDLTokenizer(input.Content)), traceMemory)
+	yield BenchmarkStage.TableDrivenTokenizer, len(tokens), duration, peakMemory, error
+	if error is not None:
+		return
+
+	blocks: List = []
+	duration, peakMemory, error = _Measure(lambda: blocks.extend(TokenToBlockParser(tokens)()), traceMemory)
+	yield BenchmarkStage.Blocks, len(blocks), duration, peakMemory, error
+	if error is not None:
+		return
+
+	groups: List = []
+	duration, peakMemory, error = _Measure(lambda: groups.extend(BlockToGroupParser(blocks)()), traceMemory)
+	yield BenchmarkStage.Groups, len(groups), duration, peakMemory, error
+	if error is not None:
+		return
+
+	document = Document(Path(input.Name))
+	duration, peakMemory, error = _Measure(lambda: Document.stateParse(document, groups[0]), traceMemory)
+	yield BenchmarkStage.DocumentModel, len(groups), duration, peakMemory, error
+
+
+def _ANTLR4Pipeline(input: BenchmarkInput, traceMemory: bool) -> Iterator[_Measurement]:
+	"""Run the ANTLR4 based lexer and parser and yield stage, token count, duration, peak memory and error per stage."""
+	from antlr4                         import CommonTokenStream, InputStream
+	from pyVHDLParser.ANTLR4.VHDLLexer  import VHDLLexer
+	from pyVHDLParser.ANTLR4.VHDLParser import VHDLParser
+
+	stream = CommonTokenStream(VHDLLexer(InputStream(input.Content)))
+	duration, peakMemory, error = _Measure(stream.fill, traceMemory)
+	yield BenchmarkStage.ANTLR4Lexer, len(stream.tokens), duration, peakMemory, error
+	if error is not None:
+		return
+
+	parser = VHDLParser(stream)
+	duration, peakMemory, error = _Measure(parser.rule_DesignFile, traceMemory)
+	yield BenchmarkStage.ANTLR4Parser, len(stream.tokens), duration, peakMemory, error
+
+
+def _ANTLR4Available() -> Optional[str]:
+	"""Return an error message, if the optional ``antlr4`` runtime isn't installed."""
+	try:
+		import antlr4
+	except ImportError as ex:
+		return f"Skipped, because the ANTLR4 runtime is not available: {ex}"
+
+	return None
+
+
+def _GitCommit() -> Optional[str]:
+	try:
+		completed = run(["git", "rev-parse", "HEAD"], cwd=Path(__file__).parent, capture_output=True, text=True, stdin=DEVNULL, timeout=10)
+	except (OSError, ValueError, TimeoutError):
+		return None
+
+	return completed.stdout.strip() if completed.returncode == 0 else None
+
+
+def _Metadata(repeat: int, traceMemory: bool, stages: Iterable[BenchmarkStage]) -> Dict[str, Any]:
+	return {
+		"pyVHDLParser":   __version__,
+		"commit":         _GitCommit(),
+		"python":         python_version(),
+		"implementation": python_implementation(),
+		"platform":       platform(),
+		"machine":        machine(),
+		"timestamp":      datetime.now(timezone.utc).isoformat(timespec="seconds"),
+		"repeat":         repeat,
+		"traceMemory":    traceMemory,
+		"stages":         [stage.value for stage in stages]
+	}
+
+
+def _BenchmarkInput(input: BenchmarkInput, pipelines: List[Tuple[Callable, Tuple[BenchmarkStage, ...]]], repeat: int, traceMemory: bool) -> InputResult:
+	result = InputResult(input)
+	for pipeline, stages in pipelines:
+		for stage in stages:
+			result.Stages[stage] = StageResult(stage, input.Characters, "Skipped, because a previous stage failed.")
+
+		for _ in range(repeat):
+			for stage, items, duration, _, error in pipeline(input, False):
+				stageResult = result.Stages[stage]
+				stageResult.Items = items
+				stageResult.Error = error
+				stageResult.Durations.append(duration)
+
+		if traceMemory:
+			tracemallocStart()
+			try:
+				for stage, _, _, peakMemory, _ in pipeline(input, True):
+					result.Stages[stage].PeakMemory = peakMemory
+			finally:
+				tracemallocStop()
+
+	return result
+
+
+@export
+def RunBenchmark(inputs: Iterable[BenchmarkInput], repeat: int = 3, antlr4: bool = True, traceMemory: bool = True) -> BenchmarkReport:
+	"""
+	Measure all stages of the native pipeline and, if requested and installed, of the ANTLR4 pipeline.
+
+	:param inputs:      Benchmark inputs, e.g. from :func:`CorpusInputs` and :func:`SyntheticInput`.
+	:param repeat:      Number of timed repetitions per input. The best duration is reported.
+	:param antlr4:      If true, measure the ANTLR4 based lexer and parser.
+	:param traceMemory: If true, measure peak memory per stage in an additional, untimed pass.
+	:returns:           The benchmark report.
+	"""
+	if repeat < 1:
+		raise ValueError("Parameter 'repeat' must be at least 1.")
+	if traceMemory and is_tracing():
+		raise ValueError("Memory can't be traced, because tracemalloc is already tracing.")
+
+	InitializeBlocks()
+
+	pipelines = [(_NativePipeline, NATIVE_STAGES)]
+	antlr4Error = _ANTLR4Available() if antlr4 else None
+	if antlr4 and antlr4Error is None:
+		pipelines.append((_ANTLR4Pipeline, ANTLR4_STAGES))
+
+	stages = NATIVE_STAGES + (ANTLR4_STAGES if antlr4 else ())
+	report = BenchmarkReport(_Metadata(repeat, traceMemory, stages))
+	for input in inputs:
+		result = _BenchmarkInput(input, pipelines, repeat, traceMemory)
+		if antlr4Error is not None:
+			for stage in ANTLR4_STAGES:
+				result.Stages[stage] = StageResult(stage, input.Characters, antlr4Error)
+		report.Inputs.append(result)
+
+	return report
+
+
+@export
+def ReadJSON(file: Union[Path, str]) -> Dict[str, Any]:
+	"""Read a benchmark result written by :meth:`BenchmarkReport.WriteJSON`."""
+	with Path(file).open("r") as fileHandle:
+		result = load(fileHandle)
+
+	if result.get("schema") != SCHEMA_VERSION:
+		raise ValueError(f"Unsupported benchmark result schema '{result.get('schema')}' in '{file}'.")
+
+	return result
+
+
+@export
+def CompareResults(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[StageComparison]:
+	"""
+	Compare the best durations of all stages, which were measured for the same input in both results.
+
+	:param baseline: A benchmark result as returned by :meth:`BenchmarkReport.ToDict` or :func:`ReadJSON`.
+	:param current:  Another benchmark result.
+	:returns:        Comparisons in the order of the current result.
+	"""
+	baselineDurations = {
+		(input["name"], stage): result["duration"]
+		for input in baseline["inputs"]
+		for stage, result in input["stages"].items()
+	}
+
+	comparisons = []
+	for input in current["inputs"]:
+		for stage, result in input["stages"].items():
+			baselineDuration = baselineDurations.get((input["name"], stage))
+			if baselineDuration is not None and result["duration"] is not None:
+				comparisons.append(StageComparison(input["name"], stage, baselineDuration, result["duration"]))
+
+	return comparisons
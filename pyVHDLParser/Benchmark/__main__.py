@@ -0,0 +1,98 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+Command line runner of the benchmark suite.
+
+.. code-block:: Bash
+
+   python -m pyVHDLParser.Benchmark --output results.json [--compare baseline.json]
+"""
+from argparse                 import ArgumentParser
+from pathlib                  import Path
+from typing                   import List
+
+from pyVHDLParser.Benchmark   import CORPUS_DIRECTORY, BenchmarkReport, CorpusInputs, SyntheticInput, RunBenchmark, ReadJSON, CompareResults
+
+
+def _Rate(value: float) -> str:
+	if value is None:
+		return "-"
+	elif value >= 1e6:
+		return f"{value / 1e6:.2f} M"
+	elif value >= 1e3:
+		return f"{value / 1e3:.1f} k"
+	return f"{value:.0f} "
+
+
+def _PrintReport(report: BenchmarkReport) -> None:
+	print(f"{'input':<28} {'stage':<24} {'chars/s':>10} {'items/s':>16} {'peak':>10}  error")
+	for input in report.Inputs:
+		for stage, result in input.Stages.items():
+			peakMemory = "-" if result.PeakMemory is None else f"{result.PeakMemory / 1024**2:.2f} MiB"
+			items =      f"{_Rate(result.ItemsPerSecond)}{result.Unit}" if not result.Skipped else "-"
+			print(f"{input.Name:<28} {stage.value:<24} {_Rate(result.CharactersPerSecond):>10} {items:>16} {peakMemory:>10}  {result.Error or ''}")
+
+
+def main(arguments: List[str] = None) -> int:
+	argumentParser = ArgumentParser(prog="python -m pyVHDLParser.Benchmark", description="Measure throughput and peak memory of all parser stages.")
+	argumentParser.add_argument("--corpus",    type=Path, action="append", help=f"Directory with VHDL files. Can be given multiple times. Default: '{CORPUS_DIRECTORY}'.")
+	argumentParser.add_argument("--scale",     type=int,  action="append", help="Number of design unit pairs in a synthetic input. Can be given multiple times. Default: 10, 100, 1000.")
+	argumentParser.add_argument("--repeat",    type=int,  default=3,       help="Number of timed repetitions. Default: 3.")
+	argumentParser.add_argument("--no-antlr4", dest="antlr4",      action="store_false", help="Don't measure the ANTLR4 pipeline.")
+	argumentParser.add_argument("--no-memory", dest="traceMemory", action="store_false", help="Don't measure peak memory.")
+	argumentParser.add_argument("--output",    type=Path,          help="Write results as JSON to this file.")
+	argumentParser.add_argument("--compare",   type=Path,          help="Compare durations with a previously written JSON file.")
+	args = argumentParser.parse_args(arguments)
+
+	inputs = []
+	for directory in (args.corpus if args.corpus is not None else [CORPUS_DIRECTORY]):
+		if not directory.is_dir():
+			argumentParser.error(f"Corpus directory '{directory}' does not exist.")
+		inputs.extend(CorpusInputs(directory))
+	for designUnits in (args.scale if args.scale is not None else [10, 100, 1000]):
+		inputs.append(SyntheticInput(designUnits))
+
+	report = RunBenchmark(inputs, repeat=args.repeat, antlr4=args.antlr4, traceMemory=args.traceMemory)
+	_PrintReport(report)
+
+	if args.output is not None:
+		report.WriteJSON(args.output)
+		print(f"Results written to '{args.output}'.")
+
+	if args.compare is not None:
+		print(f"\nComparison with '{args.compare}':")
+		for comparison in CompareResults(ReadJSON(args.compare), report.ToDict()):
+			print(f"  {comparison}")
+
+	return 0
+
+
+if __name__ == "__main__":
+	exit(main())
@@ -163,7 +163,7 @@ class IsBlock(SequentialBeginBlock):
 	def stateWhitespace1(cls, parserState: TokenToBlockParser):
 		token = parserState.Token
 		if isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 			if tokenValue == "when":
 				newToken =                WhenKeyword(fromExistingToken=token)
 				parserState.NewToken =    newToken
@@ -56,7 +56,7 @@ class ThenBlock(SequentialBeginBlock):
 	def stateSequentialRegion(cls, parserState: TokenToBlockParser):
 		token = parserState.Token
 		if isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 
 			if tokenValue == "elsif":
 				newToken =                ElsIfKeyword(fromExistingToken=token)
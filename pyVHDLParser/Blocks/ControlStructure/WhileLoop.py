@@ -211,7 +211,7 @@ class ConditionBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "generic":
 				newToken =              GenericKeyword(fromExistingToken=token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -422,7 +422,7 @@ class ExpressionBlockEndedByToOrDownto(ExpressionBlock):
 				parserState.NewToken =    cls.CHARACTER_TRANSLATION[token.Value](fromExistingToken=token)
 				return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 			if tokenValue == "to":
 				from pyVHDLParser.Blocks.ControlStructure.ForLoop import LoopIterationDirectionBlock
 
@@ -483,7 +483,7 @@ class ExpressionBlockEndedByToOrDownto(ExpressionBlock):
 				parserState.NextState =   cls.stateExpression
 				return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 			if tokenValue == "to":
 				from pyVHDLParser.Blocks.ControlStructure.ForLoop import LoopIterationDirectionBlock
 
@@ -561,7 +561,7 @@ class ExpressionBlockEndedByKeywordOrToOrDownto(ExpressionBlock):
 				parserState.NewToken =    cls.CHARACTER_TRANSLATION[token.Value](fromExistingToken=token)
 				return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 			if tokenValue == cls.EXIT_KEYWORD.__KEYWORD__:
 				parserState.NewToken =    LoopKeyword(fromExistingToken=token)
 				parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=parserState.NewToken.PreviousToken)
@@ -628,7 +628,7 @@ class ExpressionBlockEndedByKeywordOrToOrDownto(ExpressionBlock):
 				parserState.NextState =   cls.stateExpression
 				return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 			if tokenValue == cls.EXIT_KEYWORD.__KEYWORD__:
 				parserState.NewToken =    LoopKeyword(fromExistingToken=token)
 				parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=parserState.NewToken.PreviousToken)
@@ -212,7 +212,7 @@ class RangeBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "generic":
 				newToken =              GenericKeyword(fromExistingToken=token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -263,7 +263,7 @@ class BeginBlock(Block):
 		# 	parserState.NewBlock = IndentationBlock(parserState.LastBlock, parserState.NewToken)
 		# 	return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "process":
 				newToken =                ProcessKeyword(fromExistingToken=token)
 				parserState.PushState =   Process.OpenBlock.stateProcessKeyword
@@ -213,7 +213,7 @@ class IfConditionBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "generic":
 				newToken =              GenericKeyword(fromExistingToken=token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -264,7 +264,7 @@ class BeginBlock(Block):
 		# 	parserState.NewBlock = IndentationBlock(parserState.LastBlock, parserState.NewToken)
 		# 	return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "process":
 				newToken =                ProcessKeyword(fromExistingToken=token)
 				parserState.PushState =   Process.OpenBlock.stateProcessKeyword
@@ -455,7 +455,7 @@ class ElsIfConditionBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "generic":
 				newToken =              GenericKeyword(fromExistingToken=token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -506,7 +506,7 @@ class ElsIfBeginBlock(Block):
 		# 	parserState.NewBlock = IndentationBlock(parserState.LastBlock, parserState.NewToken)
 		# 	return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "process":
 				newToken =                ProcessKeyword(fromExistingToken=token)
 				parserState.PushState =   Process.OpenBlock.stateProcessKeyword
@@ -697,7 +697,7 @@ class ElseGenerateBlock(Block):
 			parserState.NewBlock =      IndentationBlock(parserState.LastBlock, parserState.NewToken)
 			return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "generic":
 				newToken =              GenericKeyword(fromExistingToken=token)
 				parserState.PushState = GenericList.OpenBlock.stateGenericKeyword
@@ -748,7 +748,7 @@ class ElseGenerateBeginBlock(Block):
 		# 	parserState.NewBlock = IndentationBlock(parserState.LastBlock, parserState.NewToken)
 		# 	return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "process":
 				newToken =                ProcessKeyword(fromExistingToken=token)
 				parserState.PushState =   Process.OpenBlock.stateProcessKeyword
@@ -35,7 +35,7 @@ from pyVHDLParser.Token                   import LinebreakToken, WordToken, Spac
 from pyVHDLParser.Token.Keywords          import AssertKeyword, EndKeyword, ProcessKeyword, ReportKeyword, IfKeyword, ForKeyword, ReturnKeyword, NextKeyword, NullKeyword
 from pyVHDLParser.Token.Keywords          import ExitKeyword, UseKeyword, SignalKeyword, ConstantKeyword, SharedKeyword, FunctionKeyword, ProcedureKeyword
 from pyVHDLParser.Token.Keywords          import ImpureKeyword, PureKeyword, VariableKeyword, BeginKeyword, CaseKeyword
-from pyVHDLParser.Blocks                  import BlockParserException, CommentBlock, TokenToBlockParser, MetaBlock
+from pyVHDLParser.Blocks                  import BlockParserException, CommentBlock, TokenToBlockParser, MetaBlock, KeywordTransitions
 from pyVHDLParser.Blocks.Common           import LinebreakBlock, WhitespaceBlock, IndentationBlock
 from pyVHDLParser.Blocks.Object.Variable  import VariableDeclarationBlock
 from pyVHDLParser.Blocks.Generic1         import EndBlock, BeginBlock
@@ -49,6 +49,7 @@ class DeclarativeRegion(metaclass=MetaBlock):
 	END_BLOCK:   EndBlock
 
 	KEYWORDS: Any  # TODO: what type?
+	KEYWORD_TRANSITIONS = None
 
 	@classmethod
 	def __cls_init__(cls):
@@ -66,6 +67,7 @@ class DeclarativeRegion(metaclass=MetaBlock):
 			PureKeyword:      Function.NameBlock.statePureKeyword,
 			# AliasKeyword:     Alias.NameBlock.stateAliasKeyword
 		}
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 
 	@classmethod
@@ -85,15 +87,16 @@ class DeclarativeRegion(metaclass=MetaBlock):
 			parserState.TokenMarker =   None
 			return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if tokenValue == keyword.__KEYWORD__:
-					newToken =                keyword(fromExistingToken=token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.Key
+
+			keywordTransition = cls.KEYWORD_TRANSITIONS.get(tokenValue)
+			if keywordTransition is not None:
+				keyword, transition = keywordTransition
+				newToken =                keyword(fromExistingToken=token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if tokenValue == "begin":
 				parserState.NewToken =  BeginKeyword(fromExistingToken=token)
@@ -130,6 +133,7 @@ class ConcurrentDeclarativeRegion(DeclarativeRegion):
 			SignalKeyword:    SignalDeclarationBlock.stateSignalKeyword,
 			SharedKeyword:    SharedVariableDeclarationBlock.stateSharedKeyword
 		})
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 
 @export
@@ -145,6 +149,7 @@ class SequentialDeclarativeRegion(DeclarativeRegion):
 			# Keyword         Transition
 			VariableKeyword:  VariableDeclarationBlock.stateVariableKeyword
 		})
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 
 @export
@@ -159,6 +164,7 @@ class ConcurrentBeginBlock(BeginBlock):
 			AssertKeyword:      AssertBlock.stateAssertKeyword,
 			ProcessKeyword:     Process.OpenBlock.stateProcessKeyword,
 		}
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 	@classmethod
 	def stateStatementRegion(cls, parserState: TokenToBlockParser):
@@ -179,15 +185,16 @@ class ConcurrentBeginBlock(BeginBlock):
 			parserState.TokenMarker = None
 			return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if tokenValue == keyword.__KEYWORD__:
-					newToken = keyword(fromExistingToken=token)
-					parserState.PushState = cls.KEYWORDS[keyword]
-					parserState.NewToken = newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.Key
+
+			keywordTransition = cls.KEYWORD_TRANSITIONS.get(tokenValue)
+			if keywordTransition is not None:
+				keyword, transition = keywordTransition
+				newToken = keyword(fromExistingToken=token)
+				parserState.PushState = transition
+				parserState.NewToken = newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if tokenValue == "end":
 				parserState.NewToken =  EndKeyword(fromExistingToken=token)
@@ -229,6 +236,7 @@ class SequentialBeginBlock(BeginBlock):
 			ReportKeyword:  ReportBlock.stateReportKeyword,
 			NullKeyword:    NullBlock.stateNullKeyword
 		}
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 	@classmethod
 	def stateStatementRegion(cls, parserState: TokenToBlockParser):
@@ -252,15 +260,16 @@ class SequentialBeginBlock(BeginBlock):
 			parserState.TokenMarker = None
 			return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if tokenValue == keyword.__KEYWORD__:
-					newToken =                keyword(fromExistingToken=token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.Key
+
+			keywordTransition = cls.KEYWORD_TRANSITIONS.get(tokenValue)
+			if keywordTransition is not None:
+				keyword, transition = keywordTransition
+				newToken =                keyword(fromExistingToken=token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if tokenValue == "end":
 				parserState.NewToken =  EndKeyword(fromExistingToken=token)
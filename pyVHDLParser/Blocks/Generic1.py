@@ -333,6 +333,7 @@ class BeginBlock(Block):
 	END_BLOCK: EndBlock
 
 	KEYWORDS: Any  # TODO: what type?
+	KEYWORD_TRANSITIONS = None
 
 	@classmethod
 	def stateStatementRegion(cls, parserState: TokenToBlockParser):
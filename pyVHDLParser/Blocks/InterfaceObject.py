@@ -134,7 +134,7 @@ class InterfaceObjectBlock(Block):
 		token = parserState.Token
 		if isinstance(token, WordToken):
 			try:
-				parserState.NewToken =    cls.MODES[token.Value.lower()](fromExistingToken=token)
+				parserState.NewToken =    cls.MODES[token.Key](fromExistingToken=token)
 				parserState.NextState =   cls.stateModeKeyword
 				return
 			except KeyError:
@@ -159,7 +159,7 @@ class InterfaceObjectBlock(Block):
 	def stateWhitespace3(cls, parserState: TokenToBlockParser):
 		token = parserState.Token
 		if isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 			try:
 				parserState.NewToken =    cls.MODES[tokenValue](fromExistingToken=token)
 				parserState.NextState =   cls.stateModeKeyword
@@ -181,7 +181,7 @@ class DelimiterBlock(SkipableBlock):
 	def stateItemDelimiter(cls, parserState: TokenToBlockParser):
 		token = parserState.Token
 		if isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 			if tokenValue == "constant":
 				parserState.NewToken =    ConstantKeyword(fromExistingToken=token)
 				parserState.PushState =   ParameterListInterfaceConstantBlock.stateConstantKeyword
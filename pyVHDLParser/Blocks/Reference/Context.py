@@ -31,14 +31,15 @@ from pyTooling.Decorators             import export
 
 from pyVHDLParser.Token               import CommentToken, SpaceToken, LinebreakToken, MultiLineCommentToken, IndentationToken, SingleLineCommentToken, ExtendedIdentifier
 from pyVHDLParser.Token.Keywords      import WordToken, BoundaryToken, IdentifierToken, IsKeyword, UseKeyword, EndKeyword, ContextKeyword, LibraryKeyword
-from pyVHDLParser.Blocks              import Block, CommentBlock, BlockParserException, TokenToBlockParser
+from pyVHDLParser.Blocks              import Block, CommentBlock, BlockParserException, TokenToBlockParser, KeywordTransitions
 from pyVHDLParser.Blocks.Common       import LinebreakBlock, IndentationBlock, WhitespaceBlock
 from pyVHDLParser.Blocks.Generic      import EndBlock as EndBlockBase
 
 
 @export
 class NameBlock(Block):
-	KEYWORDS = None
+	KEYWORDS =            None
+	KEYWORD_TRANSITIONS = None
 
 	@classmethod
 	def __cls_init__(cls):
@@ -49,6 +50,7 @@ class NameBlock(Block):
 			UseKeyword:     Use.StartBlock.stateUseKeyword,
 			LibraryKeyword: Library.StartBlock.stateLibraryKeyword
 		}
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 	@classmethod
 	def stateContextKeyword(cls, parserState: TokenToBlockParser):
 		token = parserState.Token
@@ -160,14 +162,15 @@ class NameBlock(Block):
 			parserState.TokenMarker =   None
 			return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
-			for keyword in cls.KEYWORDS:
-				if tokenValue == keyword.__KEYWORD__:
-					newToken =                keyword(fromExistingToken=token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.Key
+			keywordTransition = cls.KEYWORD_TRANSITIONS.get(tokenValue)
+			if keywordTransition is not None:
+				keyword, transition = keywordTransition
+				newToken =                keyword(fromExistingToken=token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if tokenValue == "end":
 				parserState.NewToken =    EndKeyword(fromExistingToken=token)
@@ -206,7 +206,7 @@ class NameBlock(Block):
 			parserState.Counter =     1
 			return
 		elif isinstance(token, WordToken):
-			keyword = token.Value.lower()
+			keyword = token.Key
 			if keyword == "return":
 				parserState.NewToken =    ReturnKeyword(fromExistingToken=token)
 				parserState.NewBlock =    cls(parserState.LastBlock, parserState.TokenMarker, endToken=parserState.NewToken.PreviousToken)
@@ -33,7 +33,7 @@ from pyVHDLParser.Token             import LinebreakToken, WordToken, SpaceToken
 from pyVHDLParser.Token.Keywords    import PackageKeyword, IsKeyword, EndKeyword, GenericKeyword, BodyKeyword, UseKeyword, VariableKeyword, SignalKeyword
 from pyVHDLParser.Token.Keywords    import BoundaryToken, IdentifierToken
 from pyVHDLParser.Token.Keywords    import ConstantKeyword, SharedKeyword, ProcedureKeyword, FunctionKeyword, PureKeyword, ImpureKeyword
-from pyVHDLParser.Blocks            import BlockParserException, Block, CommentBlock, TokenToBlockParser
+from pyVHDLParser.Blocks            import BlockParserException, Block, CommentBlock, TokenToBlockParser, KeywordTransitions
 from pyVHDLParser.Blocks.Common     import LinebreakBlock, IndentationBlock, WhitespaceBlock
 from pyVHDLParser.Blocks.Generic    import SequentialDeclarativeRegion
 from pyVHDLParser.Blocks.Generic1   import EndBlock as EndBlockBase
@@ -61,6 +61,7 @@ class DeclarativeRegion(SequentialDeclarativeRegion):
 			# Keyword         Transition
 			GenericKeyword:  GenericList.OpenBlock.stateGenericKeyword
 		})
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 @export
 class NameBlock(Block):
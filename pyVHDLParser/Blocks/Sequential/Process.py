@@ -32,7 +32,7 @@ from pyTooling.Decorators                   import export
 from pyVHDLParser.Token                     import CharacterToken, SpaceToken, LinebreakToken, CommentToken, IndentationToken, MultiLineCommentToken, SingleLineCommentToken
 from pyVHDLParser.Token.Keywords            import WordToken, BoundaryToken, IsKeyword, UseKeyword, ConstantKeyword, ImpureKeyword, PureKeyword
 from pyVHDLParser.Token.Keywords            import VariableKeyword, ProcessKeyword, BeginKeyword, FunctionKeyword, ProcedureKeyword
-from pyVHDLParser.Blocks                    import Block, CommentBlock, BlockParserException, TokenToBlockParser
+from pyVHDLParser.Blocks                    import Block, CommentBlock, BlockParserException, TokenToBlockParser, KeywordTransitions
 from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock, WhitespaceBlock
 # from pyVHDLParser.Blocks.ControlStructure   import If, Case, ForLoop, WhileLoop
 from pyVHDLParser.Blocks.Generic            import SequentialBeginBlock, SequentialDeclarativeRegion
@@ -113,18 +113,19 @@ class OpenBlock(Block):
 			parserState.TokenMarker =   None
 			return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 
 			parserState.NewBlock =      cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken)
 
-			for keyword in OpenBlock2.KEYWORDS:
-				if tokenValue == keyword.__KEYWORD__:
-					newToken = keyword(fromExistingToken=token)
-					parserState.NextState =  DeclarativeRegion.stateDeclarativeRegion
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keywordTransition = OpenBlock2.KEYWORD_TRANSITIONS.get(tokenValue)
+			if keywordTransition is not None:
+				keyword, transition = keywordTransition
+				newToken = keyword(fromExistingToken=token)
+				parserState.NextState =  DeclarativeRegion.stateDeclarativeRegion
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if tokenValue == "begin":
 				parserState.NewToken =    BeginKeyword(fromExistingToken=token)
@@ -138,7 +139,8 @@ class OpenBlock(Block):
 # TODO: Find a better name
 @export
 class OpenBlock2(Block):
-	KEYWORDS = None
+	KEYWORDS =            None
+	KEYWORD_TRANSITIONS = None
 
 	# TODO: Merge with OpenBlock.KEYWORDS ??
 	@classmethod
@@ -159,21 +161,23 @@ class OpenBlock2(Block):
 			ImpureKeyword:    Function.NameBlock.stateImpureKeyword,
 			PureKeyword:      Function.NameBlock.statePureKeyword
 		}
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 	@classmethod
 	def stateAfterSensitivityList(cls, parserState: TokenToBlockParser):
 		token = parserState.Token
 		if isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 
-			for keyword in OpenBlock2.KEYWORDS:
-				if tokenValue == keyword.__KEYWORD__:
-					newToken =                keyword(fromExistingToken=token)
-					parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
-					parserState.PushState =   OpenBlock2.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keywordTransition = OpenBlock2.KEYWORD_TRANSITIONS.get(tokenValue)
+			if keywordTransition is not None:
+				keyword, transition = keywordTransition
+				newToken =                keyword(fromExistingToken=token)
+				parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if tokenValue == "begin":
 				parserState.NewToken =    BeginKeyword(fromExistingToken=token)
@@ -205,16 +209,17 @@ class OpenBlock2(Block):
 	def stateWhitespace1(cls, parserState: TokenToBlockParser):
 		token = parserState.Token
 		if isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if tokenValue == keyword.__KEYWORD__:
-					newToken =                keyword(fromExistingToken=token)
-					parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.Key
+
+			keywordTransition = cls.KEYWORD_TRANSITIONS.get(tokenValue)
+			if keywordTransition is not None:
+				keyword, transition = keywordTransition
+				newToken =                keyword(fromExistingToken=token)
+				parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if tokenValue == "begin":
 				parserState.NewToken =    BeginKeyword(fromExistingToken=token)
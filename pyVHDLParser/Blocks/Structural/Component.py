@@ -32,14 +32,15 @@ from pyTooling.Decorators                   import export
 from pyVHDLParser.Token                     import LinebreakToken, WordToken, SpaceToken, CommentToken, MultiLineCommentToken, IndentationToken, SingleLineCommentToken, ExtendedIdentifier
 from pyVHDLParser.Token.Keywords            import ComponentKeyword, IsKeyword, EndKeyword, GenericKeyword, PortKeyword, UseKeyword, BeginKeyword
 from pyVHDLParser.Token.Keywords            import BoundaryToken, IdentifierToken
-from pyVHDLParser.Blocks                    import BlockParserException, Block, CommentBlock, TokenToBlockParser
+from pyVHDLParser.Blocks                    import BlockParserException, Block, CommentBlock, TokenToBlockParser, KeywordTransitions
 from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock, WhitespaceBlock
 from pyVHDLParser.Blocks.Generic            import EndBlock as EndBlockBase
 
 
 @export
 class NameBlock(Block):
-	KEYWORDS = None
+	KEYWORDS =            None
+	KEYWORD_TRANSITIONS = None
 
 	@classmethod
 	def __cls_init__(cls):
@@ -50,6 +51,7 @@ class NameBlock(Block):
 			GenericKeyword:   GenericList.OpenBlock.stateGenericKeyword,
 			PortKeyword:      PortList.OpenBlock.statePortKeyword
 		}
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 	@classmethod
 	def stateComponentKeyword(cls, parserState: TokenToBlockParser):
@@ -163,7 +165,7 @@ class NameBlock(Block):
 			parserState.TokenMarker =   None
 			return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
+			tokenValue = token.Key
 
 			for keyword in cls.__KEYWORDS__:
 				if tokenValue == keyword.__KEYWORD__:
@@ -32,14 +32,15 @@ from pyTooling.Decorators                   import export
 from pyVHDLParser.Token                     import LinebreakToken, WordToken, SpaceToken, CommentToken, MultiLineCommentToken, IndentationToken, SingleLineCommentToken, ExtendedIdentifier
 from pyVHDLParser.Token.Keywords            import ConfigurationKeyword, IsKeyword, EndKeyword, GenericKeyword, PortKeyword, UseKeyword, BeginKeyword
 from pyVHDLParser.Token.Keywords            import BoundaryToken, IdentifierToken
-from pyVHDLParser.Blocks                    import BlockParserException, Block, CommentBlock, TokenToBlockParser
+from pyVHDLParser.Blocks                    import BlockParserException, Block, CommentBlock, TokenToBlockParser, KeywordTransitions
 from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock, WhitespaceBlock
 from pyVHDLParser.Blocks.Generic            import ConcurrentBeginBlock, EndBlock as EndBlockBase
 
 
 @export
 class NameBlock(Block):
-	KEYWORDS = None
+	KEYWORDS =            None
+	KEYWORD_TRANSITIONS = None
 
 	@classmethod
 	def __cls_init__(cls):
@@ -52,6 +53,7 @@ class NameBlock(Block):
 			GenericKeyword:   GenericList.OpenBlock.stateGenericKeyword,
 			PortKeyword:      PortList.OpenBlock.statePortKeyword
 		}
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 	@classmethod
 	def stateConfigurationKeyword(cls, parserState: TokenToBlockParser):
@@ -165,15 +167,16 @@ class NameBlock(Block):
 			parserState.TokenMarker =   None
 			return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if tokenValue == keyword.KEYWORDS:
-					newToken =                keyword(fromExistingToken=token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.Key
+
+			keywordTransition = cls.KEYWORD_TRANSITIONS.get(tokenValue)
+			if keywordTransition is not None:
+				keyword, transition = keywordTransition
+				newToken =                keyword(fromExistingToken=token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if tokenValue == "begin":
 				parserState.NewToken =  BeginKeyword(fromExistingToken=token)
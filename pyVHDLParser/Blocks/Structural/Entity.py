@@ -32,7 +32,7 @@ from pyTooling.Decorators         import export
 from pyVHDLParser.Token           import LinebreakToken, WordToken, SpaceToken, CommentToken, MultiLineCommentToken, IndentationToken, SingleLineCommentToken, ExtendedIdentifier
 from pyVHDLParser.Token.Keywords  import EntityKeyword, IsKeyword, GenericKeyword, PortKeyword
 from pyVHDLParser.Token.Keywords  import BoundaryToken, IdentifierToken
-from pyVHDLParser.Blocks          import BlockParserException, Block, CommentBlock, TokenToBlockParser
+from pyVHDLParser.Blocks          import BlockParserException, Block, CommentBlock, TokenToBlockParser, KeywordTransitions
 from pyVHDLParser.Blocks.Common   import LinebreakBlock, WhitespaceBlock
 from pyVHDLParser.Blocks.Generic  import ConcurrentBeginBlock, ConcurrentDeclarativeRegion
 from pyVHDLParser.Blocks.Generic1 import EndBlock as EndBlockBase
@@ -67,6 +67,7 @@ class DeclarativeRegion(ConcurrentDeclarativeRegion):
 			GenericKeyword:   GenericListOpenBlock.stateGenericKeyword,
 			PortKeyword:      PortListOpenBlock.statePortKeyword
 		})
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 
 @export
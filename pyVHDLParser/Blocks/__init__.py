@@ -28,7 +28,7 @@
 # ==================================================================================================================== #
 #
 from types                          import FunctionType
-from typing import List, Callable, Iterator, Generator, Tuple, Any
+from typing import List, Callable, Iterator, Generator, Tuple, Any, Dict, Type, Optional, Union
 
 from pyTooling.Decorators           import export
 from pyTooling.MetaClasses import ExtendedType
@@ -36,9 +36,10 @@ from pyTooling.TerminalUI           import LineTerminal
 
 from pyVHDLParser                   import StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
 from pyVHDLParser.Base              import ParserException
+from pyVHDLParser.Profiling         import StateProfiler
 from pyVHDLParser.Token             import CharacterToken, Token, SpaceToken, IndentationToken, LinebreakToken, CommentToken, TokenIterator
-from pyVHDLParser.Token             import WordToken, EndOfDocumentToken, StartOfDocumentToken
-from pyVHDLParser.Token.Keywords    import LibraryKeyword, UseKeyword, ContextKeyword, EntityKeyword, ArchitectureKeyword, PackageKeyword
+from pyVHDLParser.Token             import WordToken, EndOfDocumentToken, StartOfDocumentToken, SingleLineCommentToken
+from pyVHDLParser.Token.Keywords    import KeywordToken, LibraryKeyword, UseKeyword, ContextKeyword, EntityKeyword, ArchitectureKeyword, PackageKeyword
 
 
 @export
@@ -57,6 +58,72 @@ class BlockParserException(ParserException):
 		return self._token
 
 
+@export
+def KeywordTransitions(keywords: Dict[Type[KeywordToken], Callable[['TokenToBlockParser'], None]]) -> Dict[str, Tuple[Type[KeywordToken], Callable[['TokenToBlockParser'], None]]]:
+	"""
+	Translate a ``KEYWORDS`` dictionary (keyword class → transition) into a lookup table by keyword string.
+
+	A (lower case) word token value can be looked up in O(1) instead of comparing it with each keyword's ``__KEYWORD__``.
+
+	:param keywords: Dictionary of keyword classes and their transitions.
+	:returns:        Dictionary of keyword strings and pairs of keyword class and transition.
+	"""
+	return {keyword.__KEYWORD__: (keyword, transition) for keyword, transition in keywords.items()}
+
+
+@export
+class BlockParserCheckpoint(metaclass=ExtendedType, useSlots=True):
+	"""State of a :class:`TokenToBlockParser` at a block boundary, from which parsing can be resumed."""
+
+	LastBlock:  'Block'                                                    #: Last block emitted before the checkpoint.
+	NextState:  Callable[['TokenToBlockParser'], None]                     #: State, which processes the next token.
+	Counter:    int                                                        #: Counter of the current state.
+	Stack:      Tuple[Tuple[Callable[['TokenToBlockParser'], None], int]]  #: Pushed states and their counters.
+
+	def __init__(self, lastBlock: 'Block', nextState: Callable[['TokenToBlockParser'], None], counter: int, stack: Tuple[Tuple[Callable[['TokenToBlockParser'], None], int]]):
+		self.LastBlock = lastBlock
+		self.NextState = nextState
+		self.Counter =   counter
+		self.Stack =     stack
+
+	def IsEquivalent(self, other: 'BlockParserCheckpoint') -> bool:
+		"""
+		Returns true, if both checkpoints have the same parser state and last block type.
+
+		A parser resumed from either checkpoint creates the same blocks for the same tokens.
+		"""
+		return (
+			(self.NextState == other.NextState) and
+			(self.Counter == other.Counter) and
+			(self.Stack == other.Stack) and
+			(self.LastBlock.__class__ is other.LastBlock.__class__)
+		)
+
+	def GetResumeOffset(self, content: Union[str, bytes]) -> Optional[int]:
+		"""
+		Returns the offset of the line start following :attr:`LastBlock`, if tokenizing can resume there, otherwise ``None``.
+
+		Tokenizing can resume only after a linebreak, whose end position is the linebreak character. A linebreak following a
+		fused or fuseable character reuses this character's start position. An empty line block replaces a pending linebreak
+		block only when the next block is emitted. Resuming at the preceding linebreak block reproduces this, even if the
+		next token is erroneous.
+
+		:param content: Source code, which was tokenized.
+		:returns:       Offset (0-based) of the first character, which is tokenized by a resumed tokenizer.
+		"""
+		from pyVHDLParser.Blocks.Common import EmptyLineBlock
+
+		endToken = self.LastBlock.EndToken
+		if not isinstance(endToken, (LinebreakToken, SingleLineCommentToken)) or isinstance(self.LastBlock, EmptyLineBlock):
+			return None
+
+		offset = endToken.End.Absolute
+		if content[offset - 1:offset] not in ("\n", b"\n"):
+			return None
+
+		return offset
+
+
 @export
 class TokenToBlockParser(metaclass=ExtendedType, useSlots=True):
 	"""Represents the current state of a token-to-block parser."""
@@ -64,6 +131,9 @@ class TokenToBlockParser(metaclass=ExtendedType, useSlots=True):
 	_iterator:     Iterator[Token]
 	_stack:        List[Tuple[Callable[['TokenToBlockParser'], None], int]]
 	_tokenMarker:  Token
+	_debug:        bool
+	_profiler:     Optional[StateProfiler]
+	_replaceTokens: bool
 
 	Token:         Token
 	NextState:     Callable[['TokenToBlockParser'], None]
@@ -73,12 +143,44 @@ class TokenToBlockParser(metaclass=ExtendedType, useSlots=True):
 	LastBlock:     'Block'
 	Counter:       int
 
-	def __init__(self, tokenGenerator: Iterator[Token]):
-		"""Initializes the parser state."""
+	def __init__(self, tokenGenerator: Iterator[Token], debug: bool = False, checkpoint: BlockParserCheckpoint = None, profiler: StateProfiler = None, replaceTokens: bool = False):
+		"""
+		Initializes the parser state.
+
+		If a checkpoint is given, parsing resumes at this checkpoint. Then, the stream of tokens starts with the token
+		following the checkpoint's last block.
+
+		By default, a simple token is reclassified in place, when a state converts it into a specific token. If
+		``replaceTokens`` is true, the simple token is kept unchanged and a new specific token replaces it in the token
+		chain. Use this for code, which relies on the changing identity, e.g. code comparing the tokenizer's output with
+		the token chain after block parsing.
+
+		:param tokenGenerator: Stream of tokens.
+		:param debug:          If true, trace state changes and token markers as debug messages.
+		:param checkpoint:     Optional checkpoint created by :meth:`GetCheckpoint`.
+		:param profiler:       Optional profiler, which counts and times each executed state.
+		:param replaceTokens:  If true, create new token objects as replacements instead of reclassifying tokens in place.
+		"""
+
+		InitializeBlocks()
 
 		self._iterator =    iter(tokenGenerator)
 		self._stack =       []
 		self._tokenMarker = None
+		self._debug =       debug
+		self._profiler =    profiler
+		self._replaceTokens = replaceTokens
+
+		if checkpoint is not None:
+			self._stack.extend(checkpoint.Stack)
+
+			self.Token =      checkpoint.LastBlock.EndToken
+			self.NextState =  checkpoint.NextState
+			self.NewToken =   None
+			self.NewBlock =   None
+			self.LastBlock =  checkpoint.LastBlock
+			self.Counter =    checkpoint.Counter
+			return
 
 		startToken =        next(self._iterator)
 
@@ -105,14 +207,16 @@ class TokenToBlockParser(metaclass=ExtendedType, useSlots=True):
 			self.NextState,
 			self.Counter
 		))
-		LineTerminal().WriteDebug("  pushed: " + str(self.NextState))
+		if self._debug:
+			LineTerminal().WriteDebug("  pushed: " + str(self.NextState))
 		self.NextState =    value
 		self._tokenMarker =  None
 
 	@property
 	def TokenMarker(self) -> Token:
 		if (self.NewToken is not None) and (self._tokenMarker is self.Token):
-			LineTerminal().WriteDebug("  {DARK_GREEN}@TokenMarker: {0!s} => {GREEN}{1!s}{NOCOLOR}".format(self._tokenMarker, self.NewToken, **LineTerminal.Foreground))
+			if self._debug:
+				LineTerminal().WriteDebug("  {DARK_GREEN}@TokenMarker: {0!s} => {GREEN}{1!s}{NOCOLOR}".format(self._tokenMarker, self.NewToken, **LineTerminal.Foreground))
 			self._tokenMarker = self.NewToken
 		return self._tokenMarker
 
@@ -142,10 +246,61 @@ class TokenToBlockParser(metaclass=ExtendedType, useSlots=True):
 			newBlock=self.NewBlock,
 		)
 
+	def GetCheckpoint(self) -> Optional[BlockParserCheckpoint]:
+		"""
+		Returns a checkpoint, if the parser is at a block boundary, otherwise ``None``.
+
+		A parser is at a block boundary, if the last emitted block ends at the token preceding the current token, and no
+		token replacement or token marker is pending. Call this method after a block was received from the parser.
+
+		:returns: A checkpoint to resume parsing with the token following :attr:`LastBlock`.
+		"""
+		if (
+			(self.NewBlock is None) and (self.NewToken is None) and (self.LastBlock is not None) and
+			(self._tokenMarker is self.Token) and (self.Token.PreviousToken is self.LastBlock.EndToken)
+		):
+			return BlockParserCheckpoint(self.LastBlock, self.NextState, self.Counter, tuple(self._stack))
+
+		return None
+
+	@property
+	def IsAtTopLevel(self) -> bool:
+		"""
+		Returns true, if the parser is between two design units, library or use clauses, like at the start of a document.
+
+		Parsing a document, which starts with the current token, would then continue with the same state.
+		"""
+		return (
+			(self.NextState == StartOfDocumentBlock.stateDocument) and (self.Counter == 0) and (len(self._stack) == 0) and
+			(self.NewToken is None)
+		)
+
+	def _ReplaceToken(self, token: Token, simpleClass: type, simpleValue: Any) -> None:
+		"""Undo the in-place reclassification of the current token and replace it by a new specific token in the chain."""
+		specificClass =   token.__class__
+		token.__class__ = simpleClass
+		token.Value =     simpleValue
+
+		newToken = object.__new__(specificClass)
+		newToken.__init__(fromExistingToken=token)
+
+		if self._tokenMarker is token:
+			self._tokenMarker = newToken
+		block = self.NewBlock
+		while block is not None:
+			if block.StartToken is token:
+				block.StartToken = newToken
+			if block.EndToken is token:
+				block.EndToken = newToken
+			block = block.NextBlock
+
+		self.NewToken = newToken
+
 	def Pop(self, n: int = 1, tokenMarker: Token = None) -> None:
 		for i in range(n):
 			top = self._stack.pop()
-			LineTerminal().WriteDebug("popped: " + str(top[0]))
+			if self._debug:
+				LineTerminal().WriteDebug("popped: " + str(top[0]))
 		self.NextState, self.Counter = top
 		self._tokenMarker = tokenMarker
 
@@ -153,6 +308,8 @@ class TokenToBlockParser(metaclass=ExtendedType, useSlots=True):
 		from pyVHDLParser.Token             import EndOfDocumentToken
 		from pyVHDLParser.Blocks.Common     import LinebreakBlock, EmptyLineBlock
 
+		profiler =      self._profiler
+		replaceTokens = self._replaceTokens
 		for token in self._iterator:
 			# set parserState.Token to current token
 			self.Token = token
@@ -160,17 +317,20 @@ class TokenToBlockParser(metaclass=ExtendedType, useSlots=True):
 			# overwrite an existing token and connect the next token with the new one
 			if self.NewToken is not None:
 				# print("{MAGENTA}NewToken: {token}{NOCOLOR}".format(token=self.NewToken, **Console.Foreground))
-				# update topmost TokenMarker
-				if self._tokenMarker is token.PreviousToken:
-					# XXX: LineTerminal().WriteDebug("  update token marker: {0!s} -> {1!s}".format(self._tokenMarker, self.NewToken))
-					self._tokenMarker = self.NewToken
-
-				token.PreviousToken = self.NewToken
+				# a token reclassified in place is still linked (see replaceTokens)
+				if self.NewToken is not token.PreviousToken:
+					# update topmost TokenMarker
+					if self._tokenMarker is token.PreviousToken:
+						# XXX: LineTerminal().WriteDebug("  update token marker: {0!s} -> {1!s}".format(self._tokenMarker, self.NewToken))
+						self._tokenMarker = self.NewToken
+
+					token.PreviousToken = self.NewToken
 				self.NewToken =       None
 
 			# an empty marker means: fill on next yield run
 			if self._tokenMarker is None:
-				LineTerminal().WriteDebug("  new token marker: None -> {0!s}".format(token))
+				if self._debug:
+					LineTerminal().WriteDebug("  new token marker: None -> {0!s}".format(token))
 				self._tokenMarker = token
 
 			# a new block is assembled
@@ -187,7 +347,17 @@ class TokenToBlockParser(metaclass=ExtendedType, useSlots=True):
 			# if self.debug: print("{MAGENTA}------ iteration end ------{NOCOLOR}".format(**Console.Foreground))
 			# XXX: LineTerminal().WriteDebug("    {DARK_GRAY}state={state!s: <50}  token={token!s: <40}{NOCOLOR}   ".format(state=self, token=token, **LineTerminal.Foreground))
 			# execute a state
-			self.NextState(self)
+			if replaceTokens:
+				tokenClass = token.__class__
+				tokenValue = getattr(token, "Value", None)
+
+			if profiler is None:
+				self.NextState(self)
+			else:
+				profiler.Call(self.NextState, self)
+
+			if replaceTokens and (self.NewToken is token) and (token.__class__ is not tokenClass):
+				self._ReplaceToken(token, tokenClass, tokenValue)
 
 		else:
 			if isinstance(self.Token, EndOfDocumentToken) and isinstance(self.NewBlock, EndOfDocumentBlock):
@@ -213,8 +383,12 @@ class MetaBlock(ExtendedType):
 		# """Register all state*** methods in a list called `__STATES__`."""
 		states = []
 		for memberName, memberObject in classMembers.items():
-			if isinstance(memberObject, FunctionType) and (memberName[:5] == "state"):
-				states.append(memberObject)
+			if memberName[:5] == "state":
+				# states are usually classmethods
+				if isinstance(memberObject, classmethod):
+					memberObject = memberObject.__func__
+				if isinstance(memberObject, FunctionType):
+					states.append(memberObject)
 
 		block = super().__new__(cls, className, baseClasses, classMembers, useSlots=True)
 		block.__STATES__ = states
@@ -224,6 +398,34 @@ class MetaBlock(ExtendedType):
 		return block
 
 
+_initializedBlocks = 0   #: Number of classes in :attr:`MetaBlock.BLOCKS`, whose late initialization was executed.
+
+
+@export
+def InitializeBlocks() -> None:
+	"""
+	Run the late initialization (``__cls_init__``) of all block classes, which weren't initialized yet.
+
+	Block classes refer to states of other block classes in their ``KEYWORDS`` tables, thus these tables are filled after
+	all block classes are defined. Each table is built exactly once per process. Block classes defined later, e.g. by
+	importing a block module after the first call, are initialized by the next call.
+
+	:class:`TokenToBlockParser` calls this function when it's created, thus an explicit call is only needed to build all
+	tables ahead of time, e.g. in a worker process initializer.
+	"""
+	global _initializedBlocks
+
+	blocks = MetaBlock.BLOCKS
+	# __cls_init__ imports further block modules, which append to MetaBlock.BLOCKS while iterating.
+	while _initializedBlocks < len(blocks):
+		block = blocks[_initializedBlocks]
+		_initializedBlocks += 1
+
+		clsInit = getattr(block, "__cls_init__", None)
+		if clsInit is not None:
+			clsInit()
+
+
 @export
 class BlockIterator:
 	_startBlock:         'Block'
@@ -474,7 +676,8 @@ class EndOfBlock(Block):
 class StartOfDocumentBlock(StartOfBlock, StartOfDocument):
 	"""First block in a sequence of double-linked blocks."""
 
-	KEYWORDS = None
+	KEYWORDS =            None
+	KEYWORD_TRANSITIONS = None
 
 	@classmethod
 	def __cls_init__(cls):
@@ -492,6 +695,7 @@ class StartOfDocumentBlock(StartOfBlock, StartOfDocument):
 			ArchitectureKeyword:  Architecture.NameBlock.stateArchitectureKeyword,
 			PackageKeyword:       Package.NameBlock.statePackageKeyword
 		}
+		cls.KEYWORD_TRANSITIONS = KeywordTransitions(cls.KEYWORDS)
 
 	@classmethod
 	def stateDocument(cls, parserState: TokenToBlockParser):
@@ -509,15 +713,16 @@ class StartOfDocumentBlock(StartOfBlock, StartOfDocument):
 			parserState.TokenMarker = None
 			return
 		elif isinstance(token, WordToken):
-			tokenValue = token.Value.lower()
-
-			for keyword in cls.KEYWORDS:
-				if tokenValue == keyword.__KEYWORD__:
-					newToken =                keyword(fromExistingToken=token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			tokenValue = token.Key
+
+			keywordTransition = cls.KEYWORD_TRANSITIONS.get(tokenValue)
+			if keywordTransition is not None:
+				keyword, transition = keywordTransition
+				newToken =                keyword(fromExistingToken=token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 		elif isinstance(token, EndOfDocumentToken):
 			parserState.NewBlock = EndOfDocumentBlock(parserState.LastBlock, token)
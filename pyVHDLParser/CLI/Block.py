@@ -65,7 +65,7 @@ class BlockStreamHandlers:
 			content = fileHandle.read()
 
 		tokenStream = Tokenizer.GetVHDLTokenizer(content)
-		blockStream = TokenToBlockParser(tokenStream)()
+		blockStream = TokenToBlockParser(tokenStream, debug=self.Debug)()
 
 		blockIterator = iter(blockStream)
 		firstBlock = next(blockIterator)
@@ -137,7 +137,7 @@ class BlockStreamHandlers:
 			content = fileHandle.read()
 
 		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
-		vhdlBlockStream = TokenToBlockParser(vhdlTokenStream)()
+		vhdlBlockStream = TokenToBlockParser(vhdlTokenStream, debug=self.Debug)()
 
 		try:
 			blockIterator = iter(vhdlBlockStream)
@@ -62,8 +62,8 @@ class GroupStreamHandlers:
 			content = fileHandle.read()
 
 		tokenStream = Tokenizer.GetVHDLTokenizer(content)
-		blockStream = TokenToBlockParser(tokenStream)()
-		groupStream = BlockToGroupParser(blockStream)()
+		blockStream = TokenToBlockParser(tokenStream, debug=self.Debug)()
+		groupStream = BlockToGroupParser(blockStream, debug=self.Debug)()
 
 		groupIterator = iter(groupStream)
 		firstGroup = next(groupIterator)
@@ -91,17 +91,17 @@ class GroupStreamHandlers:
 
 			self.WriteVerbose("Reading and buffering blocks...")
 			try:
-				blockStream = [block for block in TokenToBlockParser(tokenStream)()]
+				blockStream = [block for block in TokenToBlockParser(tokenStream, debug=self.Debug)()]
 			except ParserException as ex:
 				print("{RED}ERROR: {0!s}{NOCOLOR}".format(ex, **self.Foreground))
 			except NotImplementedError as ex:
 				print("{RED}NotImplementedError: {0!s}{NOCOLOR}".format(ex, **self.Foreground))
 		else:
 			tokenStream = Tokenizer.GetVHDLTokenizer(content)
-			blockStream = TokenToBlockParser(tokenStream)()
+			blockStream = TokenToBlockParser(tokenStream, debug=self.Debug)()
 
 		self.WriteVerbose("Transforming blocks to groups...")
-		groupStream = BlockToGroupParser(blockStream)()
+		groupStream = BlockToGroupParser(blockStream, debug=self.Debug)()
 
 		try:
 			for group in groupStream:
@@ -56,10 +56,7 @@ class TokenStreamHandlers:
 		if not file.exists():
 			print(f"File '{file}' does not exist.")
 
-		with file.open('r') as fileHandle:
-			content = fileHandle.read()
-
-		tokenStream =   Tokenizer.GetVHDLTokenizer(content)
+		tokenStream =   Tokenizer.GetVHDLTokenizer(Tokenizer.ReadChunks(file))
 		tokenIterator = iter(tokenStream)
 		firstToken =    next(tokenIterator)
 
@@ -115,10 +112,7 @@ class TokenStreamHandlers:
 		if not file.exists():
 			print("File '{0!s}' does not exist.".format(file))
 
-		with file.open('r') as fileHandle:
-			content = fileHandle.read()
-
-		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
+		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(Tokenizer.ReadChunks(file))
 
 		try:
 			tokenIterator = iter(vhdlTokenStream)
@@ -38,7 +38,7 @@ from pyTooling.TerminalUI             import LineTerminal, Severity
 from pyAttributes.ArgParseAttributes  import ArgParseMixin, DefaultAttribute, CommandAttribute, ArgumentAttribute, CommonSwitchArgumentAttribute
 
 from pyVHDLParser                     import __author__, __license__, __version__, __copyright__
-from pyVHDLParser.Blocks              import MetaBlock
+from pyVHDLParser.Blocks              import InitializeBlocks
 
 from pyVHDLParser.CLI.Token           import TokenStreamHandlers
 from pyVHDLParser.CLI.Block           import BlockStreamHandlers
@@ -74,11 +74,7 @@ class Application(LineTerminal, ArgParseMixin, TokenStreamHandlers, BlockStreamH
 
 		# Late-initialize Block classes
 		# --------------------------------------------------------------------------
-		for block in MetaBlock.BLOCKS:
-			try:
-				block.__cls_init__()
-			except AttributeError:
-				pass
+		InitializeBlocks()
 
 		# Call the constructor of the ArgParseMixin
 		# --------------------------------------------------------------------------
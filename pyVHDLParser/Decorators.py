@@ -41,7 +41,7 @@ class ExecutionTimer:
 	def AddExecutionTime(self, function, executionTime):
 		try:
 			self._times[function].append(executionTime)
-		except ValueError:
+		except KeyError:
 			self._times[function] = [ executionTime ]
 
 
@@ -54,7 +54,7 @@ class ExecutionCounter:
 	def IncrementCallCounter(self, function):
 		try:
 			self._counts[function] += 1
-		except ValueError:
+		except KeyError:
 			self._counts[function] = 1
 
 
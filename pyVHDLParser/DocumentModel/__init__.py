@@ -28,7 +28,7 @@
 # ==================================================================================================================== #
 #
 from pathlib                              import Path
-from typing                               import List, Union
+from typing                               import Dict, Generator, Iterator, List, Type, Union
 
 from pyTooling.Decorators                 import export
 from pyVHDLModel                          import Document as DocumentModel
@@ -52,6 +52,8 @@ class DOMParserException(ParserException):
 
 @export
 class Document(DocumentModel):
+	GROUP_TO_MODEL: Dict[Type[Group], Type] = None  #: Lookup of model classes for top-level groups. Filled on first use due to import cycles.
+
 	__libraries:  List[LibraryClause]
 	__uses:       List[PackageReference]
 
@@ -68,29 +70,35 @@ class Document(DocumentModel):
 		self.__libraries =  []
 		self.__uses  =      []
 
-	def Parse(self, content=None):  # FIXME: parameter type
+	def Parse(self, content=None, streaming: bool = False):  # FIXME: parameter type
+		"""
+		Parse VHDL source code into this document.
+
+		In streaming mode, each top-level group is translated to a model, as soon as it's complete. Afterwards, its groups,
+		blocks and tokens are detached (see :meth:`~pyVHDLParser.Groups.BlockToGroupParser.GetTopLevelGroups`), so large
+		documents are parsed with bounded memory.
+
+		:param content:   Source code. If ``None``, the document's file is read.
+		:param streaming: If true, translate and release top-level groups one by one.
+		"""
 		if content is None:
 			if not self._path.exists():
 				raise DOMParserException("File '{0!s}' does not exist.".format(self._path))\
 					from FileNotFoundError(str(self._path))
 
-			with self._path.open('r') as fileHandle:
-				content = fileHandle.read()
+			content = Tokenizer.ReadChunks(self._path)
 
 		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
 		vhdlBlockStream = TokenToBlockParser(vhdlTokenStream)()
-		vhdlGroupStream = BlockToGroupParser(vhdlBlockStream)()
-		try:
-			groups =          [group for group in vhdlGroupStream]
-		except BlockParserException as ex:
-			raise DOMParserException("Error while parsing and indexing the source code.", ex.Group) from ex
-		except GroupParserException as ex:
-			raise DOMParserException("Unexpected ParserException.", ex.Block) from ex
-		except ParserException as ex:
-			raise DOMParserException("Unexpected ParserException.", ex.Position) from ex
-		except Exception as ex:
-			raise DOMParserException("Unexpected exception.", None) from ex
+		vhdlGroupParser = BlockToGroupParser(vhdlBlockStream)
+
+		if streaming:
+			for group in self._TranslateExceptions(vhdlGroupParser.GetTopLevelGroups()):
+				if not isinstance(group, EndOfDocumentGroup):
+					self.ParseGroup(self, group)
+			return
 
+		groups =          [group for group in self._TranslateExceptions(vhdlGroupParser())]
 		firstGroup =      groups[0]
 		lastGroup =       groups[-1]
 
@@ -102,34 +110,51 @@ class Document(DocumentModel):
 		# run recursively (node, group)
 		self.stateParse(self, firstGroup)
 
+	@staticmethod
+	def _TranslateExceptions(groupStream: Iterator[Group]) -> Generator[Group, None, None]:
+		try:
+			yield from groupStream
+		except BlockParserException as ex:
+			raise DOMParserException("Error while parsing and indexing the source code.", ex.Group) from ex
+		except GroupParserException as ex:
+			raise DOMParserException("Unexpected ParserException.", ex.Block) from ex
+		except ParserException as ex:
+			raise DOMParserException("Unexpected ParserException.", ex.Position) from ex
+		except Exception as ex:
+			raise DOMParserException("Unexpected exception.", None) from ex
+
 	@classmethod
 	def stateParse(cls, document, startOfDocumentGroup: Group):
-		from pyVHDLParser.DocumentModel.Reference               import LibraryClause as LibraryModel, PackageReference as UseModel
-		from pyVHDLParser.DocumentModel.DesignUnit.Context      import Context as ContextModel
-		from pyVHDLParser.DocumentModel.DesignUnit.Entity       import Entity as EntityModel
-		from pyVHDLParser.DocumentModel.DesignUnit.Architecture import Architecture as ArchitectureModel
-		from pyVHDLParser.DocumentModel.DesignUnit.Package      import Package as PackageModel
-		from pyVHDLParser.DocumentModel.DesignUnit.PackageBody  import PackageBody as PackageBodyModel
-
-		GROUP_TO_MODEL = {
-			LibraryGroup:       LibraryModel,
-			UseGroup:           UseModel,
-			ContextGroup:       ContextModel,
-			EntityGroup:        EntityModel,
-			ArchitectureGroup:  ArchitectureModel,
-			PackageGroup:       PackageModel,
-			PackageBodyGroup:   PackageBodyModel,
-			# ConfigurationModel
-		}
-
 		for subGroup in startOfDocumentGroup.GetSubGroups():
-			if isinstance(subGroup, (WhitespaceGroup)):
-				pass
-			for group in GROUP_TO_MODEL:
-				# TODO: compare to a direct dictionary match with exception fallback on whitespace
-				if isinstance(subGroup, group):
-					GROUP_TO_MODEL[group].stateParse(document, subGroup)
-					break
+			cls.ParseGroup(document, subGroup)
+
+	@classmethod
+	def ParseGroup(cls, document, group: Group) -> None:
+		"""Translate a top-level group to a model and add it to the document. Other groups are ignored."""
+		if cls.GROUP_TO_MODEL is None:
+			from pyVHDLParser.DocumentModel.Reference               import LibraryClause as LibraryModel, PackageReference as UseModel
+			from pyVHDLParser.DocumentModel.DesignUnit.Context      import Context as ContextModel
+			from pyVHDLParser.DocumentModel.DesignUnit.Entity       import Entity as EntityModel
+			from pyVHDLParser.DocumentModel.DesignUnit.Architecture import Architecture as ArchitectureModel
+			from pyVHDLParser.DocumentModel.DesignUnit.Package      import Package as PackageModel
+			from pyVHDLParser.DocumentModel.DesignUnit.PackageBody  import PackageBody as PackageBodyModel
+
+			cls.GROUP_TO_MODEL = {
+				LibraryGroup:       LibraryModel,
+				UseGroup:           UseModel,
+				ContextGroup:       ContextModel,
+				EntityGroup:        EntityModel,
+				ArchitectureGroup:  ArchitectureModel,
+				PackageGroup:       PackageModel,
+				PackageBodyGroup:   PackageBodyModel,
+				# ConfigurationModel
+			}
+
+		for groupClass, modelClass in cls.GROUP_TO_MODEL.items():
+			# TODO: compare to a direct dictionary match with exception fallback on whitespace
+			if isinstance(group, groupClass):
+				modelClass.stateParse(document, group)
+				break
 
 	def AddLibrary(self, library):  # FIXME: parameter type
 		self.__libraries.append(library)
@@ -0,0 +1,202 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+A unified parse API for the native and the ANTLR4 based front end.
+
+Both front ends return a :class:`pyVHDLModel.Document`, so consumers can switch between them without changes:
+
+* The native front end is a streaming parser. For design unit names, only tokens and blocks are created. More details
+  are extracted by :class:`pyVHDLParser.DocumentModel.Document`.
+* The ANTLR4 front end creates a full parse tree, which is translated by :class:`~pyVHDLParser.ANTLR4.Visitor.VHDLVisitor`
+  into a :class:`pyVHDLParser.LanguageModel.Document`. It requires the optional ``antlr4-python3-runtime`` package.
+
+.. code-block:: Python
+
+   from pyVHDLParser.FrontEnd import DetailLevel, FrontEnd, ParseDocument
+
+   document = ParseDocument("ip/fifo.vhdl", detail=DetailLevel.DesignUnits)
+   for entity in document.Entities.values():
+     print(entity.Identifier)
+"""
+from enum                                   import Enum
+from pathlib                                import Path
+from typing                                 import Optional, Union
+
+from pyTooling.Decorators                   import export
+from pyVHDLModel                            import Document as ModelDocument
+from pyVHDLModel.Symbol                     import EntitySymbol, PackageSymbol
+
+from pyVHDLParser.Token.Parser              import Tokenizer
+from pyVHDLParser.Blocks                    import TokenToBlockParser, InitializeBlocks
+from pyVHDLParser.LanguageModel             import Document
+from pyVHDLParser.LanguageModel.DesignUnit  import Context, Entity, Architecture, Configuration, Package, PackageBody
+from pyVHDLParser.Project                   import _SummarizeDesignUnits
+
+
+@export
+class FrontEnd(Enum):
+	"""Available front ends."""
+
+	Auto =   "auto"    #: Select the faster front end for the requested detail level, see :func:`SelectFrontEnd`.
+	Native = "native"  #: Streaming parser of this package (tokens, blocks, groups and document model).
+	ANTLR4 = "antlr4"  #: ANTLR4 generated lexer and parser.
+
+
+@export
+class DetailLevel(Enum):
+	"""Level of detail of a parsed document."""
+
+	DesignUnits = 1  #: Design units with their names and the entity names of architectures.
+	Interfaces =  2  #: Additionally, context items, generics and ports.
+	Full =        3  #: Everything a front end can translate.
+
+
+@export
+def IsAvailable(frontEnd: FrontEnd) -> bool:
+	"""Returns true, if all packages needed by a front end are installed."""
+	if frontEnd is not FrontEnd.ANTLR4:
+		return True
+
+	try:
+		import antlr4
+	except ImportError:
+		return False
+
+	return True
+
+
+@export
+def SelectFrontEnd(detail: DetailLevel = DetailLevel.DesignUnits) -> FrontEnd:
+	"""
+	Select the faster available front end for a level of detail.
+
+	Design units are found by the native front end after the block pass, which is much faster than creating a complete
+	ANTLR4 parse tree. For interfaces and more, the ANTLR4 front end is selected if installed, because the native document
+	model doesn't cover these language constructs yet.
+
+	:param detail: Requested level of detail.
+	:returns:      :attr:`FrontEnd.Native` or :attr:`FrontEnd.ANTLR4`.
+	"""
+	if detail is DetailLevel.DesignUnits or not IsAvailable(FrontEnd.ANTLR4):
+		return FrontEnd.Native
+
+	return FrontEnd.ANTLR4
+
+
+def _ReadContent(file: Path, content: Optional[str]) -> str:
+	if content is not None:
+		return content
+
+	with file.open("r") as fileHandle:
+		return fileHandle.read()
+
+
+def _ParseNativeDesignUnits(file: Path, content: str) -> Document:
+	"""Find design units in the block stream and translate them to language model design units."""
+	InitializeBlocks()
+
+	tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(content))
+	blocks = list(TokenToBlockParser(tokens)())
+
+	document = Document(file, tokens[0], tokens[-1])
+	for unit in _SummarizeDesignUnits(blocks):
+		if unit.Kind == "entity":
+			designUnit = Entity(unit.Name)
+		elif unit.Kind == "architecture":
+			designUnit = Architecture(unit.Name, EntitySymbol(unit.EntityName))
+		elif unit.Kind == "package":
+			designUnit = Package(unit.Name)
+		elif unit.Kind == "package body":
+			designUnit = PackageBody(PackageSymbol(unit.Name))
+		elif unit.Kind == "context":
+			designUnit = Context(unit.Name)
+		else:
+			designUnit = Configuration(unit.Name)
+		document._AddDesignUnit(designUnit)
+
+	return document
+
+
+def _ParseNativeDocumentModel(file: Path, content: str) -> ModelDocument:
+	from pyVHDLParser.DocumentModel import Document as DOMDocument
+
+	InitializeBlocks()
+
+	document = DOMDocument(file)
+	document.Parse(content)
+	return document
+
+
+def _ParseANTLR4(file: Path, content: str) -> Document:
+	"""Translate an ANTLR4 parse tree to a language model document."""
+	from antlr4                         import CommonTokenStream, InputStream
+	from pyVHDLParser.ANTLR4            import ANTLR2Token
+	from pyVHDLParser.ANTLR4.VHDLLexer  import VHDLLexer
+	from pyVHDLParser.ANTLR4.VHDLParser import VHDLParser
+	from pyVHDLParser.ANTLR4.Visitor    import VHDLVisitor
+
+	stream =      CommonTokenStream(VHDLLexer(InputStream(content)))
+	parseTree =   VHDLParser(stream).rule_DesignFile()
+	designUnits = VHDLVisitor().visit(parseTree)
+	tokens =      ANTLR2Token().ConvertToTokenChain(stream)
+
+	document = Document(file, tokens[0], tokens[-1])
+	for designUnit in designUnits:
+		document._AddDesignUnit(designUnit)
+
+	return document
+
+
+@export
+def ParseDocument(file: Union[Path, str], content: str = None, frontEnd: FrontEnd = FrontEnd.Auto, detail: DetailLevel = DetailLevel.DesignUnits) -> ModelDocument:
+	"""
+	Parse a VHDL source file into a :class:`pyVHDLModel.Document` by the selected front end.
+
+	Parser exceptions of the selected front end are not translated.
+
+	:param file:     Path of the source file. It's read if no content is given.
+	:param content:  Optional source code, e.g. of an unsaved editor buffer.
+	:param frontEnd: Front end to use. :attr:`FrontEnd.Auto` selects one by :func:`SelectFrontEnd`.
+	:param detail:   Requested level of detail. A front end might return more details than requested.
+	:returns:        The parsed document.
+	:raises ImportError: If the ANTLR4 front end is selected, but the ANTLR4 runtime isn't installed.
+	"""
+	file =    Path(file)
+	content = _ReadContent(file, content)
+
+	if frontEnd is FrontEnd.Auto:
+		frontEnd = SelectFrontEnd(detail)
+
+	if frontEnd is FrontEnd.ANTLR4:
+		return _ParseANTLR4(file, content)
+	elif detail is DetailLevel.DesignUnits:
+		return _ParseNativeDesignUnits(file, content)
+	else:
+		return _ParseNativeDocumentModel(file, content)
@@ -40,7 +40,7 @@ class CommentGroup(Group):
 	def stateParse(cls, parserState: BlockToGroupParser):
 		for block in parserState.GetBlockIterator:
 			if not isinstance(block, CommentBlock):
-				parserState.NextGroup = cls(parserState.LastGroup, parserState.BlockMarker, block)
+				parserState.NextGroup = cls(parserState.LastGroup, parserState.BlockMarker, block.PreviousBlock)
 				parserState.Pop()
 				return True
 
@@ -94,12 +94,11 @@ class ContextGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -237,19 +236,17 @@ class EntityGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.DECLARATION_SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.DECLARATION_COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -277,19 +274,17 @@ class EntityGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.STATEMENT_SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.STATEMENT_COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -375,19 +370,17 @@ class ArchitectureGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.DECLARATION_SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.DECLARATION_COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -417,19 +410,17 @@ class ArchitectureGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.STATEMENT_SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.STATEMENT_COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -489,19 +480,17 @@ class PackageGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.DECLARATION_SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.DECLARATION_COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -561,20 +550,18 @@ class PackageBodyGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.NextGroup =   group(parserState.LastGroup, parserState.BlockMarker, currentBlock)
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.DECLARATION_SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.DECLARATION_COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.NextGroup =   group(parserState.LastGroup, parserState.BlockMarker, currentBlock)
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -626,19 +613,17 @@ class ComponentGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -690,19 +675,17 @@ class ConfigurationGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.SIMPLE_BLOCKS[block]
-					parserState.PushState = group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.COMPOUND_BLOCKS[block]
-					parserState.PushState = group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState = group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState = group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -143,19 +143,17 @@ class ProcessGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.DECLARATION_SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.DECLARATION_COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -183,19 +181,17 @@ class ProcessGroup(Group):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.STATEMENT_SIMPLE_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
+
+			group = cls.STATEMENT_COMPOUND_BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				return True
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -28,7 +28,7 @@
 # ==================================================================================================================== #
 #
 from types                                  import FunctionType
-from typing import Iterator, Callable, List, Generator, Any, Dict, Tuple
+from typing import Iterator, Callable, List, Generator, Any, Dict, Tuple, Type, Optional
 
 from pyTooling.MetaClasses import ExtendedType
 from pyTooling.TerminalUI                   import LineTerminal
@@ -37,6 +37,7 @@ from pyTooling.Decorators                   import export
 
 from pyVHDLParser                           import StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
 from pyVHDLParser.Base                      import ParserException
+from pyVHDLParser.Profiling                 import StateProfiler
 from pyVHDLParser.Blocks                    import Block, CommentBlock, StartOfDocumentBlock, EndOfDocumentBlock
 from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock
 from pyVHDLParser.Blocks.Reference          import Context, Library, Use
@@ -50,6 +51,11 @@ class GroupParserException(ParserException):
 		super().__init__(message)
 		self._block = block
 
+	@property
+	def Block(self) -> Block:
+		"""Returns the block involved in an exception situation."""
+		return self._block
+
 
 # @export
 # class BlockToGroupParser:
@@ -86,6 +92,8 @@ class BlockToGroupParser(metaclass=ExtendedType, useSlots=True):
 	_iterator:    Iterator
 	_stack:       List[Tuple[Callable[['BlockToGroupParser'], bool], Block, 'Group']]
 	_blockMarker: Block
+	_debug:       bool
+	_profiler:    Optional[StateProfiler]
 
 	Block:        Block
 	NextState:    Callable[['BlockToGroupParser'], bool]
@@ -95,12 +103,20 @@ class BlockToGroupParser(metaclass=ExtendedType, useSlots=True):
 	LastGroup:    'Group'
 	NextGroup:    'Group'
 
-	def __init__(self, blockGenerator: Generator[Block, Any, None]):
-		"""Initializes the parser state."""
+	def __init__(self, blockGenerator: Generator[Block, Any, None], debug: bool = False, profiler: StateProfiler = None):
+		"""
+		Initializes the parser state.
+
+		:param blockGenerator: Stream of blocks.
+		:param debug:          If true, trace each (re)issued state.
+		:param profiler:       Optional profiler, which counts and times each executed state.
+		"""
 
 		self._iterator =    iter(BlockIterator(self, blockGenerator))   # XXX: review iterator vs. generator
 		self._stack =       []
 		self._blockMarker = None
+		self._debug =       debug
+		self._profiler =    profiler
 
 		startBlock =        next(self._iterator)
 		startGroup =        StartOfDocumentGroup(startBlock)
@@ -157,6 +173,24 @@ class BlockToGroupParser(metaclass=ExtendedType, useSlots=True):
 		# if self.debug: print("  {DARK_GREEN}@BlockMarker: {0!s} --> {GREEN}{1!s}{NOCOLOR}".format(self._blockMarker, value, **Console.Foreground))
 		self._blockMarker = value
 
+	@property
+	def IsAtTopLevel(self) -> bool:
+		"""
+		Returns true, if the parser is between two top-level groups, like at the start of a document.
+
+		A pending whitespace or comment group is closed by the next design unit, library or use clause the same way as by the
+		end of a document.
+		"""
+		from pyVHDLParser.Groups.Comment import CommentGroup, WhitespaceGroup
+
+		if len(self._stack) == 0:
+			return self.NextState == StartOfDocumentGroup.stateDocument
+
+		return (
+			(len(self._stack) == 1) and (self._stack[0][0] == StartOfDocumentGroup.stateDocument) and
+			(self.NextState in (WhitespaceGroup.stateParse, CommentGroup.stateParse))
+		)
+
 	def __eq__(self, other: Callable[['ParserState'], bool]) -> bool:
 		"""Return true if parser state is equal to the second operand."""
 		return self.NextState is other
@@ -191,6 +225,7 @@ class BlockToGroupParser(metaclass=ExtendedType, useSlots=True):
 		self.LastGroup = self.NextGroup
 		yield self.LastGroup
 
+		profiler = self._profiler
 		for block in self._iterator:
 			# an empty marker means: set on next yield run
 			if self._blockMarker is None:
@@ -201,8 +236,12 @@ class BlockToGroupParser(metaclass=ExtendedType, useSlots=True):
 			# execute a state and reissue execution if needed
 			reissue = True
 			while reissue:
-				LineTerminal().WriteDryRun("{DARK_GRAY}reissue state={state!s: <50}  block={block!s: <40}     {NOCOLOR}".format(state=self, block=self.Block, **LineTerminal.Foreground))
-				reissue = self.NextState(self)
+				if self._debug:
+					LineTerminal().WriteDryRun("{DARK_GRAY}reissue state={state!s: <50}  block={block!s: <40}     {NOCOLOR}".format(state=self, block=self.Block, **LineTerminal.Foreground))
+				if profiler is None:
+					reissue = self.NextState(self)
+				else:
+					reissue = profiler.Call(self.NextState, self)
 
 				# yield a new group
 				if self.NewGroup is not None:
@@ -216,18 +255,114 @@ class BlockToGroupParser(metaclass=ExtendedType, useSlots=True):
 		else:
 			raise GroupParserException("Unexpected end of document.", self.Block)
 
+	def GetTopLevelGroups(self, release: bool = True) -> Generator['Group', None, None]:
+		"""
+		Parse the block stream and yield only completed top-level groups.
+
+		Top-level groups are design units, library and use clauses, comments and whitespace. Inner groups are parsed, but not
+		yielded. The last group is an :class:`EndOfDocumentGroup`.
+
+		In release mode, a yielded group is detached from the group, block and token chains, when the next top-level group
+		is yielded. The chains of the start of document are linked to the remaining chains, so a group with all its blocks
+		and tokens can be garbage collected as soon as the caller drops it. Memory usage is then bounded by a few design
+		units instead of the document size.
+
+		:param release: If true, detach yielded groups.
+		:returns:       A generator of top-level groups.
+		"""
+		groups =        self()
+		startGroup =    next(groups)
+		previousGroup = None
+
+		for group in groups:
+			if self.NextGroup is not startGroup:
+				continue
+
+			if release and previousGroup is not None:
+				self._ReleaseGroup(startGroup, previousGroup, group)
+			yield group
+			previousGroup = group
+
+	def _ReleaseGroup(self, startGroup: 'StartOfDocumentGroup', group: 'Group', nextGroup: 'Group') -> None:
+		"""Detach a top-level group and link the start of document to the blocks and tokens of the next top-level group."""
+		startGroup._subGroups[group.__class__].remove(group)
+		startGroup.InnerGroup = nextGroup
+		group._previousGroup =  None
+		group.NextGroup =       None
+		self._blockMarker =     None
+
+		startBlock = startGroup.StartBlock
+		nextBlock =  nextGroup.EndBlock if nextGroup.StartBlock is None else nextGroup.StartBlock
+		endBlock =   nextBlock.PreviousBlock
+		group.StartBlock._previousBlock = None
+		endBlock.NextBlock =              None
+		startBlock.NextBlock =            nextBlock
+		nextBlock._previousBlock =        startBlock
+
+		startToken = startBlock.StartToken
+		endToken =   endBlock.EndToken
+		nextToken =  endToken.NextToken
+		group.StartBlock.StartToken._previousToken = None
+		endToken.NextToken =                         None
+		startToken.NextToken =                       nextToken
+		nextToken._previousToken =                   startToken
+
+
+@export
+class BlockGroupMap(dict):
+	"""
+	A dictionary mapping an exact block class to a group class.
+
+	It's created from one or more dictionaries like ``SIMPLE_BLOCKS`` or ``COMPOUND_BLOCKS``, which map a block class to
+	a group class and are checked by :func:`isinstance` in their order. The first matching entry wins. Unknown block
+	classes are resolved once on first access and then cached, so a lookup is O(1) instead of a linear scan. If no entry
+	matches, ``None`` is returned.
+	"""
+
+	def __init__(self, *blockMaps: Dict[Type[Block], Type['Group']]):
+		super().__init__()
+		self._blockMaps = blockMaps
+
+	def __missing__(self, blockClass: Type[Block]) -> Type['Group']:
+		for blockMap in self._blockMaps:
+			for block, group in blockMap.items():
+				if issubclass(blockClass, block):
+					self[blockClass] = group
+					return group
+
+		self[blockClass] = None
+		return None
+
 
 @export
 class MetaGroup(ExtendedType):
-	"""Register all state*** methods in an array called '__STATES__'"""
+	"""
+	Register all state*** methods in an array called '__STATES__'.
+
+	For each block-to-group dictionary like ``SIMPLE_BLOCKS`` or ``DECLARATION_COMPOUND_BLOCKS``, a :class:`BlockGroupMap`
+	like ``SIMPLE_BLOCK_GROUPS`` or ``DECLARATION_COMPOUND_BLOCK_GROUPS`` is created.
+	"""
+
+	__BLOCK_MAPS__ = ("SIMPLE_BLOCKS", "COMPOUND_BLOCKS", "DECLARATION_SIMPLE_BLOCKS", "DECLARATION_COMPOUND_BLOCKS", "STATEMENT_SIMPLE_BLOCKS", "STATEMENT_COMPOUND_BLOCKS")
+
 	def __new__(cls, className, baseClasses, classMembers: dict):
 		states = []
 		for memberName, memberObject in classMembers.items():
-			if isinstance(memberObject, FunctionType) and (memberName[:5] == "state"):
-				states.append(memberObject)
+			if memberName[:5] == "state":
+				# states are usually classmethods
+				if isinstance(memberObject, classmethod):
+					memberObject = memberObject.__func__
+				if isinstance(memberObject, FunctionType):
+					states.append(memberObject)
 
 		group = super().__new__(cls, className, baseClasses, classMembers, useSlots=True)
 		group.__STATES__ = states
+
+		for blockMapName in cls.__BLOCK_MAPS__:
+			blockMap = getattr(group, blockMapName, None)
+			if blockMap is not None:
+				setattr(group, blockMapName[:-1] + "_GROUPS", BlockGroupMap(blockMap))
+
 		return group
 
 
@@ -365,6 +500,8 @@ class EndOfGroup(Group):
 
 @export
 class StartOfDocumentGroup(StartOfGroup, StartOfDocument):
+	BLOCK_GROUPS = None   #: Lookup of library and use statements as well as design units. Filled on first use due to import cycles.
+
 	def __init__(self, startBlock: Block):
 		from pyVHDLParser.Groups.Comment      import CommentGroup, WhitespaceGroup
 		from pyVHDLParser.Groups.DesignUnit   import ContextGroup, EntityGroup, ArchitectureGroup, PackageGroup, PackageBodyGroup, ConfigurationGroup
@@ -391,18 +528,21 @@ class StartOfDocumentGroup(StartOfGroup, StartOfDocument):
 		from pyVHDLParser.Groups.Reference      import LibraryGroup, UseGroup
 		from pyVHDLParser.Groups.Comment import CommentGroup, WhitespaceGroup
 
-		SIMPLE_BLOCKS = {
-			Library.StartBlock:       LibraryGroup,
-			Use.StartBlock:           UseGroup
-		}
-		COMPOUND_BLOCKS = {
-			Context.NameBlock:        ContextGroup,
-			Entity.NameBlock:         EntityGroup,
-			Architecture.NameBlock:   ArchitectureGroup,
-			Package.NameBlock:        PackageGroup,
-			PackageBody.NameBlock:    PackageBodyGroup,
-			Configuration.NameBlock:  ConfigurationGroup
-		}
+		if cls.BLOCK_GROUPS is None:
+			cls.BLOCK_GROUPS = BlockGroupMap(
+				{	# Simple blocks
+					Library.StartBlock:       LibraryGroup,
+					Use.StartBlock:           UseGroup
+				},
+				{	# Compound blocks
+					Context.NameBlock:        ContextGroup,
+					Entity.NameBlock:         EntityGroup,
+					Architecture.NameBlock:   ArchitectureGroup,
+					Package.NameBlock:        PackageGroup,
+					PackageBody.NameBlock:    PackageBodyGroup,
+					Configuration.NameBlock:  ConfigurationGroup
+				}
+			)
 
 		currentBlock = parserState.Block
 
@@ -417,21 +557,12 @@ class StartOfDocumentGroup(StartOfGroup, StartOfDocument):
 			parserState.BlockMarker = currentBlock
 			return True
 		else:
-			for blk in SIMPLE_BLOCKS:
-				if isinstance(currentBlock, blk):
-					group =                   SIMPLE_BLOCKS[blk]
-					parserState.PushState =   group.stateParse
-					parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
-					parserState.BlockMarker = currentBlock
-					return True
-
-			for blk in COMPOUND_BLOCKS:
-				if isinstance(currentBlock, blk):
-					group =                   COMPOUND_BLOCKS[blk]
-					parserState.PushState =   group.stateParse
-					parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
-					parserState.BlockMarker = currentBlock
-					return True
+			group = cls.BLOCK_GROUPS[currentBlock.__class__]
+			if group is not None:
+				parserState.PushState =   group.stateParse
+				parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
+				parserState.BlockMarker = currentBlock
+				return True
 
 			if isinstance(currentBlock, EndOfDocumentBlock):
 				parserState.NewGroup = EndOfDocumentGroup(currentBlock)
@@ -0,0 +1,363 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+Incremental re-tokenization and re-blocking of a VHDL document after text edits.
+
+An :class:`IncrementalDocument` keeps the token chain and block chain of a document. While parsing, it records
+:class:`~pyVHDLParser.Blocks.BlockParserCheckpoint` objects at block boundaries at line starts. After a text edit,
+tokenizing and block parsing resume at the last checkpoint before the edit. As soon as the resumed parser reaches a
+checkpoint after the edit, which is equivalent to a checkpoint of the previous parse, the remaining token and block chains
+are reused: they are linked to the new chains and their positions are moved.
+
+In *lazy position* mode, reused tokens aren't modified. Their :class:`~pyVHDLParser.SourceCodeIndex` is redirected to the
+index of the edited document, which moves their positions on demand. Otherwise, all position objects after the edit are
+moved, which takes time proportional to the remaining document.
+
+.. code-block:: Python
+
+   document = IncrementalDocument(content)
+   update =   document.Update(offset=120, removedLength=3, insertedText="signal")
+   for block in update.FirstBlock.GetIterator(inclusiveStartBlock=True, stopBlock=update.LastBlock):
+     print(repr(block))
+"""
+from bisect                     import bisect_left, bisect_right
+from typing                     import List, Optional, Union
+
+from pyTooling.Decorators       import export
+from pyTooling.MetaClasses      import ExtendedType
+
+from pyVHDLParser               import SourceCodePosition, SourceCodeIndex
+from pyVHDLParser.Token         import Token, StartOfDocumentToken
+from pyVHDLParser.Token.Parser  import Tokenizer, TokenizerException
+from pyVHDLParser.Blocks        import Block, StartOfDocumentBlock, TokenToBlockParser, BlockParserCheckpoint, BlockParserException, InitializeBlocks
+
+
+@export
+class IncrementalUpdate(metaclass=ExtendedType, useSlots=True):
+	"""Describes the blocks, which were created by :meth:`IncrementalDocument.Update`."""
+
+	FirstBlock:     Optional[Block]  #: First new block.
+	LastBlock:      Optional[Block]  #: Last new block. If resynchronized, it's followed by reused blocks.
+	BlockCount:     int              #: Number of new blocks.
+	Resynchronized: bool             #: True, if token and block chains after the edit were reused.
+
+	def __init__(self, firstBlock: Optional[Block], lastBlock: Optional[Block], blockCount: int, resynchronized: bool):
+		self.FirstBlock =     firstBlock
+		self.LastBlock =      lastBlock
+		self.BlockCount =     blockCount
+		self.Resynchronized = resynchronized
+
+
+@export
+class IncrementalDocument(metaclass=ExtendedType, useSlots=True):
+	"""
+	A VHDL document, whose token and block chains are updated incrementally after text edits.
+
+	Errors don't abort an update. The token and block chains end at the error and the exception is kept in
+	:attr:`Error`, so diagnostics can be reported for incomplete code while typing.
+	"""
+
+	_content:       str
+	_sourceIndex:   Optional[SourceCodeIndex]
+	_startBlock:    StartOfDocumentBlock
+	_endToken:      Token                        #: Last token of the token chain.
+	_exception:     Optional[Exception]
+	_offsets:       List[int]                    #: Offset of the line start following a checkpoint's last block.
+	_rows:          List[int]                    #: Row of the line start following a checkpoint's last block.
+	_checkpoints:   List[BlockParserCheckpoint]
+
+	def __init__(self, content: str, lazyPositions: bool = False):
+		"""
+		Initializes and parses a document.
+
+		:param content:       VHDL source code.
+		:param lazyPositions: If true, tokens store absolute offsets (see :meth:`Tokenizer.GetTableDrivenVHDLTokenizer`).
+		"""
+		InitializeBlocks()
+
+		self._content =     content
+		self._exception =   None
+		self._offsets =     []
+		self._rows =        []
+		self._checkpoints = []
+
+		parser =            TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=lazyPositions))
+		self._startBlock =  parser.NewBlock
+		self._sourceIndex = self._startBlock.StartToken.SourceIndex
+		self._Parse(parser, 0, [], [], [], 0)
+
+	@property
+	def Content(self) -> str:
+		return self._content
+
+	@property
+	def StartToken(self) -> StartOfDocumentToken:
+		"""Returns the first token of the token chain."""
+		return self._startBlock.StartToken
+
+	@property
+	def StartBlock(self) -> StartOfDocumentBlock:
+		"""Returns the first block of the block chain."""
+		return self._startBlock
+
+	@property
+	def Error(self) -> Optional[Exception]:
+		"""Returns the exception raised by the tokenizer or block parser in the last update, otherwise ``None``."""
+		return self._exception
+
+	def Update(self, offset: int, removedLength: int, insertedText: str) -> IncrementalUpdate:
+		"""
+		Apply a text edit and update the token and block chains.
+
+		The time depends on the size of the edit, the distance to the enclosing checkpoints and, unless tokens were created
+		in *lazy position* mode, the size of the document after the edit, because all moved positions are updated.
+
+		:param offset:        Offset (0-based) of the first removed or inserted character.
+		:param removedLength: Number of removed characters.
+		:param insertedText:  Inserted text.
+		:returns:             The range of new blocks.
+		:raises ValueError:   If the edit is outside of the document.
+		"""
+		if (offset < 0) or (removedLength < 0) or (offset + removedLength > len(self._content)):
+			raise ValueError(f"Edit at offset {offset} with removed length {removedLength} is outside of the document.")
+
+		removedEnd = offset + removedLength
+		delta =      len(insertedText) - removedLength
+
+		# Checkpoints after the removed range can be reused; the last checkpoint at or before the edit is the restart point.
+		restart =    bisect_right(self._offsets, offset) - 1
+		reusable =   max(bisect_left(self._offsets, removedEnd), restart + 1)
+		oldOffsets, oldRows, oldCheckpoints = self._offsets[reusable:], self._rows[reusable:], self._checkpoints[reusable:]
+		del self._offsets[restart + 1:]
+		del self._rows[restart + 1:]
+		del self._checkpoints[restart + 1:]
+
+		self._content =   self._content[:offset] + insertedText + self._content[removedEnd:]
+		oldException =    self._exception
+		self._exception = None
+
+		# In lazy position mode, existing tokens keep the old index, which is redirected to the index of the edited content.
+		oldIndex = self._sourceIndex
+		if oldIndex is None:
+			movedSkipped = []
+		else:
+			self._sourceIndex = oldIndex.Copy()
+			movedSkipped =      self._sourceIndex.Edit(offset, removedLength, insertedText)
+
+		if restart < 0:
+			parser =            TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer(self._content, lazyPositions=oldIndex is not None))
+			self._startBlock =  parser.NewBlock
+			self._sourceIndex = self._startBlock.StartToken.SourceIndex
+		else:
+			checkpoint =   self._checkpoints[restart]
+			oldNextBlock = checkpoint.LastBlock.NextBlock
+			oldNextToken = checkpoint.LastBlock.EndToken.NextToken
+			if oldIndex is not None:
+				# New tokens share the index of their previous token. The checkpoint's token is before the edit, so its
+				# position is the same in the old and the new index, but it might refer to an index of an earlier edit.
+				endToken =              checkpoint.LastBlock.EndToken
+				endToken._start =       endToken._sourceIndex.GetAbsolute(endToken._start)
+				endToken._end =         endToken._sourceIndex.GetAbsolute(endToken._end)
+				endToken._sourceIndex = self._sourceIndex
+			tokenStream = Tokenizer.GetTableDrivenVHDLTokenizer(self._content, previousToken=checkpoint.LastBlock.EndToken)
+			parser =      TokenToBlockParser(tokenStream, checkpoint=checkpoint)
+
+		if oldIndex is not None:
+			oldIndex.Redirect(self._sourceIndex, offset, removedLength, len(insertedText))
+
+		update = self._Parse(parser, offset + len(insertedText), oldOffsets, oldRows, oldCheckpoints, delta, movedSkipped, oldException)
+
+		# If an error occurred before the first new token or block was linked, cut off the outdated chains.
+		if (restart >= 0) and not update.Resynchronized:
+			lastBlock = checkpoint.LastBlock
+			if lastBlock.NextBlock is oldNextBlock:
+				lastBlock.NextBlock = None
+			if lastBlock.EndToken.NextToken is oldNextToken:
+				lastBlock.EndToken.NextToken = None
+
+		return update
+
+	def _Parse(
+		self,
+		parser: TokenToBlockParser,
+		unchangedOffset: int,
+		oldOffsets: List[int],
+		oldRows: List[int],
+		oldCheckpoints: List[BlockParserCheckpoint],
+		delta: int,
+		movedSkipped: List[int] = None,
+		oldException: Exception = None
+	) -> IncrementalUpdate:
+		"""
+		Run a (resumed) parser, record checkpoints and try to resynchronize with the previous parse.
+
+		:param parser:          Block parser, which was created or resumed.
+		:param unchangedOffset: The content starting at this offset is unchanged compared to the previous parse.
+		:param oldOffsets:      Offsets of reusable checkpoints from the previous parse.
+		:param oldRows:         Rows of reusable checkpoints from the previous parse.
+		:param oldCheckpoints:  Reusable checkpoints from the previous parse.
+		:param delta:           Difference in length between the new and the previous content.
+		:param movedSkipped:    Moved offsets of skipped linebreaks in the previous content.
+		:param oldException:    Exception of the previous parse, which is kept if the chains are resynchronized.
+		"""
+		firstBlock = None
+		lastBlock =  None
+		blockCount = 0
+		try:
+			for block in parser():
+				if firstBlock is None:
+					firstBlock = block
+				lastBlock =   block
+				blockCount += 1
+
+				checkpoint = parser.GetCheckpoint()
+				if checkpoint is None:
+					continue
+
+				offset = checkpoint.GetResumeOffset(self._content)
+				if offset is None:
+					continue
+
+				row =    checkpoint.LastBlock.EndToken.End.Row + 1
+				self._offsets.append(offset)
+				self._rows.append(row)
+				self._checkpoints.append(checkpoint)
+
+				if offset >= unchangedOffset:
+					index = bisect_left(oldOffsets, offset - delta)
+					if (index < len(oldOffsets)) and (oldOffsets[index] == offset - delta) and checkpoint.IsEquivalent(oldCheckpoints[index]):
+						self._exception = oldException
+						self._Resynchronize(checkpoint, oldCheckpoints[index], row - oldRows[index], delta, [skipped for skipped in movedSkipped if skipped >= offset])
+
+						self._offsets.extend(oldOffset + delta for oldOffset in oldOffsets[index + 1:])
+						self._rows.extend(oldRow + row - oldRows[index] for oldRow in oldRows[index + 1:])
+						self._checkpoints.extend(oldCheckpoints[index + 1:])
+
+						return IncrementalUpdate(firstBlock, lastBlock, blockCount, True)
+		except Exception as ex:
+			self._exception = ex
+
+		endToken = parser.Token
+		while endToken.NextToken is not None:
+			endToken = endToken.NextToken
+		self._endToken = endToken
+
+		return IncrementalUpdate(firstBlock, lastBlock, blockCount, False)
+
+	def _Resynchronize(self, checkpoint: BlockParserCheckpoint, oldCheckpoint: BlockParserCheckpoint, rowDelta: int, delta: int, movedSkipped: List[int]) -> None:
+		"""
+		Link the token and block chains following an equivalent old checkpoint to the new chains and move them.
+
+		In *lazy position* mode, the chains are only linked at the splice point, because the redirected source code indices
+		of the reused tokens move their positions.
+		"""
+		oldBlock =   oldCheckpoint.LastBlock
+		firstToken = oldBlock.EndToken.NextToken
+		firstBlock = oldBlock.NextBlock
+
+		newBlock = checkpoint.LastBlock
+		if firstToken is None:
+			newBlock.EndToken.NextToken = None
+		else:
+			firstToken.PreviousToken = newBlock.EndToken
+		if firstBlock is None:
+			newBlock.NextBlock = None
+		else:
+			firstBlock.PreviousBlock = newBlock
+
+		# Positions can be shared by neighbouring tokens, so each position object and each token is moved once.
+		movedPositions = set()
+		movedTokens =    {id(newBlock.EndToken)}
+
+		def movePosition(position: Union[SourceCodePosition, int, None]) -> Union[SourceCodePosition, int, None]:
+			if position.__class__ is int:
+				return position + delta
+			elif (position is not None) and (id(position) not in movedPositions):
+				movedPositions.add(id(position))
+				position.Row +=      rowDelta
+				position.Absolute += delta
+			return position
+
+		# A block can end at the linebreak before its first token; then it refers to the linebreak of the new chain.
+		oldEndToken = oldBlock.EndToken
+		if self._sourceIndex is not None:
+			for skipped in movedSkipped:
+				self._sourceIndex.SkipLinebreak(skipped)
+
+			# The tokenizer creates position objects only for the end of document.
+			token = self._endToken
+			while (token is not None) and (token is not newBlock.EndToken):
+				start, end = token._start, token._end
+				if (start.__class__ is int) and ((end is None) or (end.__class__ is int)):
+					break
+				if start.__class__ is not int:
+					movePosition(start)
+				if (end is not None) and (end.__class__ is not int):
+					movePosition(end)
+				token = token.PreviousToken
+
+			block = firstBlock
+			while (block is not None) and ((block.StartToken is oldEndToken) or (block.EndToken is oldEndToken)):
+				if block.StartToken is oldEndToken:
+					block.StartToken = newBlock.EndToken
+				if block.EndToken is oldEndToken:
+					block.EndToken = newBlock.EndToken
+				block = block.NextBlock
+
+			if isinstance(self._exception, TokenizerException):
+				self._exception.Position = movePosition(self._exception.Position)
+			return
+
+		def moveToken(token: Optional[Token]) -> None:
+			if (token is not None) and (id(token) not in movedTokens):
+				movedTokens.add(id(token))
+				token._start = movePosition(token._start)
+				token._end =   movePosition(token._end)
+
+		token = firstToken
+		while token is not None:
+			moveToken(token)
+			token = token.NextToken
+
+		# Blocks and exceptions can refer to tokens, which were replaced in the token chain by specific tokens.
+		block = firstBlock
+		while block is not None:
+			if block.StartToken is oldEndToken:
+				block.StartToken = newBlock.EndToken
+			if block.EndToken is oldEndToken:
+				block.EndToken = newBlock.EndToken
+			moveToken(block.StartToken)
+			moveToken(block.EndToken)
+			block = block.NextBlock
+
+		if isinstance(self._exception, TokenizerException):
+			self._exception.Position = movePosition(self._exception.Position)
+		elif isinstance(self._exception, BlockParserException):
+			moveToken(self._exception.Token)
@@ -0,0 +1,334 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+A fast scan for comments, context items and design unit headers.
+
+Documentation extraction and dependency scanning don't need statement-level blocks. :func:`ScanOutline` consumes a
+token stream and emits a flat stream of :class:`OutlineItem` objects:
+
+* comments,
+* ``library``, ``use`` and ``context`` clauses, also within design units,
+* design unit headers (e.g. ``architecture rtl of counter is``) and their ``end``.
+
+Bodies of design units, subprograms and statements are skipped by tracking only the keywords, which start or end a
+nested region. Like a fast-forward scan over :class:`~pyVHDLParser.Blocks.SkipableBlock` and
+:class:`~pyVHDLParser.Blocks.FinalBlock` blocks, no block parser states are executed. The scan doesn't check the syntax:
+unexpected tokens outside of design units are ignored.
+
+.. code-block:: Python
+
+   from pyVHDLParser.Outline import OutlineKind, GetOutline
+
+   for item in GetOutline(content, comments=False):
+     if item.Kind is OutlineKind.Use:
+       print(f"{item.Start}: use {', '.join(item.Names)}")
+"""
+from enum                        import Enum
+from typing                      import Generator, Iterable, List, Tuple
+
+from pyTooling.Decorators        import export
+from pyTooling.MetaClasses       import ExtendedType
+
+from pyVHDLParser                import SourceCodePosition
+from pyVHDLParser.Token          import Token, CharacterToken, CommentToken, LinebreakToken, SpaceToken, WordToken
+from pyVHDLParser.Token.Keywords import RESERVED_WORDS
+from pyVHDLParser.Token.Parser   import Tokenizer
+
+
+@export
+class OutlineKind(Enum):
+	"""Kinds of outline items and the meaning of :attr:`OutlineItem.Names`."""
+
+	Comment =              "comment"                #: A comment. Names: the comment's text.
+	Library =              "library"                #: A library clause. Names: library names.
+	Use =                  "use"                    #: A use clause. Names: selected names, e.g. ``ieee.std_logic_1164.all``.
+	ContextReference =     "context reference"      #: A context reference. Names: selected names of contexts.
+	Entity =               "entity"                 #: An entity header. Names: entity name.
+	Architecture =         "architecture"           #: An architecture header. Names: architecture name and entity name.
+	Package =              "package"                #: A package header. Names: package name.
+	PackageBody =          "package body"           #: A package body header. Names: package name.
+	PackageInstantiation = "package instantiation"  #: A package instantiation. Names: package name and the selected name of the uninstantiated package.
+	Configuration =        "configuration"          #: A configuration header. Names: configuration name and entity name.
+	Context =              "context"                #: A context declaration header. Names: context name.
+	EndOfDesignUnit =      "end"                    #: End of a design unit. Names: same as the design unit's header.
+
+
+@export
+class OutlineItem(metaclass=ExtendedType, useSlots=True):
+	"""An item of an outline stream."""
+
+	Kind:       OutlineKind      #: Kind of this item.
+	Names:      Tuple[str, ...]  #: Names described by :class:`OutlineKind`.
+	StartToken: Token            #: First token of this item, e.g. the design unit's keyword.
+	EndToken:   Token            #: Last token of this item, e.g. ``is`` of a design unit header or ``;`` of a clause.
+
+	def __init__(self, kind: OutlineKind, names: Tuple[str, ...], startToken: Token, endToken: Token):
+		self.Kind =       kind
+		self.Names =      names
+		self.StartToken = startToken
+		self.EndToken =   endToken
+
+	@property
+	def Start(self) -> SourceCodePosition:
+		"""Position of the item's first token."""
+		return self.StartToken.Start
+
+	def __str__(self) -> str:
+		return f"{self.Kind.value} {', '.join(self.Names)}"
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self!s} at {self.Start!r}>"
+
+
+_DESIGN_UNITS = {
+	"entity":        OutlineKind.Entity,
+	"architecture":  OutlineKind.Architecture,
+	"package":       OutlineKind.Package,
+	"configuration": OutlineKind.Configuration,
+	"context":       OutlineKind.Context
+}
+
+#: Keywords starting a region, which is closed by ``end``.
+_NESTING_KEYWORDS =   frozenset(("block", "case", "component", "if", "process", "protected", "record", "units"))
+#: Keywords starting a region with a declarative part, which can follow without ``is``.
+_DECLARATIVE_REGION = frozenset(("block", "process"))
+#: Keywords which can follow a ``:`` in attribute specifications or instantiations without starting a region.
+_ENTITY_CLASSES =     frozenset(("component", "function", "package", "procedure", "units"))
+#: Keywords starting a subprogram or package, which has a body if it's followed by ``is``, but not by ``is new``.
+_BODY_KEYWORDS =      frozenset(("function", "package", "procedure"))
+#: Words after which a new statement or declaration starts.
+_STATEMENT_BOUNDARY = frozenset(("begin", "generate", "is", "loop", "then", "=>"))
+
+_TOP =    0  #: Outside of design units.
+_CLAUSE = 1  #: Collecting names of a clause until ``;``.
+_HEADER = 2  #: Collecting names of a design unit header until ``is``.
+_BODY =   3  #: Skipping the content of a design unit.
+
+
+def _Word(token: Token) -> str:
+	"""Returns the lower-cased word of a word token, the value of a character token, otherwise an empty string."""
+	if isinstance(token, WordToken):
+		return token.Key
+	elif isinstance(token, CharacterToken):
+		return token.Value
+	return ""
+
+
+@export
+def ScanOutline(tokenStream: Iterable[Token], comments: bool = True, structure: bool = True) -> Generator[OutlineItem, None, None]:
+	"""
+	Scan a token stream for comments, context items and design unit headers.
+
+	The token stream must be created by a tokenizer, i.e. its word tokens are not yet converted to keywords. Alternative
+	bodies of generate statements with their own ``end`` (VHDL-2008) aren't tracked.
+
+	:param tokenStream: A token stream, e.g. from :meth:`~pyVHDLParser.Token.Parser.Tokenizer.GetTableDrivenVHDLTokenizer`.
+	:param comments:    If true, emit comments.
+	:param structure:   If true, emit clauses and design unit headers.
+	:returns:           A generator of outline items.
+	"""
+	state =        _TOP
+	returnState =  _TOP
+	kind =         None    # kind of the collected clause or design unit header
+	startToken =   None
+	names: List[str] = []  # collected names
+	parts: List[str] = []  # parts of the current name
+	collecting =   True    # false after 'generic' in a package instantiation
+
+	unitKind =     None
+	unitNames =    ()
+	isToken =      None    # 'is' of a package header, if 'new' might follow
+	endToken =     None    # 'end' of the current region
+	depth =        0       # nested regions in a design unit
+	parentheses =  0
+	firstKeyword = None    # first reserved word of the current statement
+	previous =     ""      # word of the previous token in a design unit
+	pending =      0       # 1 = found a subprogram or package keyword; 2 = ... followed by 'is'
+
+	for token in tokenStream:
+		if isinstance(token, (SpaceToken, LinebreakToken)):
+			continue
+		elif isinstance(token, CommentToken):
+			if comments:
+				yield OutlineItem(OutlineKind.Comment, (token.Value, ), token, token)
+			continue
+		elif not structure:
+			continue
+
+		word = _Word(token)
+
+		if state == _TOP:
+			if word in ("library", "use"):
+				kind =        OutlineKind.Library if word == "library" else OutlineKind.Use
+				state =       _CLAUSE
+				returnState = _TOP
+			elif word in _DESIGN_UNITS:
+				kind =        _DESIGN_UNITS[word]
+				state =       _HEADER
+			else:
+				continue
+
+			startToken = token
+			names =      []
+			parts =      []
+			collecting = True
+			isToken =    None
+
+		elif state == _CLAUSE:
+			if word == ";":
+				if parts:
+					names.append("".join(parts))
+				yield OutlineItem(kind, tuple(names), startToken, token)
+
+				state =        returnState
+				firstKeyword = None
+				previous =     word
+			elif word == "generic":
+				collecting = False
+			elif collecting:
+				if word == ",":
+					names.append("".join(parts))
+					parts = []
+				else:
+					parts.append(token.Value)
+
+		elif state == _HEADER:
+			if word == "is":
+				if parts:
+					names.append("".join(parts))
+
+				if kind is OutlineKind.Package:
+					isToken = token
+				else:
+					unitKind, unitNames = kind, tuple(names)
+					yield OutlineItem(unitKind, unitNames, startToken, token)
+					state, depth, parentheses, firstKeyword, previous, pending = _BODY, 0, 0, None, word, 0
+			elif isToken is not None:
+				if word == "new":
+					kind =    OutlineKind.PackageInstantiation
+					state =   _CLAUSE
+					returnState = _TOP
+					parts =   []
+					continue
+
+				unitKind, unitNames = kind, tuple(names)
+				yield OutlineItem(unitKind, unitNames, startToken, isToken)
+				state, depth, parentheses, firstKeyword, previous, pending = _BODY, 0, 0, None, "is", 0
+			elif word == ";" and kind is OutlineKind.Context:
+				if parts:
+					names.append("".join(parts))
+				yield OutlineItem(OutlineKind.ContextReference, tuple(names), startToken, token)
+				state = _TOP
+			elif word == "body" and kind is OutlineKind.Package:
+				kind = OutlineKind.PackageBody
+			elif word in (",", "of"):
+				names.append("".join(parts))
+				parts = []
+			else:
+				parts.append(token.Value)
+
+		if state != _BODY:
+			continue
+
+		if endToken is not None:
+			# skip the rest of an 'end ...;'
+			if word == ";":
+				if depth < 0:
+					yield OutlineItem(OutlineKind.EndOfDesignUnit, unitNames, endToken, token)
+					state = _TOP
+				endToken =     None
+				firstKeyword = None
+			continue
+
+		if pending == 2:
+			pending = 0
+			if word != "new":
+				depth += 1
+
+		if word == "(":
+			parentheses += 1
+		elif word == ")":
+			parentheses -= 1
+		elif parentheses > 0:
+			pass
+		elif word == "end":
+			depth -=   1
+			endToken = token
+			pending =  0
+		elif word == ";":
+			firstKeyword = None
+			pending =      0
+		elif word in _STATEMENT_BOUNDARY:
+			if word == "is" and pending == 1:
+				pending = 2
+			elif word == "loop" or (word == "generate" and firstKeyword == "for"):
+				depth += 1
+			firstKeyword = None
+		else:
+			if previous == ":" and word in _ENTITY_CLASSES:
+				pass
+			elif word in _NESTING_KEYWORDS:
+				depth += 1
+				if word in _DECLARATIVE_REGION:
+					previous = word
+					continue
+			elif word in _BODY_KEYWORDS:
+				pending = 1
+			elif word == "for" and unitKind is OutlineKind.Configuration:
+				depth += 1
+			elif firstKeyword is None and (word in ("library", "use") or (word == "context" and unitKind is OutlineKind.Context)):
+				kind =        OutlineKind.Library if word == "library" else OutlineKind.Use if word == "use" else OutlineKind.ContextReference
+				state =       _CLAUSE
+				returnState = _BODY
+				startToken =  token
+				names =       []
+				parts =       []
+				collecting =  True
+				continue
+
+			if firstKeyword is None and word in RESERVED_WORDS:
+				firstKeyword = word
+
+		previous = word
+
+
+@export
+def GetOutline(content: str, comments: bool = True, structure: bool = True) -> Generator[OutlineItem, None, None]:
+	"""
+	Tokenize a source code buffer and scan it by :func:`ScanOutline`.
+
+	Tokens are created in *lazy position* mode, so positions are only computed for the emitted items.
+
+	:param content:   VHDL source code.
+	:param comments:  If true, emit comments.
+	:param structure: If true, emit clauses and design unit headers.
+	:returns:         A generator of outline items.
+	"""
+	return ScanOutline(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True), comments=comments, structure=structure)
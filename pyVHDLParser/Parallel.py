@@ -0,0 +1,613 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+Parse a single large VHDL document in parallel worker processes.
+
+A document with many design units is split into segments at lines starting with ``library``, ``use``, ``context``,
+``entity``, ``architecture``, ``package`` or ``configuration`` in the first column. Each segment is tokenized and parsed into blocks and
+groups by a worker of a :class:`~concurrent.futures.ProcessPoolExecutor`. A worker returns its chains serialized by
+:func:`~pyVHDLParser.Serialization.Dump`, so they can be sent back quickly. The main process rebuilds the chains of all
+segments and links them into one token, block and group chain with positions relative to the whole document.
+
+Such a line is only a valid split position, if the parsers are at top-level at the end of the preceding segment. E.g.
+the keyword might be part of a multi-line comment or a use clause might be located in an architecture. Then, both
+segments are merged and parsed again. So the resulting chains are the same as created by parsing the whole document.
+
+Very large generated documents, e.g. netlists, can be tokenized by :func:`TokenizeInParallel`. Such a document is split
+at arbitrary line starts, because the tokenizer has no state at a line start except for an open multi-line comment or
+string. A segment ending with such an open comment or string is merged with the next segment.
+
+Rebuilding the chains in the main process takes about half the time of parsing them, and about two thirds of the time of
+tokenizing them. Thus, the speedup is limited, but the peak memory of the main process isn't increased.
+
+.. code-block:: Python
+
+   document = ParseInParallel(content)
+   if document.Error is not None:
+     print(document.Error)
+   for block in document.StartBlock.GetIterator():
+     print(block)
+"""
+from concurrent.futures             import ProcessPoolExecutor
+from itertools                      import repeat
+from os                             import cpu_count
+from re                             import compile as re_compile, IGNORECASE, MULTILINE
+from typing                         import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pyTooling.Decorators           import export
+from pyTooling.MetaClasses          import ExtendedType
+
+from pyVHDLParser                   import SourceCodePosition, SourceCodeIndex
+from pyVHDLParser.Base              import ParserException
+from pyVHDLParser.Token             import Token, EndOfDocumentToken, LinebreakToken, SingleLineCommentToken
+from pyVHDLParser.Token.Parser      import Tokenizer, TokenizerException
+from pyVHDLParser.Blocks            import Block, EndOfDocumentBlock, TokenToBlockParser, BlockParserException, InitializeBlocks
+from pyVHDLParser.Groups            import Group, EndOfDocumentGroup, BlockToGroupParser, GroupParserException
+from pyVHDLParser.Serialization     import Dump, SerializationException, _Columns, _LoadChains, _ClassName, _ImportClass
+
+
+MIN_SEGMENT_LENGTH = 64 * 1024  #: Minimal length of a segment in characters, if no segment length is given.
+
+_BOUNDARY_PATTERN = r"^(?:library|use|context|entity|architecture|package|configuration)\b"
+_BOUNDARY =         re_compile(_BOUNDARY_PATTERN, IGNORECASE | MULTILINE)
+_BYTES_BOUNDARY =   re_compile(_BOUNDARY_PATTERN.encode("ascii"), IGNORECASE | MULTILINE)
+
+#: A serialized group: class name, indices of start and end block, multi-part flag, indices of previous, next and inner
+#: group, and the inner groups by class name. Inner groups are ``None`` for groups without this attribute.
+_GroupRecord = Tuple[str, int, int, bool, int, int, int, Optional[List[Tuple[str, List[int]]]]]
+
+
+@export
+class ParallelDocument(metaclass=ExtendedType, useSlots=True):
+	"""
+	Token, block and group chains of a document parsed by :func:`ParseInParallel` or tokenized by :func:`TokenizeInParallel`.
+
+	Like for a sequential parse, an error doesn't discard the chains. They end at the segment, which contains the error.
+	"""
+
+	Content:  Union[str, bytes]            #: Source code buffer.
+	Segments: List[Tuple[int, int]]        #: Start and end offset of all segments, which were parsed by workers.
+	Tokens:   List[Token]                  #: All tokens in chain order. Tokens are created in *lazy position* mode.
+	Blocks:   List[Block]                  #: All blocks in chain order. Empty, if the document was only tokenized.
+	Groups:   List[Group]                  #: All groups in the order emitted by a :class:`~pyVHDLParser.Groups.BlockToGroupParser`.
+	Error:    Optional[ParserException]    #: Exception raised by the tokenizer or a parser, otherwise ``None``.
+
+	def __init__(self, content: Union[str, bytes], segments: List[Tuple[int, int]], tokens: List[Token], blocks: List[Block], groups: List[Group], error: Optional[ParserException]):
+		self.Content =  content
+		self.Segments = segments
+		self.Tokens =   tokens
+		self.Blocks =   blocks
+		self.Groups =   groups
+		self.Error =    error
+
+	@property
+	def StartToken(self) -> Token:
+		"""First token of the token chain, a :class:`~pyVHDLParser.Token.StartOfDocumentToken`."""
+		return self.Tokens[0]
+
+	@property
+	def StartBlock(self) -> Optional[Block]:
+		"""First block of the block chain, or ``None`` if the tokenizer failed in the first segment."""
+		return self.Blocks[0] if self.Blocks else None
+
+	@property
+	def StartGroup(self) -> Optional[Group]:
+		"""First group, or ``None`` if groups weren't requested or no group was created."""
+		return self.Groups[0] if self.Groups else None
+
+
+class _Stream:
+	"""
+	Collects the tokens or blocks passed to a parser and checks, if the parser is at top-level at the end of document.
+
+	Without a parser, the items are only collected.
+	"""
+
+	__slots__ = ("_iterator", "_endClass", "Items", "Parser", "AtEnd", "AtTopLevel")
+
+	def __init__(self, iterator: Iterable, endClass: type, items: List):
+		self._iterator =  iterator
+		self._endClass =  endClass
+		self.Items =      items
+		self.Parser =     None
+		self.AtEnd =      False
+		self.AtTopLevel = False
+
+	def __iter__(self):
+		append = self.Items.append
+		for item in self._iterator:
+			append(item)
+			if isinstance(item, self._endClass):
+				self.AtEnd =      True
+				self.AtTopLevel = (self.Parser is None) or self.Parser.IsAtTopLevel
+			yield item
+
+
+class _SegmentResult:
+	"""Result of a segment parsed by :func:`_ParseSegment`."""
+
+	__slots__ = ("Data", "Groups", "GroupCount", "Error", "ErrorAtEnd", "Failure", "AtTopLevel")
+
+	Data:       bytes                                   #: Token and block chain serialized by :func:`Dump`.
+	Groups:     List[_GroupRecord]                      #: Serialized groups. Emitted groups are stored first.
+	GroupCount: int                                     #: Number of groups emitted by the group parser.
+	Error:      Optional[Tuple[type, str, object]]      #: Exception class, message and segment-local location.
+	ErrorAtEnd: bool                                    #: True, if the error was raised at the end of the segment.
+	Failure:    Optional[Exception]                     #: Another exception raised by a parser state.
+	AtTopLevel: bool                                    #: True, if all parsers were at top-level at the end of the segment.
+
+	def __init__(self):
+		self.Data =       None
+		self.Groups =     []
+		self.GroupCount = 0
+		self.Error =      None
+		self.ErrorAtEnd = False
+		self.Failure =    None
+		self.AtTopLevel = False
+
+	@property
+	def Stops(self) -> bool:
+		"""True, if the segment contains an error or failure, which is independent of the following segments."""
+		return ((self.Error is not None) or (self.Failure is not None)) and not self.ErrorAtEnd
+
+
+def _ChainIndex(first: Optional[Union[Token, Block]], item: Union[Token, Block, None], attribute: str) -> Optional[int]:
+	"""Returns the index of a token or block in the chain starting at ``first``, or ``None`` if it's not in the chain."""
+	index = 0
+	while first is not None:
+		if first is item:
+			return index
+		first = getattr(first, attribute)
+		index += 1
+	return None
+
+
+def _DumpGroups(groups: List[Group], startBlock: Block) -> List[_GroupRecord]:
+	"""Serialize all groups reachable from the emitted groups. Blocks are referred to by their index in the block chain."""
+	blockIndices: Dict[int, int] = {}
+	block = startBlock
+	while block is not None:
+		blockIndices[id(block)] = len(blockIndices)
+		block = block.NextBlock
+
+	ordered: List[Group] =      []
+	indices: Dict[int, int] =   {}
+
+	def index(group: Optional[Group]) -> int:
+		if group is None:
+			return -1
+		groupIndex = indices.get(id(group))
+		if groupIndex is None:
+			groupIndex = indices[id(group)] = len(ordered)
+			ordered.append(group)
+		return groupIndex
+
+	for group in groups:
+		index(group)
+
+	records = []
+	for group in ordered:      # 'ordered' is extended while iterating, if references to other groups are found.
+		subGroups = getattr(group, "_subGroups", None)
+		if subGroups is not None:
+			subGroups = [(_ClassName(cls), [index(subGroup) for subGroup in members]) for cls, members in subGroups.items()]
+
+		records.append((
+			_ClassName(group.__class__),
+			-1 if group.StartBlock is None else blockIndices[id(group.StartBlock)],
+			-1 if group.EndBlock is None else blockIndices[id(group.EndBlock)],
+			group.MultiPart,
+			index(group._previousGroup),
+			index(group.NextGroup),
+			index(getattr(group, "InnerGroup", None)),
+			subGroups
+		))
+
+	return records
+
+
+def _ResolveGroupClass(name: str) -> type:
+	cls = _ImportClass(name)
+	if not (isinstance(cls, type) and issubclass(cls, Group)):
+		raise SerializationException(f"Class '{name}' isn't a group class.")
+
+	return cls
+
+
+def _LoadGroups(records: List[_GroupRecord], blocks: List[Block]) -> List[Group]:
+	"""Rebuild the groups serialized by :func:`_DumpGroups` for a rebuilt block chain."""
+	classes: Dict[str, type] = {}
+
+	def resolve(name: str) -> type:
+		cls = classes.get(name)
+		if cls is None:
+			cls = classes[name] = _ResolveGroupClass(name)
+		return cls
+
+	groups: List[Group] = [object.__new__(resolve(record[0])) for record in records]
+
+	def get(index: int) -> Optional[Group]:
+		return None if index == -1 else groups[index]
+
+	for group, (_, startBlock, endBlock, multiPart, previousGroup, nextGroup, innerGroup, subGroups) in zip(groups, records):
+		group._previousGroup = get(previousGroup)
+		group.NextGroup =      get(nextGroup)
+		group.StartBlock =     None if startBlock == -1 else blocks[startBlock]
+		group.EndBlock =       None if endBlock == -1 else blocks[endBlock]
+		group.MultiPart =      multiPart
+		if subGroups is not None:
+			group.InnerGroup = get(innerGroup)
+			group._subGroups = {resolve(name): [groups[index] for index in members] for name, members in subGroups}
+
+	return groups
+
+
+class _SegmentParser:
+	"""
+	Tokenizes a segment and parses it into blocks and optionally groups like a sequential parse of a document.
+
+	All exceptions are caught, so the tokens, blocks and groups up to the error are kept. A segment might start within a
+	design unit of a previous segment, which isn't yet known to be at top-level. Thus, an exception other than a parser
+	exception is reported instead of being raised, because it might not occur in a sequential parse.
+	"""
+
+	__slots__ = ("Tokens", "Blocks", "Groups", "Error", "ErrorAtEnd", "AtTopLevel")
+
+	Tokens:     List[Token]          #: All tokens passed to the block parser.
+	Blocks:     List[Block]          #: All blocks emitted by the block parser.
+	Groups:     List[Group]          #: All groups emitted by the group parser.
+	Error:      Optional[Exception]  #: Exception raised by the tokenizer or a parser.
+	ErrorAtEnd: bool                 #: True, if the exception was raised at the end of document.
+	AtTopLevel: bool                 #: True, if all parsers were at top-level at the end of document.
+
+	def __init__(self, content: Union[str, bytes], groups: bool, encoding: str):
+		self.Tokens =     []
+		self.Blocks =     []
+		self.Groups =     []
+		self.Error =      None
+		self.ErrorAtEnd = False
+		self.AtTopLevel = False
+
+		tokenStream = _Stream(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True, encoding=encoding), EndOfDocumentToken, self.Tokens)
+		blockStream = None
+		try:
+			tokenStream.Parser = TokenToBlockParser(tokenStream)
+			blockStream =        _Stream(tokenStream.Parser(), EndOfDocumentBlock, self.Blocks)
+			if groups:
+				blockStream.Parser = BlockToGroupParser(blockStream)
+				for group in blockStream.Parser():
+					self.Groups.append(group)
+			else:
+				for _ in blockStream:
+					pass
+
+			self.AtTopLevel = tokenStream.AtTopLevel and blockStream.AtTopLevel
+		except TokenizerException as ex:
+			self.Error =      ex
+			self.ErrorAtEnd = ex.Position.Absolute >= len(content)
+		except BlockParserException as ex:
+			self.Error =      ex
+			self.ErrorAtEnd = tokenStream.AtEnd
+		except GroupParserException as ex:
+			self.Error =      ex
+			self.ErrorAtEnd = blockStream.AtEnd
+		except Exception as ex:
+			# Some parser states fail with other exceptions. If a segment ends within a design unit, it's merged with the next
+			# segment anyway. Otherwise, the exception is raised, when the segment is stitched.
+			self.Error =      ex
+			self.ErrorAtEnd = tokenStream.AtEnd
+
+
+def _ParseSegment(content: Union[str, bytes], groups: bool, encoding: str) -> _SegmentResult:
+	"""Parse a segment and serialize its chains. This function is executed by a worker process."""
+	parser = _SegmentParser(content, groups, encoding)
+	result = _SegmentResult()
+
+	result.Data =       Dump(parser.Tokens[0], parser.Blocks[0] if parser.Blocks else None)
+	result.ErrorAtEnd = parser.ErrorAtEnd
+	result.AtTopLevel = parser.AtTopLevel
+	if parser.Groups:
+		result.Groups =     _DumpGroups(parser.Groups, parser.Blocks[0])
+		result.GroupCount = len(parser.Groups)
+
+	error = parser.Error
+	if isinstance(error, TokenizerException):
+		position =     error.Position
+		result.Error = (error.__class__, error.Message, (position.Row, position.Column, position.Absolute))
+	elif isinstance(error, BlockParserException):
+		result.Error = (error.__class__, error.Message, _ChainIndex(parser.Tokens[0], error.Token, "NextToken"))
+	elif isinstance(error, GroupParserException):
+		result.Error = (error.__class__, error.Message, _ChainIndex(parser.Blocks[0], error.Block, "NextBlock"))
+	elif error is not None:
+		result.Failure = error
+
+	return result
+
+
+def _TokenizeSegment(content: Union[str, bytes], encoding: str) -> _SegmentResult:
+	"""Tokenize a segment and serialize its token chain. This function is executed by a worker process."""
+	result = _SegmentResult()
+	tokens = []
+	try:
+		tokens.extend(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True, encoding=encoding))
+		# A linefeed after some characters, e.g. '.', isn't emitted as a linebreak token. Then, the whitespace at the start of
+		# the next line is a space token instead of an indentation token.
+		result.AtTopLevel = isinstance(tokens[-2], (LinebreakToken, SingleLineCommentToken))
+	except TokenizerException as ex:
+		position =          ex.Position
+		result.Error =      (ex.__class__, ex.Message, (position.Row, position.Column, position.Absolute))
+		result.ErrorAtEnd = position.Absolute >= len(content)
+
+	result.Data = Dump(tokens[0])
+	return result
+
+
+def _FindBoundaries(content: Union[str, bytes], segmentLength: int) -> List[int]:
+	"""Returns start offsets of segments with at least ``segmentLength`` characters and the length of the content."""
+	search =     (_BOUNDARY if isinstance(content, str) else _BYTES_BOUNDARY).search
+	boundaries = [0]
+	match =      search(content, segmentLength)
+	while match is not None:
+		boundaries.append(match.start())
+		match = search(content, match.start() + segmentLength)
+
+	boundaries.append(len(content))
+	return boundaries
+
+
+def _FindLineBoundaries(content: Union[str, bytes], segmentLength: int) -> List[int]:
+	"""Returns start offsets of lines, which start segments of at least ``segmentLength`` characters, and the length of the content."""
+	find =       content.find
+	linefeed =   "\n" if isinstance(content, str) else b"\n"
+	boundaries = [0]
+	linebreak =  find(linefeed, segmentLength - 1)
+	while (linebreak != -1) and (linebreak + 1 < len(content)):
+		boundaries.append(linebreak + 1)
+		linebreak = find(linefeed, linebreak + segmentLength)
+
+	boundaries.append(len(content))
+	return boundaries
+
+
+def _MergeSegments(boundaries: List[int], results: Dict[Tuple[int, int], _SegmentResult]) -> Optional[List[int]]:
+	"""
+	Check all boundaries in document order. A segment, which doesn't end at top-level, is merged with the next segment.
+
+	Segments after a merged segment are checked too, but their result depends on the merged segment.
+
+	:returns: New boundaries or ``None``, if all boundaries up to the last segment or up to an error are valid.
+	"""
+	merged =    [boundaries[0]]
+	confirmed = True
+	index =     0
+	while index < len(boundaries) - 1:
+		end =     boundaries[index + 1]
+		segment = results[(boundaries[index], end)]
+		if (end == boundaries[-1]) or segment.Stops:
+			if confirmed:
+				return None
+			merged.extend(boundaries[index + 1:])
+			break
+		elif segment.AtTopLevel:
+			merged.append(end)
+			index += 1
+		else:
+			confirmed = False
+			merged.append(boundaries[index + 2])
+			index += 2
+
+	return merged
+
+
+def _ParseSegments(content: Union[str, bytes], boundaries: List[int], mapper: Callable, worker: Callable, *arguments) -> Tuple[List[int], Dict[Tuple[int, int], _SegmentResult]]:
+	"""
+	Parse segments by calling ``worker`` via ``mapper`` and merge them, until all boundaries are valid. Results are reused
+	by merge rounds.
+	"""
+	results: Dict[Tuple[int, int], _SegmentResult] = {}
+	while True:
+		pending =  [segment for segment in zip(boundaries, boundaries[1:]) if segment not in results]
+		segments = [content[start:end] for start, end in pending]
+		results.update(zip(pending, mapper(worker, segments, *(repeat(argument) for argument in arguments))))
+
+		merged = _MergeSegments(boundaries, results)
+		if merged is None:
+			return boundaries, results
+		boundaries = merged
+
+
+def _Stitch(content: Union[str, bytes], boundaries: List[int], results: Dict[Tuple[int, int], _SegmentResult]) -> ParallelDocument:
+	"""Rebuild and link the chains of all segments up to the last segment or up to the first error."""
+	sourceIndex = SourceCodeIndex(content)
+	segments =    []
+	allTokens =   []
+	allBlocks =   []
+	allGroups =   []
+	error =       None
+
+	for start, end in zip(boundaries, boundaries[1:]):
+		result =    results[(start, end)]
+		isFirst =   start == 0
+		isLast =    (end == len(content)) or result.Stops
+		rowOffset = sourceIndex.GetPosition(start + 1).Row - 1
+		segments.append((start, end))
+		if result.Failure is not None:
+			raise result.Failure
+
+		tokens, blocks = _LoadChains(_Columns(result.Data), sourceIndex, start, rowOffset)
+		groups =         _LoadGroups(result.Groups, blocks)
+		emitted =        groups[:result.GroupCount]
+
+		if result.Error is not None:
+			exceptionClass, message, location = result.Error
+			if issubclass(exceptionClass, TokenizerException):
+				row, column, absolute = location
+				error = exceptionClass(message, SourceCodePosition(row + rowOffset, column, absolute + start))
+			elif issubclass(exceptionClass, BlockParserException):
+				error = exceptionClass(message, None if location is None else tokens[location])
+			else:
+				error = exceptionClass(message, None if location is None else blocks[location])
+
+		if not isLast:
+			# The end of document token, block and group of a segment are followed by the next segment.
+			del tokens[-1]
+			if blocks:
+				del blocks[-1]
+			if emitted and isinstance(emitted[-1], EndOfDocumentGroup):
+				del emitted[-1]
+
+		if not isFirst:
+			# The start of document token, block and group of a segment follow the previous segment. A segment, which failed
+			# early, might have no other tokens or blocks.
+			del tokens[0]
+			nextToken =               tokens[0] if tokens else None
+			allTokens[-1].NextToken = nextToken
+			if nextToken is not None:
+				nextToken._previousToken = allTokens[-1]
+
+			del blocks[:1]
+			if allBlocks:
+				nextBlock =               blocks[0] if blocks else None
+				allBlocks[-1].NextBlock = nextBlock
+				if nextBlock is not None:
+					nextBlock._previousBlock = allBlocks[-1]
+
+			if emitted:
+				_LinkGroups(allGroups, groups)
+				del emitted[0]
+
+		allTokens.extend(tokens)
+		allBlocks.extend(blocks)
+		allGroups.extend(emitted)
+		if isLast:
+			break
+
+	return ParallelDocument(content, segments, allTokens, allBlocks, allGroups, error)
+
+
+def _LinkGroups(allGroups: List[Group], groups: List[Group]) -> None:
+	"""Replace the start of document group of a segment by the start of document group and the last group of all previous segments."""
+	startGroup =        allGroups[0]
+	lastGroup =         allGroups[-1]
+	segmentStartGroup = groups[0]
+
+	for group in groups:
+		if group._previousGroup is segmentStartGroup:
+			group._previousGroup = lastGroup
+	lastGroup.NextGroup = segmentStartGroup.NextGroup
+
+	if startGroup.InnerGroup is None:
+		startGroup.InnerGroup = segmentStartGroup.InnerGroup
+	for cls, members in segmentStartGroup._subGroups.items():
+		startGroup._subGroups[cls].extend(members)
+
+
+@export
+def ParseInParallel(
+	content: Union[str, bytes],
+	maxWorkers: Optional[int] = None,
+	segmentLength: Optional[int] = None,
+	groups: bool = True,
+	encoding: str = "utf-8"
+) -> ParallelDocument:
+	"""
+	Tokenize and parse a document into blocks and groups by splitting it at design unit boundaries.
+
+	Segments are parsed in worker processes and stitched into chains, which equal the chains of a sequential parse. Tokens
+	are created in *lazy position* mode and share a :class:`~pyVHDLParser.SourceCodeIndex` over ``content``.
+
+	:param content:       VHDL source code as a string or as bytes.
+	:param maxWorkers:    Number of worker processes. By default, one per CPU. If 1, segments are parsed in this process.
+	:param segmentLength: Minimal length of a segment. By default, a document is split into about 4 segments per worker,
+	                      but segments are at least :data:`MIN_SEGMENT_LENGTH` characters long.
+	:param groups:        If true, blocks are also parsed into groups.
+	:param encoding:      Encoding of ``content``, if it's given as bytes.
+	:returns:             Chains and segments of the document. Parser errors are kept in :attr:`ParallelDocument.Error`.
+	"""
+	maxWorkers = (cpu_count() or 1) if maxWorkers is None else maxWorkers
+	if segmentLength is None:
+		segmentLength = max(MIN_SEGMENT_LENGTH, len(content) // (maxWorkers * 4) + 1)
+
+	boundaries = [0, len(content)] if maxWorkers == 1 else _FindBoundaries(content, segmentLength)
+	if len(boundaries) <= 2:
+		# Without a split, the chains don't need to be serialized.
+		parser = _SegmentParser(content, groups, encoding)
+		if (parser.Error is not None) and not isinstance(parser.Error, ParserException):
+			raise parser.Error
+		return ParallelDocument(content, [(0, len(content))], parser.Tokens, parser.Blocks, parser.Groups, parser.Error)
+
+	with ProcessPoolExecutor(max_workers=maxWorkers, initializer=InitializeBlocks) as executor:
+		boundaries, results = _ParseSegments(content, boundaries, executor.map, _ParseSegment, groups, encoding)
+
+	return _Stitch(content, boundaries, results)
+
+
+@export
+def TokenizeInParallel(
+	content: Union[str, bytes],
+	maxWorkers: Optional[int] = None,
+	segmentLength: Optional[int] = None,
+	encoding: str = "utf-8"
+) -> ParallelDocument:
+	"""
+	Tokenize a document in parallel worker processes by splitting it into segments at line starts.
+
+	At a line start, the tokenizer has no state except for an open multi-line comment or string, or a linefeed, which
+	wasn't emitted as a linebreak token. Then, the preceding segment ends with a tokenizer error at its end or without a
+	linebreak token and is merged with the next segment. Thus, the token chain equals the token chain of a sequential
+	tokenization. Tokens are created in *lazy position* mode and share a
+	:class:`~pyVHDLParser.SourceCodeIndex` over ``content``.
+
+	:param content:       VHDL source code as a string or as bytes.
+	:param maxWorkers:    Number of worker processes. By default, one per CPU. If 1, the document is tokenized in this
+	                      process.
+	:param segmentLength: Minimal length of a segment. By default, a document is split into about 4 segments per worker,
+	                      but segments are at least :data:`MIN_SEGMENT_LENGTH` characters long.
+	:param encoding:      Encoding of ``content``, if it's given as bytes.
+	:returns:             Token chain and segments of the document. Blocks and groups are empty. A tokenizer error is kept
+	                      in :attr:`ParallelDocument.Error`.
+	"""
+	maxWorkers = (cpu_count() or 1) if maxWorkers is None else maxWorkers
+	if segmentLength is None:
+		segmentLength = max(MIN_SEGMENT_LENGTH, len(content) // (maxWorkers * 4) + 1)
+
+	boundaries = [0, len(content)] if maxWorkers == 1 else _FindLineBoundaries(content, segmentLength)
+	if len(boundaries) <= 2:
+		tokens = []
+		error =  None
+		try:
+			tokens.extend(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True, encoding=encoding))
+		except TokenizerException as ex:
+			error = ex
+		return ParallelDocument(content, [(0, len(content))], tokens, [], [], error)
+
+	with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+		boundaries, results = _ParseSegments(content, boundaries, executor.map, _TokenizeSegment, encoding)
+
+	return _Stitch(content, boundaries, results)
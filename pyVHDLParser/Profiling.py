@@ -0,0 +1,234 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+Count and time the states of the token-to-block and block-to-group parsers.
+
+A :class:`StateProfiler` is passed to :class:`~pyVHDLParser.Blocks.TokenToBlockParser` and/or
+:class:`~pyVHDLParser.Groups.BlockToGroupParser`. Each execution of a ``state*`` method is counted and timed per state
+and per block or group class. This shows, which grammar constructs dominate the runtime for a code base.
+
+.. code-block:: Python
+
+   profiler =    StateProfiler()
+   blockStream = TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer(content), profiler=profiler)()
+   for group in BlockToGroupParser(blockStream, profiler=profiler)():
+     pass
+
+   print(profiler.Report(limit=20))
+   profiler.WritePStats("states.pstats")   # python -m pstats states.pstats
+"""
+from marshal                 import dump
+from pathlib                 import Path
+from time                    import perf_counter_ns
+from typing                  import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+from pyTooling.Decorators    import export
+from pyTooling.MetaClasses   import ExtendedType
+
+
+@export
+class StateStatistics(metaclass=ExtendedType, useSlots=True):
+	"""Accumulated executions of a state or of all states of a class."""
+
+	Name:      str  #: Name of the state, e.g. ``Entity.NameBlock.stateEntityKeyword``, or of the class.
+	Count:     int  #: Number of executions.
+	TotalTime: int  #: Accumulated time in nanoseconds including nested executions of other states.
+	OwnTime:   int  #: Accumulated time in nanoseconds excluding nested executions of other states.
+
+	def __init__(self, name: str, count: int = 0, totalTime: int = 0, ownTime: int = 0):
+		self.Name =      name
+		self.Count =     count
+		self.TotalTime = totalTime
+		self.OwnTime =   ownTime
+
+	def __str__(self) -> str:
+		return f"{self.Name}: {self.Count} calls, {self.OwnTime / 1e6:.3f} ms"
+
+
+def _ClassName(cls: type) -> str:
+	"""Returns a class name prefixed with the last part of its module name, e.g. ``Entity.NameBlock``."""
+	return f"{cls.__module__.rpartition('.')[2]}.{cls.__qualname__}"
+
+
+def _StateName(state: Callable) -> str:
+	"""Returns the name of a state, e.g. ``Entity.NameBlock.stateEntityKeyword``."""
+	# A classmethod state is named by the class it's bound to, which can be a subclass of the defining class.
+	owner = getattr(state, "__self__", None)
+	if isinstance(owner, type):
+		return f"{_ClassName(owner)}.{state.__name__}"
+	return f"{state.__module__.rpartition('.')[2]}.{state.__qualname__}"
+
+
+def _StateClassName(state: Callable) -> str:
+	"""Returns the name of the class of a state, e.g. ``Entity.NameBlock``."""
+	owner = getattr(state, "__self__", None)
+	if isinstance(owner, type):
+		return _ClassName(owner)
+	return f"{state.__module__.rpartition('.')[2]}.{state.__qualname__.rpartition('.')[0]}".rstrip(".")
+
+
+@export
+class StateProfiler(metaclass=ExtendedType, useSlots=True):
+	"""
+	Collects execution counts and durations of parser states.
+
+	States are usually classmethods, but plain functions are supported too. A state inherited from a base class is accounted to the class it was called on. When a
+	block-to-group state pulls blocks from the token-to-block parser, the executed block states are nested. Their time is
+	included in the group state's total time, but not in its own time.
+	"""
+
+	_counts: Dict[Callable, int]  #: Number of executions per (bound) state.
+	_total:  Dict[Callable, int]  #: Time including nested states per state in nanoseconds.
+	_own:    Dict[Callable, int]  #: Time excluding nested states per state in nanoseconds.
+	_nested: int                  #: Time of nested states within the current state in nanoseconds.
+
+	def __init__(self):
+		self._counts = {}
+		self._total =  {}
+		self._own =    {}
+		self._nested = 0
+
+	def Call(self, state: Callable[[Any], Any], parserState: Any) -> Any:
+		"""
+		Execute and measure a parser state. This method is called by the parsers.
+
+		:param state:       A bound ``state*`` classmethod.
+		:param parserState: The parser passed to the state.
+		:returns:           The state's return value.
+		"""
+		outerNested =  self._nested
+		self._nested = 0
+		start =        perf_counter_ns()
+		try:
+			return state(parserState)
+		finally:
+			duration =     perf_counter_ns() - start
+			own =          duration - self._nested
+			self._nested = outerNested + duration
+
+			if state in self._counts:
+				self._counts[state] += 1
+				self._total[state] +=  duration
+				self._own[state] +=    own
+			else:
+				self._counts[state] = 1
+				self._total[state] =  duration
+				self._own[state] =    own
+
+	def Clear(self) -> None:
+		"""Remove all collected data."""
+		self._counts.clear()
+		self._total.clear()
+		self._own.clear()
+		self._nested = 0
+
+	def __len__(self) -> int:
+		"""Returns the number of executed states."""
+		return len(self._counts)
+
+	@property
+	def Count(self) -> int:
+		"""Returns the number of all state executions."""
+		return sum(self._counts.values())
+
+	def _Statistics(self, key: Callable[[Callable], str]) -> List[StateStatistics]:
+		statistics: Dict[str, StateStatistics] = {}
+		for state, count in self._counts.items():
+			name = key(state)
+			entry = statistics.get(name)
+			if entry is None:
+				entry = statistics[name] = StateStatistics(name)
+			entry.Count +=     count
+			entry.TotalTime += self._total[state]
+			entry.OwnTime +=   self._own[state]
+
+		return sorted(statistics.values(), key=lambda entry: (-entry.OwnTime, entry.Name))
+
+	def GetStateStatistics(self) -> List[StateStatistics]:
+		"""Returns statistics per state sorted by descending own time."""
+		return self._Statistics(_StateName)
+
+	def GetClassStatistics(self) -> List[StateStatistics]:
+		"""Returns statistics per block or group class sorted by descending own time."""
+		return self._Statistics(_StateClassName)
+
+	def GetUnusedStates(self, classes: Iterable[type]) -> List[str]:
+		"""
+		Returns states of the given classes, which were never executed.
+
+		States are looked up in ``__STATES__`` of each class, which is filled by :class:`~pyVHDLParser.Blocks.MetaBlock`
+		and :class:`~pyVHDLParser.Groups.MetaGroup`.
+
+		:param classes: Block or group classes, e.g. :attr:`MetaBlock.BLOCKS <pyVHDLParser.Blocks.MetaBlock.BLOCKS>`.
+		:returns:       Sorted names of unused states.
+		"""
+		used = {getattr(state, "__func__", state) for state in self._counts}
+		return sorted(
+			f"{_ClassName(cls)}.{state.__name__}"
+			for cls in classes
+			for state in (cls.__STATES__ or ())
+			if state not in used
+		)
+
+	def Report(self, limit: int = None, perClass: bool = False) -> str:
+		"""
+		Format statistics as a table sorted by descending own time.
+
+		:param limit:    Maximum number of rows.
+		:param perClass: If true, report per block or group class instead of per state.
+		:returns:        A multi-line string.
+		"""
+		statistics = self.GetClassStatistics() if perClass else self.GetStateStatistics()
+		ownTime =    sum(entry.OwnTime for entry in statistics) or 1
+
+		lines = [f"{'calls':>10} {'own [ms]':>10} {'own [%]':>8} {'total [ms]':>11}  {'class' if perClass else 'state'}"]
+		for entry in statistics[:limit]:
+			lines.append(f"{entry.Count:>10} {entry.OwnTime / 1e6:>10.3f} {entry.OwnTime * 100 / ownTime:>8.1f} {entry.TotalTime / 1e6:>11.3f}  {entry.Name}")
+
+		return "\n".join(lines)
+
+	def GetPStats(self) -> Dict[Tuple[str, int, str], Tuple[int, int, float, float, Dict]]:
+		"""Returns statistics per state in the raw format of :mod:`pstats`, but without callers."""
+		stats = {}
+		for state, count in self._counts.items():
+			code = getattr(state, "__func__", state).__code__
+			key =  (code.co_filename, code.co_firstlineno, _StateName(state))
+			stats[key] = (count, count, self._own[state] / 1e9, self._total[state] / 1e9, {})
+
+		return stats
+
+	def WritePStats(self, file: Union[Path, str]) -> None:
+		"""
+		Write statistics per state into a file, which can be loaded by :class:`pstats.Stats` or tools like *snakeviz*.
+
+		:param file: Path of the output file.
+		"""
+		with Path(file).open("wb") as fileHandle:
+			dump(self.GetPStats(), fileHandle)
@@ -0,0 +1,201 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+A persistent, size-bounded cache for parse results.
+
+Entries are pickled into a cache directory. An entry's key is a digest of the source file's content, the pyVHDLParser
+version and all parser options, so a changed file, an updated parser or different options never return a stale result.
+If the cache grows beyond its size limit, the least recently used entries are removed.
+"""
+from hashlib                import sha256
+from os                     import getpid, utime
+from pathlib                import Path
+from pickle                 import dumps, loads, HIGHEST_PROTOCOL
+from typing                 import Any, Dict, Optional, Union
+
+from pyTooling.Decorators   import export
+from pyTooling.MetaClasses  import ExtendedType
+
+from pyVHDLParser           import __version__
+
+
+@export
+class ParseCache(metaclass=ExtendedType, useSlots=True):
+	"""
+	On-disk cache of parse results with least-recently-used eviction.
+
+	Entries are stored as ``<directory>/<key[:2]>/<key>.pickle``. The modification time of an entry file records its last
+	use. Usage and size bookkeeping is done by the process owning the cache instance.
+	"""
+
+	SUFFIX = ".pickle"
+
+	_directory:  Path
+	_maxSize:    int
+	_sizes:      Dict[Path, int]
+	_size:       int
+	_hits:       int
+	_misses:     int
+
+	def __init__(self, directory: Union[Path, str], maxSize: int = 64 * 1024**2):
+		"""
+		:param directory: Cache directory. It's created if it doesn't exist.
+		:param maxSize:   Maximum accumulated size of all entries in bytes.
+		"""
+		self._directory = Path(directory)
+		self._maxSize =   maxSize
+		self._hits =      0
+		self._misses =    0
+
+		self._directory.mkdir(parents=True, exist_ok=True)
+		self._sizes = {entry: entry.stat().st_size for entry in self._directory.glob(f"*/*{self.SUFFIX}")}
+		self._size =  sum(self._sizes.values())
+
+	@property
+	def Directory(self) -> Path:
+		return self._directory
+
+	@property
+	def MaxSize(self) -> int:
+		return self._maxSize
+
+	@property
+	def Size(self) -> int:
+		"""Returns the accumulated size of all entries in bytes."""
+		return self._size
+
+	@property
+	def Hits(self) -> int:
+		return self._hits
+
+	@property
+	def Misses(self) -> int:
+		return self._misses
+
+	def __len__(self) -> int:
+		return len(self._sizes)
+
+	@staticmethod
+	def Key(content: Union[str, bytes], **options: Any) -> str:
+		"""
+		Compute a cache key from a source file's content, the pyVHDLParser version and all parser options.
+
+		A string is hashed by its UTF-8 encoding, thus it has the same key as the UTF-8 encoded file content.
+
+		:param content: Content of a source file as string or as bytes.
+		:param options: Options influencing the parse result. Values must have a stable :func:`repr`.
+		:returns:       Hexadecimal digest.
+		"""
+		optionDigest = sha256(repr(sorted(options.items())).encode("utf-8")).digest()
+
+		digest = sha256()
+		digest.update(__version__.encode("utf-8"))
+		digest.update(optionDigest)
+		digest.update(content.encode("utf-8", errors="surrogatepass") if isinstance(content, str) else content)
+		return digest.hexdigest()
+
+	def _EntryPath(self, key: str) -> Path:
+		return self._directory / key[:2] / (key + self.SUFFIX)
+
+	def Get(self, key: str) -> Optional[Any]:
+		"""
+		Load a cached result and mark it as recently used.
+
+		Unreadable or corrupt entries are removed and reported as a miss.
+
+		:param key: Cache key computed by :meth:`Key`.
+		:returns:   The cached result or ``None``.
+		"""
+		entry = self._EntryPath(key)
+		try:
+			result = loads(entry.read_bytes())
+		except FileNotFoundError:
+			self._misses += 1
+			return None
+		except Exception:
+			self._Remove(entry)
+			self._misses += 1
+			return None
+
+		try:
+			utime(entry)
+		except OSError:
+			pass
+
+		self._hits += 1
+		return result
+
+	def Put(self, key: str, result: Any) -> None:
+		"""
+		Store a result and evict least recently used entries, if the cache exceeds its size limit.
+
+		:param key:    Cache key computed by :meth:`Key`.
+		:param result: A picklable result.
+		"""
+		data =  dumps(result, protocol=HIGHEST_PROTOCOL)
+		entry = self._EntryPath(key)
+		entry.parent.mkdir(exist_ok=True)
+
+		# Write to a temporary file first, so concurrent readers never see a partially written entry.
+		temporary = entry.with_suffix(f".{getpid()}.tmp")
+		temporary.write_bytes(data)
+		temporary.replace(entry)
+
+		self._size += len(data) - self._sizes.get(entry, 0)
+		self._sizes[entry] = len(data)
+
+		if self._size > self._maxSize:
+			self.Evict()
+
+	def Evict(self) -> None:
+		"""Remove least recently used entries until the cache fits into its size limit."""
+		def lastUsed(entry: Path) -> float:
+			try:
+				return entry.stat().st_mtime
+			except OSError:
+				return 0.0
+
+		for entry in sorted(self._sizes, key=lastUsed):
+			if self._size <= self._maxSize:
+				break
+			self._Remove(entry)
+
+	def Clear(self) -> None:
+		"""Remove all entries."""
+		for entry in list(self._sizes):
+			self._Remove(entry)
+
+	def _Remove(self, entry: Path) -> None:
+		try:
+			entry.unlink()
+		except OSError:
+			pass
+
+		self._size -= self._sizes.pop(entry, 0)
@@ -0,0 +1,547 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+A dependency graph of design units across source files and the analysis order of these files.
+
+Dependencies are extracted from the block stream of each file:
+
+* ``use`` clauses reference a package (or another primary unit) of a library,
+* context references (``context work.ctx;``) reference a context,
+* architectures depend on their entity, package bodies on their package and configurations on their entity.
+
+A ``library``, ``use`` or ``context`` clause before a design unit and within a design unit applies to this design unit.
+If the block parser fails, e.g. at a context reference, which isn't supported by the block parser, all design units and
+references of the file are collected by an outline scan (see :mod:`pyVHDLParser.Outline`) instead. A file, which couldn't
+be read or tokenized completely, isn't placed in the analysis order (see :meth:`DependencyGraph.GetUnresolvedFiles`).
+Dependencies per file are memoized. When :meth:`DependencyGraph.Update` is called again, only added or modified files
+are read and parsed (in parallel by a pool of worker processes) and only these files and all files depending on them
+are returned for re-analysis.
+
+.. code-block:: Python
+
+   from pyVHDLParser.Project.Dependency import DependencyGraph
+
+   graph = DependencyGraph()
+   graph.AddFiles(Path("ip").glob("**/*.vhdl"), library="ip")
+   for file in graph.Update():
+     print(f"analyze {file}")
+"""
+from concurrent.futures             import ProcessPoolExecutor
+from heapq                          import heapify, heappop, heappush
+from os                             import cpu_count
+from pathlib                        import Path
+from typing                         import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from pyTooling.Decorators           import export
+from pyTooling.MetaClasses          import ExtendedType
+
+from pyVHDLParser.Base              import ExceptionBase
+from pyVHDLParser.Outline           import OutlineKind, ScanOutline
+from pyVHDLParser.Token.Keywords    import IdentifierToken, BodyKeyword
+from pyVHDLParser.Token.Parser      import Tokenizer, TokenizerException
+from pyVHDLParser.Blocks            import TokenToBlockParser, BlockParserException, InitializeBlocks
+from pyVHDLParser.Blocks.Reference  import Context, Library, Use
+from pyVHDLParser.Blocks.Sequential import Package, PackageBody
+from pyVHDLParser.Blocks.Structural import Entity, Architecture, Configuration
+from pyVHDLParser.Project           import DesignUnitSummary, Diagnostic, ParserStage, FileResult, _DESIGN_UNIT_NAME_BLOCKS, _DESIGN_UNIT_KEYWORDS, _PARSER_OPTIONS, _ReadFile, _TokenPosition
+
+
+#: Kinds of design units, which can be referenced by their name.
+PRIMARY_UNITS = ("entity", "package", "configuration", "context")
+
+_DESIGN_UNIT_END_BLOCKS = (Entity.EndBlock, Architecture.EndBlock, Package.EndBlock, PackageBody.EndBlock, Context.EndBlock, Configuration.EndBlock)
+
+#: Key of a primary unit: lower-cased library name and unit name.
+UnitKey = Tuple[str, str]
+
+
+@export
+class DependencyCycleError(ExceptionBase):
+	"""Raised, if source files depend on each other, so no analysis order exists."""
+
+	Files: List[Path]  #: Files forming the cycle. The first file depends on the second, ..., the last on the first.
+
+	def __init__(self, files: List[Path]):
+		super().__init__(f"Dependency cycle: {' -> '.join(str(file) for file in files + files[:1])}")
+		self.Files = files
+
+
+@export
+class UnitDependencies(metaclass=ExtendedType, useSlots=True):
+	"""A design unit and the names it references."""
+
+	Unit:       DesignUnitSummary  #: The design unit.
+	Libraries:  List[str]          #: Lower-cased library names of ``library`` clauses.
+	References: List[UnitKey]      #: Referenced primary units. The library ``work`` isn't resolved yet.
+
+	def __init__(self, unit: DesignUnitSummary, libraries: List[str], references: List[UnitKey]):
+		self.Unit =       unit
+		self.Libraries =  libraries
+		self.References = references
+
+	def __str__(self) -> str:
+		return f"{self.Unit} -> {', '.join(f'{library}.{name}' for library, name in self.References)}"
+
+
+@export
+class FileDependencies(metaclass=ExtendedType, useSlots=True):
+	"""Picklable result of extracting design units and their references from a single source file."""
+
+	File:        Path                    #: Path to the source file.
+	Units:       List[UnitDependencies]  #: Design units in order of appearance.
+	Diagnostics: List[Diagnostic]        #: Diagnostics reported while parsing the file.
+	Complete:    bool                    #: False, if design units after a read or tokenizer error might be missing.
+
+	def __init__(self, file: Path):
+		self.File =        file
+		self.Units =       []
+		self.Diagnostics = []
+		self.Complete =    True
+
+	def __str__(self) -> str:
+		return f"{self.File}: {len(self.Units)} design units, {len(self.Diagnostics)} diagnostics"
+
+
+def _Identifiers(block) -> List[str]:
+	return [token.Value.lower() for token in block if isinstance(token, IdentifierToken)]
+
+
+def _ExtractContent(file: Path, content: Union[str, bytes]) -> FileDependencies:
+	"""
+	Collect design units and their ``library`` and ``use`` clauses from the block stream of a source file.
+
+	If the block parser fails, design units and clauses are collected by :func:`_ScanContent` instead.
+	"""
+	InitializeBlocks()
+
+	result =     FileDependencies(file)
+	libraries =  []    # clauses of the current or the next design unit
+	references = []
+	kind =       None  # kind, names and row of the current design unit
+	names =      []
+	row =        0
+
+	try:
+		for block in TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer(content, encoding=_PARSER_OPTIONS["encoding"]))():
+			if isinstance(block, Use.ReferenceNameBlock):
+				identifiers = _Identifiers(block)
+				if len(identifiers) >= 2:
+					references.append((identifiers[0], identifiers[1]))
+			elif isinstance(block, Library.LibraryNameBlock):
+				libraries.extend(_Identifiers(block))
+			elif isinstance(block, _DESIGN_UNIT_NAME_BLOCKS):
+				for token in block:
+					if token.__class__ in _DESIGN_UNIT_KEYWORDS:
+						if kind is not None:
+							_AddUnit(result, kind, names, row, libraries, references)
+							libraries, references = [], []
+						kind =  _DESIGN_UNIT_KEYWORDS[token.__class__]
+						names = []
+						row =   token.Start.Row
+					elif isinstance(token, BodyKeyword) and kind == "package":
+						kind = "package body"
+					elif isinstance(token, IdentifierToken) and kind is not None:
+						names.append(token.Value)
+			elif isinstance(block, _DESIGN_UNIT_END_BLOCKS) and kind is not None:
+				_AddUnit(result, kind, names, row, libraries, references)
+				libraries, references = [], []
+				kind = None
+	except TokenizerException as ex:
+		result.Diagnostics.append(Diagnostic(ParserStage.Tokenizer, ex.Message, ex.Position))
+		result.Complete = False
+	except BlockParserException as ex:
+		result.Diagnostics.append(Diagnostic(ParserStage.Blocks, ex.Message, _TokenPosition(ex.Token)))
+		result.Units.clear()
+		_ScanContent(result, content)
+		return result
+
+	if kind is not None:
+		_AddUnit(result, kind, names, row, libraries, references)
+
+	return result
+
+
+def _ScanContent(result: FileDependencies, content: Union[str, bytes]) -> None:
+	"""
+	Collect design units, their clauses and context references by an outline scan of a source file.
+
+	The outline scan doesn't check the syntax, so it collects design units after a syntax error or after constructs, which
+	aren't supported by the block parser.
+	"""
+	libraries =  []    # clauses of the current or the next design unit
+	references = []
+	kind =       None  # kind, names and row of the current design unit
+	names =      []
+	row =        0
+
+	try:
+		for item in ScanOutline(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True, encoding=_PARSER_OPTIONS["encoding"]), comments=False):
+			if item.Kind is OutlineKind.Library:
+				libraries.extend(name.lower() for name in item.Names)
+			elif item.Kind is OutlineKind.Use or item.Kind is OutlineKind.ContextReference:
+				for name in item.Names:
+					parts = name.lower().split(".")
+					if len(parts) >= 2:
+						references.append((parts[0], parts[1]))
+			elif item.Kind is OutlineKind.EndOfDesignUnit:
+				if kind is not None:
+					_AddUnit(result, kind, names, row, libraries, references)
+					libraries, references = [], []
+					kind = None
+			else:
+				if kind is not None:
+					_AddUnit(result, kind, names, row, libraries, references)
+					libraries, references = [], []
+
+				row = item.Start.Row
+				if item.Kind is OutlineKind.PackageInstantiation:
+					# A package instantiation is a package, which references its uninstantiated package.
+					parts = item.Names[1].lower().split(".") if len(item.Names) > 1 else []
+					if len(parts) >= 2:
+						references.append((parts[0], parts[1]))
+					_AddUnit(result, "package", list(item.Names[:1]), row, libraries, references)
+					libraries, references = [], []
+					kind = None
+				else:
+					kind =  item.Kind.value
+					names = list(item.Names)
+	except TokenizerException as ex:
+		result.Diagnostics.append(Diagnostic(ParserStage.Tokenizer, ex.Message, ex.Position))
+		result.Complete = False
+
+	if kind is not None:
+		_AddUnit(result, kind, names, row, libraries, references)
+
+
+def _AddUnit(result: FileDependencies, kind: str, names: List[str], row: int, libraries: List[str], references: List[UnitKey]) -> None:
+	if len(names) > 0:
+		unit = DesignUnitSummary(kind, names[0], names[1] if len(names) > 1 else None, row)
+		result.Units.append(UnitDependencies(unit, libraries, references))
+
+
+@export
+def ExtractDependencies(file: Union[Path, str]) -> FileDependencies:
+	"""
+	Extract design units and their references from a single source file.
+
+	All parser exceptions are caught and reported as :class:`~pyVHDLParser.Project.Diagnostic`. Design units and
+	references are extracted from all blocks, which were created before an error occurred.
+
+	:param file: Path to a VHDL source file.
+	:returns:    Design units and references of the file.
+	"""
+	file =    Path(file)
+	read =    FileResult(file)
+	content = _ReadFile(read)
+	if content is None:
+		result = FileDependencies(file)
+		result.Diagnostics.extend(read.Diagnostics)
+		result.Complete = False
+		return result
+
+	return _ExtractContent(file, content)
+
+
+def _Stamp(file: Path) -> Optional[Tuple[int, int]]:
+	try:
+		status = file.stat()
+	except OSError:
+		return None
+	return status.st_mtime_ns, status.st_size
+
+
+@export
+class DependencyGraph(metaclass=ExtendedType, useSlots=True):
+	"""
+	Dependencies between source files, derived from the design units they declare and reference.
+
+	Each file is analyzed into a library. A file depends on another file, if one of its design units references a primary
+	unit declared in the other file. References to units, which aren't declared in any file of the graph (e.g. ``ieee``),
+	are collected by :meth:`GetUnresolvedReferences`. Files, whose design units couldn't be extracted completely, and all
+	files depending on them are collected by :meth:`GetUnresolvedFiles`.
+	"""
+
+	_maxWorkers:   Optional[int]
+	_libraries:    Dict[Path, str]                             #: Library per file in order of addition.
+	_extracted:    Dict[Path, Tuple[Optional[Tuple[int, int]], FileDependencies]]  #: Memoized dependencies and file stamp.
+	_declarations: Dict[UnitKey, Path]                         #: File declaring a primary unit.
+	_edges:        Dict[Path, Set[Path]]                       #: Files a file depends on.
+	_dependents:   Dict[Path, Set[Path]]                       #: Files depending on a file.
+	_unresolved:   Dict[Path, Set[UnitKey]]                    #: References, which aren't declared by a file.
+	_incomplete:   Set[Path]                                   #: Files, whose dependencies weren't extracted completely.
+	_dirty:        Set[Path]                                   #: Files to re-analyze, which weren't returned yet.
+
+	def __init__(self, maxWorkers: Optional[int] = None):
+		"""
+		:param maxWorkers: Number of worker processes for :meth:`Update`. By default, one per CPU. If 1, files are parsed in
+		                   the current process.
+		"""
+		self._maxWorkers =   (cpu_count() or 1) if maxWorkers is None else maxWorkers
+		self._libraries =    {}
+		self._extracted =    {}
+		self._declarations = {}
+		self._edges =        {}
+		self._dependents =   {}
+		self._unresolved =   {}
+		self._incomplete =   set()
+		self._dirty =        set()
+
+	def AddFile(self, file: Union[Path, str], library: str = "work") -> None:
+		"""
+		Add a source file. Dependencies are extracted by the next :meth:`Update`.
+
+		:param file:    Path to a VHDL source file.
+		:param library: Library, into which the file is analyzed.
+		"""
+		file = Path(file)
+		if self._libraries.get(file) != library.lower():
+			self._libraries[file] = library.lower()
+			self._extracted.pop(file, None)
+
+	def AddFiles(self, files: Iterable[Union[Path, str]], library: str = "work") -> None:
+		"""
+		Add many source files of the same library.
+
+		:param files:   Paths to VHDL source files.
+		:param library: Library, into which the files are analyzed.
+		"""
+		for file in files:
+			self.AddFile(file, library)
+
+	def RemoveFile(self, file: Union[Path, str]) -> None:
+		"""
+		Remove a source file. Files depending on it become unresolved by the next :meth:`Update`.
+
+		:param file: Path to a previously added VHDL source file.
+		:raises KeyError: If the file wasn't added.
+		"""
+		del self._libraries[Path(file)]
+
+	@property
+	def Files(self) -> List[Path]:
+		"""Returns all files in order of addition."""
+		return list(self._libraries)
+
+	def __len__(self) -> int:
+		return len(self._libraries)
+
+	def __getitem__(self, file: Union[Path, str]) -> FileDependencies:
+		"""Returns the extracted dependencies of a file."""
+		return self._extracted[Path(file)][1]
+
+	def Update(self) -> List[Path]:
+		"""
+		Extract dependencies of added and modified files and recompute the graph.
+
+		A file is modified, if its modification time or size changed. Dependencies of unmodified files are reused. Modified
+		files are parsed in parallel.
+
+		:returns: Modified files and all files depending on them (before or after the update) in analysis order. Unresolved
+		          files (see :meth:`GetUnresolvedFiles`) are returned by a later update, when they are resolved.
+		:raises DependencyCycleError: If files can't be ordered, because of a dependency cycle. The graph is updated anyway
+		                              and the files are returned by the next successful update.
+		"""
+		previousDependents = self._dependents
+		removed = [file for file in self._extracted if file not in self._libraries]
+		for file in removed:
+			del self._extracted[file]
+
+		modified = []
+		for file in self._libraries:
+			stamp = _Stamp(file)
+			extracted = self._extracted.get(file)
+			if extracted is None or extracted[0] != stamp or stamp is None:
+				modified.append((file, stamp))
+
+		paths = [file for file, _ in modified]
+		if self._maxWorkers == 1 or len(paths) <= 1:
+			results = [ExtractDependencies(file) for file in paths]
+		else:
+			chunkSize = max(1, len(paths) // (self._maxWorkers * 4))
+			with ProcessPoolExecutor(max_workers=self._maxWorkers, initializer=InitializeBlocks) as executor:
+				results = list(executor.map(ExtractDependencies, paths, chunksize=chunkSize))
+
+		for (file, stamp), result in zip(modified, results):
+			self._extracted[file] = (stamp, result)
+
+		self._Link()
+
+		dirty = self._dirty
+		dirty.update(paths, removed)
+		pending = list(dirty)
+		while pending:
+			file = pending.pop()
+			for dependents in (previousDependents.get(file, ()), self._dependents.get(file, ())):
+				for dependent in dependents:
+					if dependent not in dirty:
+						dirty.add(dependent)
+						pending.append(dependent)
+
+		order = self.GetAnalysisOrder(file for file in dirty if file in self._libraries)
+		dirty.intersection_update(self.GetUnresolvedFiles())
+		return order
+
+	def _Link(self) -> None:
+		"""Resolve the memoized references of all files to file dependencies."""
+		declarations = {}
+		for file, library in self._libraries.items():
+			for unitDependencies in self._extracted[file][1].Units:
+				unit = unitDependencies.Unit
+				if unit.Kind in PRIMARY_UNITS:
+					declarations.setdefault((library, unit.Name.lower()), file)
+
+		edges =      {}
+		dependents = {file: set() for file in self._libraries}
+		unresolved = {}
+		incomplete = {file for file in self._libraries if not self._extracted[file][1].Complete}
+		for file, library in self._libraries.items():
+			fileEdges =      set()
+			fileUnresolved = set()
+			for unitDependencies in self._extracted[file][1].Units:
+				unit = unitDependencies.Unit
+				keys = [(library if referenceLibrary == "work" else referenceLibrary, name) for referenceLibrary, name in unitDependencies.References]
+				if unit.Kind == "architecture" or unit.Kind == "configuration":
+					if unit.EntityName is not None:
+						keys.append((library, unit.EntityName.lower()))
+				elif unit.Kind == "package body":
+					keys.append((library, unit.Name.lower()))
+
+				for key in keys:
+					declaringFile = declarations.get(key)
+					if declaringFile is None:
+						fileUnresolved.add(key)
+					elif declaringFile != file:
+						fileEdges.add(declaringFile)
+						dependents[declaringFile].add(file)
+
+			edges[file] =      fileEdges
+			unresolved[file] = fileUnresolved
+
+		self._declarations = declarations
+		self._edges =        edges
+		self._dependents =   dependents
+		self._unresolved =   unresolved
+		self._incomplete =   incomplete
+
+	def GetDeclaringFile(self, library: str, name: str) -> Optional[Path]:
+		"""
+		Returns the file declaring a primary unit.
+
+		:param library: Library name.
+		:param name:    Name of an entity, package, configuration or context.
+		:returns:       The declaring file or ``None``.
+		"""
+		return self._declarations.get((library.lower(), name.lower()))
+
+	def GetDependencies(self, file: Union[Path, str]) -> Set[Path]:
+		"""Returns files, which a file depends on directly."""
+		return set(self._edges[Path(file)])
+
+	def GetDependents(self, file: Union[Path, str], transitive: bool = False) -> Set[Path]:
+		"""
+		Returns files depending on a file.
+
+		:param file:       Path to a VHDL source file.
+		:param transitive: If true, include files depending indirectly on the file.
+		:returns:          Set of depending files.
+		"""
+		file =       Path(file)
+		dependents = set(self._dependents[file])
+		if transitive:
+			pending = list(dependents)
+			while pending:
+				for dependent in self._dependents[pending.pop()]:
+					if dependent not in dependents:
+						dependents.add(dependent)
+						pending.append(dependent)
+
+		return dependents
+
+	def GetUnresolvedReferences(self, file: Union[Path, str]) -> Set[UnitKey]:
+		"""Returns lower-cased library and unit names referenced by a file, which aren't declared by any file of the graph."""
+		return set(self._unresolved[Path(file)])
+
+	def GetUnresolvedFiles(self) -> Set[Path]:
+		"""
+		Returns files, which couldn't be read or tokenized completely, and all files depending on them.
+
+		Design units after a read or tokenizer error are unknown, so these files can't be placed in the analysis order.
+		"""
+		files = set()
+		for file in self._incomplete:
+			files.add(file)
+			files.update(self.GetDependents(file, transitive=True))
+
+		return files
+
+	def GetAnalysisOrder(self, files: Iterable[Union[Path, str]] = None) -> List[Path]:
+		"""
+		Returns files in an order, in which each file is analyzed after all files it depends on.
+
+		The order is computed for the files known by the last :meth:`Update`. Independent files keep the order, in which
+		they were added. Unresolved files (see :meth:`GetUnresolvedFiles`) are excluded.
+
+		:param files: Optional subset of files. By default, all files.
+		:returns:     Files in analysis order.
+		:raises DependencyCycleError: If files depend on each other.
+		"""
+		linked =   list(self._edges)
+		indices =  {file: index for index, file in enumerate(linked)}
+		inDegree = {file: len(edges) for file, edges in self._edges.items()}
+		ready =    [indices[file] for file, degree in inDegree.items() if degree == 0]
+		heapify(ready)
+
+		order = []
+		while ready:
+			file = linked[heappop(ready)]
+			order.append(file)
+			for dependent in self._dependents[file]:
+				inDegree[dependent] -= 1
+				if inDegree[dependent] == 0:
+					heappush(ready, indices[dependent])
+
+		if len(order) < len(linked):
+			raise DependencyCycleError(self._FindCycle({file for file, degree in inDegree.items() if degree > 0}, indices))
+
+		unresolved = self.GetUnresolvedFiles()
+		subset =     None if files is None else {Path(file) for file in files}
+		return [file for file in order if (subset is None or file in subset) and file not in unresolved]
+
+	def _FindCycle(self, remaining: Set[Path], indices: Dict[Path, int]) -> List[Path]:
+		"""Follow dependencies among files, which couldn't be ordered, until a file repeats."""
+		path =    []
+		visited = {}
+		file =    min(remaining, key=indices.get)
+		while file not in visited:
+			visited[file] = len(path)
+			path.append(file)
+			file = min((dependency for dependency in self._edges[file] if dependency in remaining), key=indices.get)
+
+		return path[visited[file]:]
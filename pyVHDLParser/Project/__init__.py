@@ -0,0 +1,378 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+Parse many VHDL source files, e.g. a whole IP repository, on all cores.
+
+Each file is tokenized, transformed into blocks and grouped in a worker process of a
+:class:`~concurrent.futures.ProcessPoolExecutor`. Instead of token, block or group chains, a worker returns a small and
+picklable :class:`FileResult` per file, which contains a summary of the found design units, diagnostics and timings.
+
+.. code-block:: Python
+
+   from pyVHDLParser.Project import ParseFiles
+
+   for result in ParseFiles("ip/**/*.vhdl"):
+     for diagnostic in result.Diagnostics:
+       print(f"{result.File}: {diagnostic}")
+"""
+from concurrent.futures             import ProcessPoolExecutor
+from enum                           import Enum
+from glob                           import glob
+from os                             import cpu_count
+from pathlib                        import Path
+from time                           import perf_counter_ns
+from typing                         import Dict, Iterable, List, Optional, Union
+
+from pyTooling.Decorators           import export
+from pyTooling.MetaClasses          import ExtendedType
+
+from pyVHDLParser                   import SourceCodePosition
+from pyVHDLParser.Token             import Token
+from pyVHDLParser.Token.Keywords    import IdentifierToken, EntityKeyword, ArchitectureKeyword, PackageKeyword, BodyKeyword, ContextKeyword, ConfigurationKeyword
+from pyVHDLParser.Token.Parser      import Tokenizer, TokenizerException
+from pyVHDLParser.Blocks            import Block, TokenToBlockParser, BlockParserException, InitializeBlocks
+from pyVHDLParser.Blocks.Reference  import Context
+from pyVHDLParser.Blocks.Sequential import Package, PackageBody
+from pyVHDLParser.Blocks.Structural import Entity, Architecture, Configuration
+from pyVHDLParser.Groups            import BlockToGroupParser, GroupParserException
+from pyVHDLParser.Project.Cache     import ParseCache
+
+
+@export
+class ParserStage(Enum):
+	"""Processing stages of a source file."""
+
+	Read =      "read"       #: Reading the source file.
+	Tokenizer = "tokenizer"  #: Transforming characters to tokens.
+	Blocks =    "blocks"     #: Transforming tokens to blocks.
+	Groups =    "groups"     #: Transforming blocks to groups.
+
+
+@export
+class DesignUnitSummary(metaclass=ExtendedType, useSlots=True):
+	"""Kind and name of a design unit found in a source file."""
+
+	Kind:       str            #: Kind of design unit, e.g. ``entity`` or ``package body``.
+	Name:       str            #: Name of the design unit.
+	EntityName: Optional[str]  #: Name of the entity, if the design unit is an architecture.
+	Row:        int            #: Row of the design unit's first keyword.
+
+	def __init__(self, kind: str, name: str, entityName: Optional[str], row: int):
+		self.Kind =       kind
+		self.Name =       name
+		self.EntityName = entityName
+		self.Row =        row
+
+	def __eq__(self, other: 'DesignUnitSummary') -> bool:
+		return (self.Kind, self.Name, self.EntityName, self.Row) == (other.Kind, other.Name, other.EntityName, other.Row)
+
+	def __hash__(self) -> int:
+		return hash((self.Kind, self.Name, self.EntityName, self.Row))
+
+	def __str__(self) -> str:
+		if self.EntityName is not None:
+			return f"{self.Kind} {self.Name} of {self.EntityName}"
+		return f"{self.Kind} {self.Name}"
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self!s} at row {self.Row}>"
+
+
+@export
+class Diagnostic(metaclass=ExtendedType, useSlots=True):
+	"""A message reported while processing a source file."""
+
+	Stage:   ParserStage    #: Processing stage, which reported this diagnostic.
+	Message: str            #: Diagnostic message.
+	Row:     Optional[int]  #: Row of the affected source code, if known.
+	Column:  Optional[int]  #: Column of the affected source code, if known.
+
+	def __init__(self, stage: ParserStage, message: str, position: SourceCodePosition = None):
+		self.Stage =   stage
+		self.Message = message
+		if position is None:
+			self.Row =    None
+			self.Column = None
+		else:
+			self.Row =    position.Row
+			self.Column = position.Column
+
+	def __str__(self) -> str:
+		if self.Row is None:
+			return f"{self.Stage.value}: {self.Message}"
+		return f"{self.Stage.value} at {self.Row}:{self.Column}: {self.Message}"
+
+
+@export
+class FileResult(metaclass=ExtendedType, useSlots=True):
+	"""Picklable result of parsing a single source file."""
+
+	File:        Path                      #: Path to the source file.
+	DesignUnits: List[DesignUnitSummary]   #: Design units found in the file.
+	Diagnostics: List[Diagnostic]          #: Diagnostics reported while parsing the file.
+	TokenCount:  int                       #: Number of tokens.
+	BlockCount:  int                       #: Number of blocks.
+	GroupCount:  int                       #: Number of groups.
+	Timings:     Dict[ParserStage, float]  #: Duration per finished or failed stage in seconds.
+	Cached:      bool                      #: True, if this result was loaded from a :class:`~pyVHDLParser.Project.Cache.ParseCache`.
+
+	def __init__(self, file: Path):
+		self.File =        file
+		self.DesignUnits = []
+		self.Diagnostics = []
+		self.TokenCount =  0
+		self.BlockCount =  0
+		self.GroupCount =  0
+		self.Timings =     {}
+		self.Cached =      False
+
+	@property
+	def Successful(self) -> bool:
+		"""Returns true, if all stages finished without a diagnostic."""
+		return len(self.Diagnostics) == 0
+
+	@property
+	def Duration(self) -> float:
+		"""Returns the accumulated duration of all stages in seconds."""
+		return sum(self.Timings.values())
+
+	def __str__(self) -> str:
+		return f"{self.File}: {len(self.DesignUnits)} design units, {len(self.Diagnostics)} diagnostics in {self.Duration * 1000:.1f} ms"
+
+
+_DESIGN_UNIT_NAME_BLOCKS = (Entity.NameBlock, Architecture.NameBlock, Package.NameBlock, PackageBody.NameBlock, Context.NameBlock, Configuration.NameBlock)
+_DESIGN_UNIT_KEYWORDS = {
+	EntityKeyword:        "entity",
+	ArchitectureKeyword:  "architecture",
+	PackageKeyword:       "package",
+	ContextKeyword:       "context",
+	ConfigurationKeyword: "configuration"
+}
+
+#: Options of the parse pipeline, which are part of a cache key.
+_PARSER_OPTIONS = {
+	"tokenizer": "table-driven",
+	"encoding":  "utf-8",
+	"summary":   1
+}
+
+
+def _SummarizeDesignUnits(blocks: Iterable[Block]) -> List[DesignUnitSummary]:
+	"""
+	Collect kind and names of all design units from the name blocks in a block stream.
+
+	A name block can be split into multiple parts by comments and linebreaks, thus keywords and identifiers are collected
+	across all name blocks of a design unit.
+	"""
+	units = []
+	kind =  None
+	names = []
+	row =   0
+
+	for block in blocks:
+		if not isinstance(block, _DESIGN_UNIT_NAME_BLOCKS):
+			continue
+
+		for token in block:
+			if token.__class__ in _DESIGN_UNIT_KEYWORDS:
+				if kind is not None and len(names) > 0:
+					units.append(DesignUnitSummary(kind, names[0], names[1] if len(names) > 1 else None, row))
+				kind =  _DESIGN_UNIT_KEYWORDS[token.__class__]
+				names = []
+				row =   token.Start.Row
+			elif isinstance(token, BodyKeyword) and kind == "package":
+				kind = "package body"
+			elif isinstance(token, IdentifierToken) and kind is not None:
+				names.append(token.Value)
+
+	if kind is not None and len(names) > 0:
+		units.append(DesignUnitSummary(kind, names[0], names[1] if len(names) > 1 else None, row))
+
+	return units
+
+
+def _TokenPosition(token: Optional[Token]) -> Optional[SourceCodePosition]:
+	return None if token is None else token.Start
+
+
+def _ReadFile(result: FileResult) -> Optional[bytes]:
+	"""
+	Read a source file in binary mode or report a read error as diagnostic.
+
+	The content isn't decoded as a whole. The tokenizer decodes only token values, so an invalid byte sequence is reported
+	as tokenizer diagnostic with its position.
+	"""
+	try:
+		with result.File.open("rb") as fileHandle:
+			return fileHandle.read()
+	except OSError as ex:
+		result.Diagnostics.append(Diagnostic(ParserStage.Read, str(ex)))
+		return None
+
+
+def _ParseContent(file: Path, content: Union[str, bytes]) -> FileResult:
+	"""Tokenize, block and group the content of a source file."""
+	InitializeBlocks()
+
+	result = FileResult(file)
+	tokens = []
+	blocks = []
+	groups = []
+	stage =  ParserStage.Tokenizer
+	start =  perf_counter_ns()
+	try:
+		tokens.extend(Tokenizer.GetTableDrivenVHDLTokenizer(content, encoding=_PARSER_OPTIONS["encoding"]))
+		result.Timings[stage] = (perf_counter_ns() - start) / 1e9
+
+		stage = ParserStage.Blocks
+		start = perf_counter_ns()
+		for block in TokenToBlockParser(tokens)():
+			blocks.append(block)
+		result.Timings[stage] = (perf_counter_ns() - start) / 1e9
+
+		stage = ParserStage.Groups
+		start = perf_counter_ns()
+		for group in BlockToGroupParser(blocks)():
+			groups.append(group)
+		result.Timings[stage] = (perf_counter_ns() - start) / 1e9
+	except Exception as ex:
+		result.Timings[stage] = (perf_counter_ns() - start) / 1e9
+
+		if isinstance(ex, TokenizerException):
+			diagnostic = Diagnostic(stage, ex.Message, ex.Position)
+		elif isinstance(ex, BlockParserException):
+			diagnostic = Diagnostic(stage, ex.Message, _TokenPosition(ex.Token))
+		elif isinstance(ex, GroupParserException):
+			diagnostic = Diagnostic(stage, ex.Message, None if ex.Block is None else _TokenPosition(ex.Block.StartToken))
+		else:
+			diagnostic = Diagnostic(stage, f"Unexpected {ex.__class__.__name__}: {ex}")
+		result.Diagnostics.append(diagnostic)
+
+	result.TokenCount =  len(tokens)
+	result.BlockCount =  len(blocks)
+	result.GroupCount =  len(groups)
+	result.DesignUnits = _SummarizeDesignUnits(blocks)
+
+	return result
+
+
+def _CachedResult(cache: ParseCache, file: Path, key: str) -> Optional[FileResult]:
+	result = cache.Get(key)
+	if result is not None:
+		# Files with identical content share an entry.
+		result.File =   file
+		result.Cached = True
+
+	return result
+
+
+@export
+def ParseFile(file: Union[Path, str], cache: ParseCache = None) -> FileResult:
+	"""
+	Tokenize, block and group a single source file.
+
+	All exceptions are caught and reported as :class:`Diagnostic`. Design units are summarized from all blocks, which were
+	created before an error occurred.
+
+	:param file:  Path to a VHDL source file.
+	:param cache: Optional cache of parse results.
+	:returns:     Summary of the parsed file.
+	"""
+	file =    Path(file)
+	result =  FileResult(file)
+	content = _ReadFile(result)
+	if content is None:
+		return result
+
+	if cache is None:
+		return _ParseContent(file, content)
+
+	key = cache.Key(content, **_PARSER_OPTIONS)
+	result = _CachedResult(cache, file, key)
+	if result is None:
+		result = _ParseContent(file, content)
+		cache.Put(key, result)
+
+	return result
+
+
+@export
+def ParseFiles(files: Union[str, Path, Iterable[Union[Path, str]]], maxWorkers: Optional[int] = None, cache: ParseCache = None) -> List[FileResult]:
+	"""
+	Parse many source files in parallel by a pool of worker processes.
+
+	If a cache is given, files are read and looked up in the current process and only cache misses are sent to the worker
+	processes.
+
+	:param files:      A glob pattern (``**`` matches recursively) or an iterable of file paths.
+	:param maxWorkers: Number of worker processes. By default, one per CPU. If 1, files are parsed in the current process.
+	:param cache:      Optional cache of parse results.
+	:returns:          A list of results in the same order as the given (or globbed and sorted) files.
+	"""
+	if isinstance(files, (str, Path)):
+		paths = [Path(path) for path in sorted(glob(str(files), recursive=True))]
+	else:
+		paths = [Path(path) for path in files]
+
+	if maxWorkers is None:
+		maxWorkers = cpu_count() or 1
+
+	if cache is None:
+		if maxWorkers == 1 or len(paths) <= 1:
+			return [ParseFile(path) for path in paths]
+
+		chunkSize = max(1, len(paths) // (maxWorkers * 4))
+		with ProcessPoolExecutor(max_workers=maxWorkers, initializer=InitializeBlocks) as executor:
+			return list(executor.map(ParseFile, paths, chunksize=chunkSize))
+
+	results: List[Optional[FileResult]] = []
+	misses = []
+	for index, path in enumerate(paths):
+		result =  FileResult(path)
+		content = _ReadFile(result)
+		if content is not None:
+			key = cache.Key(content, **_PARSER_OPTIONS)
+			result = _CachedResult(cache, path, key)
+			if result is None:
+				misses.append((index, path, content, key))
+		results.append(result)
+
+	if maxWorkers == 1 or len(misses) <= 1:
+		parsed = [_ParseContent(path, content) for _, path, content, _ in misses]
+	else:
+		chunkSize = max(1, len(misses) // (maxWorkers * 4))
+		with ProcessPoolExecutor(max_workers=maxWorkers, initializer=InitializeBlocks) as executor:
+			parsed = list(executor.map(_ParseContent, [miss[1] for miss in misses], [miss[2] for miss in misses], chunksize=chunkSize))
+
+	for (index, _, _, key), result in zip(misses, parsed):
+		cache.Put(key, result)
+		results[index] = result
+
+	return results
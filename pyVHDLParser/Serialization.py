@@ -0,0 +1,645 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+A compact and versioned binary format for a token stream and its block stream.
+
+Pickling linked token and block chains is slow and recurses once per link. :func:`Dump` stores a document in a few flat
+columns instead: per token a kind code, the absolute start and end position and an index into a table of distinct values,
+and per block a kind code and the indices of its first and last token. :func:`Load` rebuilds the linked chains from these
+columns without running the tokenizer or the block parser. :func:`LoadTokenStore` creates a column-oriented
+:class:`~pyVHDLParser.Token.Store.TokenStore` without creating token objects at all.
+
+The serialized data can be sent to or from worker processes, or stored in a build cache. If checkpoints of the block
+parser are stored too, parsing of a changed source code can resume after the unchanged prefix by
+:meth:`SerializedDocument.Resume`.
+
+.. code-block:: Python
+
+   tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True))
+   blocks = list(TokenToBlockParser(tokens)())
+   data =   Dump(tokens[0], blocks[0])
+
+   document = Load(data)
+   for block in document.StartBlock.GetIterator():
+     print(block)
+
+All integers are stored little-endian. The data starts with a header of the magic bytes :data:`MAGIC`, the format
+version (uint16) and flags (uint16), followed by a sequence of sections. Each section is prefixed by its length in bytes
+(uint64). A column section starts with its :mod:`array` typecode (1 byte).
+"""
+from array                      import array
+from importlib                  import import_module
+from itertools                  import accumulate
+from struct                     import Struct
+from sys                        import byteorder, intern
+from typing                     import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pyTooling.Decorators       import export
+from pyTooling.MetaClasses      import ExtendedType
+
+from pyVHDLParser               import SourceCodePosition, SourceCodeIndex
+from pyVHDLParser.Base          import ExceptionBase
+from pyVHDLParser.Token         import Token, ValuedToken
+from pyVHDLParser.Token.Store   import TokenStore, NO_POSITION, NO_VALUE
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import Block, MetaBlock, BlockParserCheckpoint, TokenToBlockParser
+
+
+MAGIC =          b"pyVP"  #: Magic bytes at the start of serialized data.
+FORMAT_VERSION = 1        #: Version of the binary format written by :func:`Dump`.
+
+NO_TOKEN =       -1       #: Token index stored for a block without end token.
+
+_CONTENT_IS_BYTES = 0x0001  #: Flag: the source code buffer is bytes instead of a string.
+_HAS_BLOCKS =       0x0002  #: Flag: a block stream is stored after the token stream.
+_HAS_CHECKPOINTS =  0x0004  #: Flag: block parser checkpoints are stored after the block stream.
+
+_HEADER = Struct("<4sHH")
+_LENGTH = Struct("<Q")
+
+
+@export
+class SerializationException(ExceptionBase):
+	"""Raised if serialized data can't be loaded, e.g. because of an unsupported format version or an unknown class."""
+
+
+@export
+class SerializedDocument(metaclass=ExtendedType, useSlots=True):
+	"""A token chain and block chain rebuilt by :func:`Load`."""
+
+	Content:     Union[str, bytes]            #: Source code buffer.
+	Tokens:      List[Token]                  #: All tokens in chain order.
+	Blocks:      List[Block]                  #: All blocks in chain order. Empty, if no block stream was stored.
+	Checkpoints: List[BlockParserCheckpoint]  #: Stored block parser checkpoints in chain order.
+
+	def __init__(self, content: Union[str, bytes], tokens: List[Token], blocks: List[Block], checkpoints: List[BlockParserCheckpoint] = None):
+		self.Content =     content
+		self.Tokens =      tokens
+		self.Blocks =      blocks
+		self.Checkpoints = [] if checkpoints is None else checkpoints
+
+	@property
+	def StartToken(self) -> Token:
+		"""First token of the token chain, usually a :class:`~pyVHDLParser.Token.StartOfDocumentToken`."""
+		return self.Tokens[0]
+
+	@property
+	def StartBlock(self) -> Optional[Block]:
+		"""First block of the block chain, or ``None`` if no block stream was stored."""
+		return self.Blocks[0] if self.Blocks else None
+
+	def Resume(self, content: Union[str, bytes]) -> Optional[TokenToBlockParser]:
+		"""
+		Resume block parsing of a changed source code after the longest unchanged prefix.
+
+		Parsing resumes at the last stored checkpoint, after which tokenizing can resume before the first changed character.
+		Tokens, blocks and checkpoints following this checkpoint are removed from the chains and from :attr:`Tokens`,
+		:attr:`Blocks` and :attr:`Checkpoints`. The returned parser appends new tokens and blocks to the chains, but not to
+		these lists.
+
+		:param content:    Changed source code of the same type as :attr:`Content`.
+		:returns:          A block parser resumed at a checkpoint, or ``None`` if no stored checkpoint precedes the first
+		                   change. Then, the document is unchanged and the source code must be parsed from the beginning.
+		:raises TypeError: If the source code type differs from :attr:`Content`.
+		"""
+		if type(content) is not type(self.Content):
+			raise TypeError(f"Parameter 'content' must be of type '{type(self.Content).__name__}'.")
+
+		changed = _CommonPrefixLength(self.Content, content)
+		for index in range(len(self.Checkpoints) - 1, -1, -1):
+			checkpoint = self.Checkpoints[index]
+			offset =     checkpoint.GetResumeOffset(self.Content)
+			if (offset is not None) and (offset <= changed):
+				break
+		else:
+			return None
+
+		lastBlock = checkpoint.LastBlock
+		endToken =  lastBlock.EndToken
+		del self.Checkpoints[index + 1:]
+		del self.Blocks[_IndexOf(self.Blocks, lastBlock) + 1:]
+		del self.Tokens[_IndexOf(self.Tokens, endToken) + 1:]
+		lastBlock.NextBlock = None
+		endToken.NextToken =  None
+
+		endToken.SourceIndex.Edit(changed, len(self.Content) - changed, content[changed:])
+		self.Content = content
+
+		return TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer(content, previousToken=endToken), checkpoint=checkpoint)
+
+
+def _CommonPrefixLength(first: Union[str, bytes], second: Union[str, bytes], chunkSize: int = 65536) -> int:
+	"""Returns the length of the longest common prefix. Chunks are compared first, then characters of a differing chunk."""
+	length = min(len(first), len(second))
+	start =  0
+	while (start < length) and (first[start:start + chunkSize] == second[start:start + chunkSize]):
+		start += chunkSize
+
+	end = min(start + chunkSize, length)
+	while (start < end) and (first[start] == second[start]):
+		start += 1
+	return min(start, length)
+
+
+def _IndexOf(items: List, item: object) -> int:
+	"""Returns the index of an object in a list by identity. The list is searched from the end."""
+	for index in range(len(items) - 1, -1, -1):
+		if items[index] is item:
+			return index
+	raise ValueError("Object isn't in the list.")
+
+
+def _ClassName(cls: type) -> str:
+	return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _StateName(state: Callable[[TokenToBlockParser], None]) -> str:
+	# A classmethod state is named by the class it's bound to, which can be a subclass of the defining class.
+	owner = getattr(state, "__self__", None)
+	if isinstance(owner, type):
+		return f"{_ClassName(owner)}.{state.__name__}"
+	return f"{state.__module__}:{state.__qualname__}"
+
+
+def _ImportClass(name: str) -> type:
+	moduleName, _, qualifiedName = name.partition(":")
+	try:
+		cls = import_module(moduleName)
+		for part in qualifiedName.split("."):
+			cls = getattr(cls, part)
+	except (ImportError, AttributeError) as ex:
+		raise SerializationException(f"Class '{name}' doesn't exist.") from ex
+
+	return cls
+
+
+def _ResolveClass(name: str) -> type:
+	cls = _ImportClass(name)
+	if not (isinstance(cls, type) and issubclass(cls, (Token, Block))):
+		raise SerializationException(f"Class '{name}' is neither a token nor a block class.")
+
+	return cls
+
+
+def _ResolveState(name: str) -> Callable[[TokenToBlockParser], None]:
+	className, _, stateName = name.rpartition(".")
+	cls = _ImportClass(className)
+	if not isinstance(cls, MetaBlock):
+		raise SerializationException(f"Class '{className}' isn't constructed by MetaBlock.")
+
+	state = getattr(cls, stateName, None)
+	if not callable(state):
+		raise SerializationException(f"Parser state '{name}' doesn't exist.")
+
+	return state
+
+
+class _Writer:
+	__slots__ = ("_sections", )
+
+	def __init__(self):
+		self._sections = []
+
+	def Write(self, data: bytes) -> None:
+		self._sections.append(_LENGTH.pack(len(data)))
+		self._sections.append(data)
+
+	def WriteColumn(self, column: array) -> None:
+		if byteorder == "big":
+			column = array(column.typecode, column)
+			column.byteswap()
+		self.Write(column.typecode.encode("ascii") + column.tobytes())
+
+	def GetBytes(self, flags: int) -> bytes:
+		return _HEADER.pack(MAGIC, FORMAT_VERSION, flags) + b"".join(self._sections)
+
+
+class _Reader:
+	__slots__ = ("_data", "_offset", "Flags")
+
+	def __init__(self, data: bytes):
+		self._data = memoryview(data)
+		try:
+			magic, version, self.Flags = _HEADER.unpack_from(self._data, 0)
+		except Exception as ex:
+			raise SerializationException("Data is too short for a header.") from ex
+
+		if magic != MAGIC:
+			raise SerializationException("Data doesn't start with the magic bytes of a serialized document.")
+		if version != FORMAT_VERSION:
+			raise SerializationException(f"Format version {version} isn't supported. Expected version {FORMAT_VERSION}.")
+
+		self._offset = _HEADER.size
+
+	def Read(self) -> memoryview:
+		offset = self._offset + _LENGTH.size
+		if offset > len(self._data):
+			raise SerializationException("Data is truncated.")
+
+		end = offset + _LENGTH.unpack_from(self._data, self._offset)[0]
+		if end > len(self._data):
+			raise SerializationException("Data is truncated.")
+
+		self._offset = end
+		return self._data[offset:end]
+
+	def ReadColumn(self, typecode: str) -> array:
+		section = self.Read()
+		if bytes(section[:1]) != typecode.encode("ascii"):
+			raise SerializationException(f"Expected a column of typecode '{typecode}'.")
+
+		column = array(typecode)
+		column.frombytes(section[1:])
+		if byteorder == "big":
+			column.byteswap()
+		return column
+
+
+def _GetPosition(position: Union[SourceCodePosition, int], sourceIndex: SourceCodeIndex, tokenIndex: SourceCodeIndex = None) -> Tuple[int, Optional[SourceCodePosition]]:
+	"""
+	Returns the absolute position and the position object, if it can't be computed by ``sourceIndex``. An absolute position
+	of a token, whose source code index was redirected, is translated by ``tokenIndex``.
+	"""
+	if position.__class__ is int:
+		return position if tokenIndex is None else tokenIndex.GetAbsolute(position), None
+
+	computed = sourceIndex.GetPosition(position.Absolute)
+	if computed.Row == position.Row and computed.Column == position.Column:
+		return position.Absolute, None
+	return position.Absolute, position
+
+
+@export
+def Dump(startToken: Token, startBlock: Block = None, content: Union[str, bytes] = None, checkpoints: Iterable[BlockParserCheckpoint] = None) -> bytes:
+	"""
+	Serialize a token chain and optionally its block chain.
+
+	The source code buffer is stored too, so positions of loaded tokens can be computed on demand. Tokens created in *lazy
+	position* mode provide it by their :class:`~pyVHDLParser.SourceCodeIndex`. The optional keyword kind set by
+	:func:`~pyVHDLParser.Token.Keywords.ClassifyKeywords` isn't stored.
+
+	:param startToken:  First token of the token chain, usually a :class:`~pyVHDLParser.Token.StartOfDocumentToken`.
+	:param startBlock:  Optional first block of the block chain created from this token chain.
+	:param content:     Source code buffer, if the tokens weren't created in *lazy position* mode.
+	:param checkpoints: Optional checkpoints of the block parser, which created the block chain. See
+	                    :meth:`~pyVHDLParser.Blocks.TokenToBlockParser.GetCheckpoint`.
+	:returns:           Serialized document.
+	:raises ValueError: If the tokens have no source code index and no content is given.
+	:raises ValueError: If a block refers to a token, which isn't in the token chain.
+	:raises ValueError: If checkpoints are given without a block chain or refer to a block, which isn't in the block chain.
+	"""
+	sourceIndex = startToken.SourceIndex
+	if sourceIndex is not None:
+		sourceIndex = sourceIndex.Current
+	if content is None:
+		if sourceIndex is None:
+			raise ValueError("Parameter 'content' is required for tokens without a source code index.")
+		content = sourceIndex.Content
+
+	# Positions of all tokens are compared with an index over the stored content, which skips the same linebreaks.
+	skipped =   [] if sourceIndex is None else sorted(sourceIndex._skipped)
+	reference = SourceCodeIndex(content)
+	for offset in skipped:
+		reference.SkipLinebreak(offset)
+
+	classes:    Dict[type, int] =             {}
+	kindCodes:  Dict[Tuple[type, bool], int] = {}
+	kindTable:  List[Tuple[type, bool]] =      []
+	valueCodes: Dict[str, int] =               {}
+	kinds =     array("H")
+	starts =    array("i")
+	ends =      array("i")
+	values =    array("i")
+	positions = array("i")   #: token index, start (0) or end (1), row, column and absolute position per position object
+	indices:    Dict[int, int] = {}
+
+	withBlocks = startBlock is not None
+	if (checkpoints is not None) and not withBlocks:
+		raise ValueError("Parameter 'checkpoints' requires a block chain.")
+
+	index = 0
+	token = startToken
+	while token is not None:
+		kind = (token.__class__, hasattr(token, "Key"))
+		code = kindCodes.get(kind)
+		if code is None:
+			code = kindCodes[kind] = len(kindTable)
+			kindTable.append(kind)
+		kinds.append(code)
+
+		tokenIndex =      None if token._sourceIndex is sourceIndex else token._sourceIndex
+		start, position = _GetPosition(token._start, reference, tokenIndex)
+		if position is not None:
+			positions.extend((index, 0, position.Row, position.Column, position.Absolute))
+		starts.append(start)
+
+		if token._end is None:
+			ends.append(NO_POSITION)
+		else:
+			end, position = _GetPosition(token._end, reference, tokenIndex)
+			if position is not None:
+				positions.extend((index, 1, position.Row, position.Column, position.Absolute))
+			ends.append(end)
+
+		if isinstance(token, ValuedToken):
+			value = token.Value
+			code = valueCodes.get(value)
+			if code is None:
+				code = valueCodes[value] = len(valueCodes)
+			values.append(code)
+		else:
+			values.append(NO_VALUE)
+
+		if withBlocks:
+			indices[id(token)] = index
+		index += 1
+		token = token.NextToken
+
+	blockKinds = array("H")
+	blockStarts = array("i")
+	blockEnds =  array("i")
+	multiParts = array("B")
+	blockIndices: Dict[int, int] = {}
+	block = startBlock
+	while block is not None:
+		blockIndices[id(block)] = len(blockKinds)
+		code = classes.get(block.__class__)
+		if code is None:
+			code = classes[block.__class__] = len(classes)
+		blockKinds.append(code)
+
+		try:
+			blockStarts.append(indices[id(block.StartToken)])
+			blockEnds.append(NO_TOKEN if block.EndToken is None else indices[id(block.EndToken)])
+		except KeyError:
+			raise ValueError(f"Block '{block.__class__.__qualname__}' refers to a token, which isn't in the token chain.") from None
+		multiParts.append(block.MultiPart)
+		block = block.NextBlock
+
+	stateCodes: Dict[Callable[[TokenToBlockParser], None], int] = {}
+	checkpointBlocks = array("i")
+	depths =           array("H")
+	states =           array("H")   #: per checkpoint, the next state followed by the pushed states
+	counters =         array("i")
+	for checkpoint in (() if checkpoints is None else checkpoints):
+		try:
+			checkpointBlocks.append(blockIndices[id(checkpoint.LastBlock)])
+		except KeyError:
+			raise ValueError("A checkpoint refers to a block, which isn't in the block chain.") from None
+		depths.append(len(checkpoint.Stack))
+		for state, counter in ((checkpoint.NextState, checkpoint.Counter), *checkpoint.Stack):
+			code = stateCodes.get(state)
+			if code is None:
+				code = stateCodes[state] = len(stateCodes)
+			states.append(code)
+			counters.append(counter)
+
+	tokenClasses = array("H")
+	hasKeys =      array("B")
+	for tokenClass, hasKey in kindTable:
+		code = classes.get(tokenClass)
+		if code is None:
+			code = classes[tokenClass] = len(classes)
+		tokenClasses.append(code)
+		hasKeys.append(hasKey)
+
+	flags = 0
+	if isinstance(content, str):
+		content = content.encode("utf-8", errors="surrogatepass")
+	else:
+		flags |= _CONTENT_IS_BYTES
+	if withBlocks:
+		flags |= _HAS_BLOCKS
+	if checkpoints is not None:
+		flags |= _HAS_CHECKPOINTS
+
+	writer = _Writer()
+	writer.Write(content)
+	writer.WriteColumn(array("i", skipped))
+	writer.Write("\n".join(_ClassName(cls) for cls in classes).encode("utf-8"))
+	writer.WriteColumn(tokenClasses)
+	writer.WriteColumn(hasKeys)
+	writer.WriteColumn(array("i", (len(value) for value in valueCodes)))
+	writer.Write("".join(valueCodes).encode("utf-8", errors="surrogatepass"))
+	writer.WriteColumn(kinds)
+	writer.WriteColumn(starts)
+	writer.WriteColumn(ends)
+	writer.WriteColumn(values)
+	writer.WriteColumn(positions)
+	if withBlocks:
+		writer.WriteColumn(blockKinds)
+		writer.WriteColumn(blockStarts)
+		writer.WriteColumn(blockEnds)
+		writer.WriteColumn(multiParts)
+	if checkpoints is not None:
+		writer.Write("\n".join(_StateName(state) for state in stateCodes).encode("utf-8"))
+		writer.WriteColumn(checkpointBlocks)
+		writer.WriteColumn(depths)
+		writer.WriteColumn(states)
+		writer.WriteColumn(counters)
+
+	return writer.GetBytes(flags)
+
+
+class _Columns:
+	"""Token columns and tables of serialized data."""
+
+	__slots__ = ("Reader", "Content", "SourceIndex", "Skipped", "Classes", "KindTable", "ValueTable", "Kinds", "Starts", "Ends", "Values", "Positions")
+
+	def __init__(self, data: bytes):
+		reader =  _Reader(data)
+		content = bytes(reader.Read())
+		if not (reader.Flags & _CONTENT_IS_BYTES):
+			content = content.decode("utf-8", errors="surrogatepass")
+
+		skipped =     reader.ReadColumn("i")
+		sourceIndex = SourceCodeIndex(content)
+		for offset in skipped:
+			sourceIndex.SkipLinebreak(offset)
+
+		names =   str(reader.Read(), "utf-8")
+		classes = [_ResolveClass(name) for name in names.split("\n")] if names else []
+		kindTable = [(classes[code], bool(hasKey)) for code, hasKey in zip(reader.ReadColumn("H"), reader.ReadColumn("B"))]
+
+		lengths =    reader.ReadColumn("i")
+		valueBlob =  str(reader.Read(), "utf-8", errors="surrogatepass")
+		offsets =    list(accumulate(lengths, initial=0))
+		valueTable = [valueBlob[begin:end] for begin, end in zip(offsets, offsets[1:])]
+
+		self.Reader =      reader
+		self.Content =     content
+		self.SourceIndex = sourceIndex
+		self.Skipped =     skipped
+		self.Classes =     classes
+		self.KindTable =   kindTable
+		self.ValueTable =  valueTable
+		self.Kinds =       reader.ReadColumn("H")
+		self.Starts =      reader.ReadColumn("i")
+		self.Ends =        reader.ReadColumn("i")
+		self.Values =      reader.ReadColumn("i")
+
+		positions = reader.ReadColumn("i")
+		self.Positions = {}
+		for offset in range(0, len(positions), 5):
+			index, isEnd, row, column, absolute = positions[offset:offset + 5]
+			entry = self.Positions.setdefault(index, [None, None])
+			entry[isEnd] = SourceCodePosition(row, column, absolute)
+
+		if len({len(self.Kinds), len(self.Starts), len(self.Ends), len(self.Values)}) != 1:
+			raise SerializationException("Token columns have different lengths.")
+
+
+def _LoadChains(columns: _Columns, sourceIndex: SourceCodeIndex, offset: int = 0, rowOffset: int = 0) -> Tuple[List[Token], List[Block]]:
+	"""
+	Rebuild the token chain and block chain from the columns of serialized data.
+
+	Positions are moved by ``offset`` characters and ``rowOffset`` rows, thus the serialized content must start at a line
+	start. Skipped linebreaks are moved into ``sourceIndex``, which is assigned to all tokens.
+	"""
+	if sourceIndex is not columns.SourceIndex:
+		for skipped in columns.Skipped:
+			sourceIndex.SkipLinebreak(skipped + offset)
+
+	kindTable =   columns.KindTable
+	valueTable =  columns.ValueTable
+	keys: Dict[int, str] = {}
+
+	new =      object.__new__
+	tokens =   []
+	append =   tokens.append
+	previous = None
+	for kind, start, end, valueCode in zip(columns.Kinds, columns.Starts, columns.Ends, columns.Values):
+		tokenClass, hasKey = kindTable[kind]
+		token = new(tokenClass)
+		token._previousToken = previous
+		token.NextToken =      None
+		token._start =         start + offset
+		token._end =           None if end == NO_POSITION else end + offset
+		token._sourceIndex =   sourceIndex
+		if valueCode != NO_VALUE:
+			token.Value = valueTable[valueCode]
+			if hasKey:
+				key = keys.get(valueCode)
+				if key is None:
+					key = keys[valueCode] = intern(token.Value.lower())
+				token.Key = key
+
+		if previous is not None:
+			previous.NextToken = token
+		append(token)
+		previous = token
+
+	for index, (start, end) in columns.Positions.items():
+		if start is not None:
+			tokens[index]._start = SourceCodePosition(start.Row + rowOffset, start.Column, start.Absolute + offset)
+		if end is not None:
+			tokens[index]._end =   SourceCodePosition(end.Row + rowOffset, end.Column, end.Absolute + offset)
+
+	blocks = []
+	if columns.Reader.Flags & _HAS_BLOCKS:
+		reader =  columns.Reader
+		classes = columns.Classes
+		append =  blocks.append
+		previous = None
+		try:
+			for kind, start, end, multiPart in zip(reader.ReadColumn("H"), reader.ReadColumn("i"), reader.ReadColumn("i"), reader.ReadColumn("B")):
+				block = new(classes[kind])
+				block._previousBlock = previous
+				block.NextBlock =      None
+				block.StartToken =     tokens[start]
+				block.EndToken =       None if end == NO_TOKEN else tokens[end]
+				block.MultiPart =      bool(multiPart)
+
+				if previous is not None:
+					previous.NextBlock = block
+				append(block)
+				previous = block
+		except IndexError as ex:
+			raise SerializationException("A block refers to an unknown token or class.") from ex
+
+	return tokens, blocks
+
+
+@export
+def Load(data: bytes) -> SerializedDocument:
+	"""
+	Rebuild a token chain and block chain serialized by :func:`Dump`.
+
+	Tokens are created in *lazy position* mode and share a :class:`~pyVHDLParser.SourceCodeIndex` over the stored source
+	code buffer. Stored checkpoints refer to the rebuilt blocks.
+
+	:param data:                    Serialized document.
+	:returns:                       Content, tokens and blocks of the document.
+	:raises SerializationException: If the data isn't a serialized document of a supported version or refers to unknown
+	                                classes.
+	"""
+	columns =        _Columns(data)
+	tokens, blocks = _LoadChains(columns, columns.SourceIndex)
+
+	checkpoints = []
+	if columns.Reader.Flags & _HAS_CHECKPOINTS:
+		reader =   columns.Reader
+		names =    str(reader.Read(), "utf-8")
+		stateTable = [_ResolveState(name) for name in names.split("\n")] if names else []
+		checkpointBlocks, depths, states, counters = (reader.ReadColumn(typecode) for typecode in "iHHi")
+		if (len(checkpointBlocks) != len(depths)) or (len(states) != len(counters)) or (len(states) != sum(depths) + len(depths)):
+			raise SerializationException("Checkpoint columns have different lengths.")
+
+		start = 0
+		try:
+			for blockIndex, depth in zip(checkpointBlocks, depths):
+				end =     start + depth + 1
+				entries = [(stateTable[code], counter) for code, counter in zip(states[start:end], counters[start:end])]
+				checkpoints.append(BlockParserCheckpoint(blocks[blockIndex], *entries[0], tuple(entries[1:])))
+				start =   end
+		except IndexError as ex:
+			raise SerializationException("A checkpoint refers to an unknown block or state.") from ex
+
+	return SerializedDocument(columns.Content, tokens, blocks, checkpoints)
+
+
+@export
+def LoadTokenStore(data: bytes) -> TokenStore:
+	"""
+	Load the token stream of a document serialized by :func:`Dump` into a column-oriented token store.
+
+	No token objects are created. A stored block stream is ignored.
+
+	:param data:                    Serialized document.
+	:returns:                       A token store.
+	:raises SerializationException: If the data isn't a serialized document of a supported version or refers to unknown
+	                                classes.
+	"""
+	columns = _Columns(data)
+	return TokenStore.FromColumns(
+		columns.SourceIndex, columns.KindTable,
+		columns.Kinds, columns.Starts, columns.Ends, columns.Values,
+		columns.ValueTable, {index: tuple(entry) for index, entry in columns.Positions.items()}
+	)
@@ -27,7 +27,8 @@
 # limitations under the License.                                                                                       #
 # ==================================================================================================================== #
 #
-from typing import Any
+from types      import MappingProxyType
+from typing     import Any, Iterator, Iterable, Generator, Mapping, Optional, Tuple, Type
 
 from pyTooling.Decorators       import export
 
@@ -41,9 +42,18 @@ class SpecificVHDLToken(VHDLToken):
 	"""Base-class for all specific tokens.
 
 	Simple token will be converted to specific tokens while parsing.
-	The internal data is copied, and the original token is replaced by this token.
+	The simple token is reclassified in place. If the block parser replaces tokens (see ``replaceTokens`` of
+	:class:`~pyVHDLParser.Blocks.TokenToBlockParser`), the internal data is copied and the original token is replaced by
+	this token.
 	"""
 
+	def __new__(cls, previousToken: Token = None, value: Any = None, start: SourceCodePosition = None, end: SourceCodePosition = None, fromExistingToken: Token = None):
+		if fromExistingToken is None:
+			return super().__new__(cls)
+
+		fromExistingToken.__class__ = cls
+		return fromExistingToken
+
 	def __init__(self, previousToken: Token = None, value: Any = None, start: SourceCodePosition = None, end: SourceCodePosition = None, fromExistingToken: Token = None):
 		"""
 		Initialize a specific token, by copying the simple token's data and link
@@ -51,8 +61,10 @@ class SpecificVHDLToken(VHDLToken):
 		"""
 		if fromExistingToken is None:
 			super().__init__(previousToken, value, start, end)
-		else:
-			super().__init__(fromExistingToken.PreviousToken, fromExistingToken.Value, fromExistingToken.Start, fromExistingToken.End)
+		elif fromExistingToken is not self:
+			super().__init__(fromExistingToken.PreviousToken, fromExistingToken.Value, fromExistingToken._start, fromExistingToken._end)
+			if isinstance(fromExistingToken, WordToken):
+				self.Key = fromExistingToken.Key
 
 
 @export
@@ -326,11 +338,20 @@ class RepeatedLabelToken(LabelToken):
 class MultiCharKeyword(VHDLToken):
 	__KEYWORD__: str
 
+	def __new__(cls, previousToken: Token = None, value: Any = None, start: SourceCodePosition = None, end: SourceCodePosition = None, fromExistingToken: CharacterToken = None):
+		if fromExistingToken is None:
+			return super().__new__(cls)
+
+		fromExistingToken.__class__ = cls
+		return fromExistingToken
+
 	def __init__(self, previousToken: Token = None, value: Any = None, start: SourceCodePosition = None, end: SourceCodePosition = None, fromExistingToken: CharacterToken = None):
 		if fromExistingToken is None:
 			super().__init__(previousToken, self.__KEYWORD__, start, end)
+		elif fromExistingToken is self:
+			self.Value = self.__KEYWORD__
 		else:
-			super().__init__(fromExistingToken.PreviousToken, self.__KEYWORD__, fromExistingToken.Start, fromExistingToken.End)
+			super().__init__(fromExistingToken.PreviousToken, self.__KEYWORD__, fromExistingToken._start, fromExistingToken._end)
 
 	def __str__(self) -> str:
 		return "<{name: <50} '{value}' at {pos!r}>".format(
@@ -404,17 +425,27 @@ class SignalAssociationKeyword(AssociationKeyword):
 class KeywordToken(VHDLToken):
 	__KEYWORD__ : str
 
+	def __new__(cls, previousToken: Token = None, value: str = None, start: SourceCodePosition = None, end: SourceCodePosition = None, fromExistingToken: WordToken = None):
+		if fromExistingToken is None:
+			return super().__new__(cls)
+
+		if not (isinstance(fromExistingToken, WordToken) and (fromExistingToken <= cls.__KEYWORD__)):
+			raise TokenizerException("Expected keyword {0}.".format(cls.__KEYWORD__.upper()), fromExistingToken)
+
+		fromExistingToken.__class__ = cls
+		return fromExistingToken
+
 	def __init__(self, previousToken: Token = None, value: str = None, start: SourceCodePosition = None, end: SourceCodePosition = None, fromExistingToken: WordToken = None):
 		if fromExistingToken is None:
 			if value.lower() != self.__KEYWORD__:
 				raise TokenizerException("Expected keyword {0}.".format(self.__KEYWORD__.upper()), None)
 
 			super().__init__(previousToken, value, str, end)
+		elif fromExistingToken is self:
+			self.Value = self.__KEYWORD__
 		else:
-			if not (isinstance(fromExistingToken, WordToken) and (fromExistingToken <= self.__KEYWORD__)):
-				raise TokenizerException("Expected keyword {0}.".format(self.__KEYWORD__.upper()), fromExistingToken)
-
-			super().__init__(fromExistingToken.PreviousToken, self.__KEYWORD__, fromExistingToken.Start, fromExistingToken.End)
+			super().__init__(fromExistingToken.PreviousToken, self.__KEYWORD__, fromExistingToken._start, fromExistingToken._end)
+			self.Key = self.__KEYWORD__
 
 	def __str__(self) -> str:
 		return "<{name: <50}  {value:.<59} at {pos!r}>".format(
@@ -997,3 +1028,49 @@ class XorOperator(LogicalOperator):
 @export
 class XnorOperator(LogicalOperator):
 	__KEYWORD__ = "xnor"
+
+
+def _KeywordClasses(tokenClass: Type[VHDLToken]) -> Iterator[Type[VHDLToken]]:
+	"""Yields all subclasses of ``tokenClass``, whose keyword is a reserved word, e.g. ``entity`` or ``mod``, but not ``<=``."""
+	for subClass in tokenClass.__subclasses__():
+		if subClass.__dict__.get("__KEYWORD__", "").isidentifier():
+			yield subClass
+		yield from _KeywordClasses(subClass)
+
+
+NO_KEYWORD = 0  #: Keyword kind of a word, which is not a reserved word.
+
+#: All reserved word classes ordered by keyword. The keyword kind of a class is its index plus one. Besides keywords, this
+#: includes operators, which are reserved words, like ``mod`` and ``rem``.
+KEYWORD_CLASSES: Tuple[Type[VHDLToken], ...] = tuple(sorted({*_KeywordClasses(KeywordToken), *_KeywordClasses(SpecificVHDLToken)}, key=lambda keywordClass: keywordClass.__KEYWORD__))
+
+#: Read-only map of reserved words to keyword kinds.
+RESERVED_WORDS: Mapping[str, int] = MappingProxyType({keywordClass.__KEYWORD__: kind for kind, keywordClass in enumerate(KEYWORD_CLASSES, start=1)})
+
+
+@export
+def GetKeywordClass(kind: int) -> Optional[Type[VHDLToken]]:
+	"""Returns the keyword class of a keyword kind or ``None`` for :data:`NO_KEYWORD`."""
+	return KEYWORD_CLASSES[kind - 1] if kind != NO_KEYWORD else None
+
+
+@export
+def ClassifyKeywords(tokenStream: Iterable[Token]) -> Generator[Token, None, None]:
+	"""
+	Tag every word token of a token stream with its keyword kind.
+
+	This optional pass can be chained after a tokenizer. Each :class:`~pyVHDLParser.Token.WordToken` gets a
+	:attr:`~pyVHDLParser.Token.ValuedToken.KeywordKind` by a single lookup of its :attr:`~pyVHDLParser.Token.ValuedToken.Key`
+	in :data:`RESERVED_WORDS`. Words, which are no reserved words, get :data:`NO_KEYWORD`. Tools walking the token stream
+	can then branch on a small integer, e.g. ``kind == RESERVED_WORDS["entity"]``, or get the keyword class by
+	:func:`GetKeywordClass`. Word tokens aren't reclassified, so the stream can still be passed to the block parser.
+
+	:param tokenStream: A token stream, e.g. from :meth:`~pyVHDLParser.Token.Parser.Tokenizer.GetVHDLTokenizer`.
+	:returns:           A generator yielding the same tokens.
+	"""
+	reservedWord = RESERVED_WORDS.get
+
+	for token in tokenStream:
+		if isinstance(token, WordToken):
+			token.KeywordKind = reservedWord(token.Key, NO_KEYWORD)
+		yield token
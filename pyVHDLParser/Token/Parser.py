@@ -27,14 +27,20 @@
 # limitations under the License.                                                                                       #
 # ==================================================================================================================== #
 #
+from codecs                   import BOM_UTF8, getincrementaldecoder, lookup as lookupCodec
 from enum                     import IntEnum
-from typing                   import Iterator
+from itertools                import chain
+from mmap                     import mmap, ACCESS_READ
+from os                       import fstat
+from pathlib                  import Path
+from re                       import compile as re_compile
+from typing                   import Dict, Iterable, Iterator, Generator, List, Union
 
 from pyTooling.Decorators     import export
 
-from pyVHDLParser             import SourceCodePosition
+from pyVHDLParser             import SourceCodePosition, SourceCodeIndex
 from pyVHDLParser.Base        import ParserException
-from pyVHDLParser.Token       import StartOfDocumentToken, EndOfDocumentToken, IndentationToken, FusedCharacterToken
+from pyVHDLParser.Token       import Token, StartOfDocumentToken, EndOfDocumentToken, IndentationToken, FusedCharacterToken
 from pyVHDLParser.Token       import CharacterLiteralToken, StringLiteralToken, ExtendedIdentifier, DirectiveToken, IntegerLiteralToken, RealLiteralToken
 from pyVHDLParser.Token       import CharacterToken, SpaceToken, WordToken, SingleLineCommentToken, MultiLineCommentToken, LinebreakToken
 
@@ -51,6 +57,14 @@ class TokenizerException(ParserException):
 		return "{0!s}: {1}".format(self.Position, self._message)
 
 
+def _ByteDispatchTable(table: Dict[str, IntEnum], fallback: IntEnum, nonASCII: IntEnum) -> Dict[int, IntEnum]:
+	"""
+	Expand a dispatch table by character to a table of all 256 byte values. Unlisted ASCII bytes map to ``fallback``, bytes
+	above 0x7F, which might start a multi-byte character, map to ``nonASCII``.
+	"""
+	return {byte: table.get(chr(byte), fallback) if byte < 0x80 else nonASCII for byte in range(256)}
+
+
 @export
 class Tokenizer:
 	class TokenKind(IntEnum):
@@ -74,9 +88,154 @@ class Tokenizer:
 		FuseableCharacter =               15  #: Last char was a character that could be fused
 		OtherChars =                      16  #: Anything else
 
+	class DispatchAction(IntEnum):
+		"""Enumeration of all character dispatch actions used by the table-driven tokenizer."""
+
+		Character =                       0   #: Emit a single character token.
+		CharacterAndFuseable =            1   #: Emit a single character token, but stay in fuseable character mode.
+		Space =                           2   #: Consume a run of whitespace characters.
+		Integer =                         3   #: Consume an integer or real literal.
+		Alpha =                           4   #: Consume a word.
+		Dot =                             5   #: A ``.`` could start a real literal.
+		CharacterLiteral =                6   #: A ``'`` could start a character literal.
+		StringLiteral =                   7   #: Consume a string literal.
+		ExtendedIdentifier =              8   #: Consume an extended identifier.
+		Dash =                            9   #: A ``-`` could start a single-line comment.
+		CarriageReturn =                  10  #: A ``\r`` could start a ``\r\n`` linebreak.
+		Linefeed =                        11  #: Emit a linebreak.
+		Fuseable =                        12  #: A character that could be fused (or start a multi-line comment).
+		Directive =                       13  #: A `` ` `` could start a directive.
+		MultiByteCharacter =              14  #: Emit a character token for a character encoded by one or more bytes.
+		MultiByteCharacterAndFuseable =   15  #: Like ``MultiByteCharacter``, but stay in fuseable character mode.
+
+	# Dispatch tables for the table-driven tokenizer. Which table is used depends on the previously emitted token, because
+	# the character-based tokenizer handles a few characters differently in these situations.
+	__DISPATCH_DEFAULT__ = {
+		**dict.fromkeys(" \t",                                                   DispatchAction.Space),
+		**dict.fromkeys("0123456789",                                            DispatchAction.Integer),
+		**dict.fromkeys("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",  DispatchAction.Alpha),
+		**dict.fromkeys("=<:/*>?",                                               DispatchAction.Fuseable),
+		"'":                                                                     DispatchAction.CharacterLiteral,
+		"\"":                                                                    DispatchAction.StringLiteral,
+		"\\":                                                                    DispatchAction.ExtendedIdentifier,
+		"-":                                                                     DispatchAction.Dash,
+		"\r":                                                                    DispatchAction.CarriageReturn,
+		"\n":                                                                    DispatchAction.Linefeed,
+		"`":                                                                     DispatchAction.Directive
+	}
+	__DISPATCH_AFTER_SPACE__ =     {**__DISPATCH_DEFAULT__, ".": DispatchAction.Dot}
+	__DISPATCH_AFTER_DASH__ =      {**__DISPATCH_DEFAULT__, "\r": DispatchAction.Character, "\n": DispatchAction.Character}
+	__DISPATCH_AFTER_DOT__ =       __DISPATCH_AFTER_DASH__
+	__DISPATCH_AFTER_CR__ =        {**__DISPATCH_DEFAULT__, "\r": DispatchAction.Character}
+	__DISPATCH_AFTER_FUSEABLE__ =  {**__DISPATCH_DEFAULT__, "`": DispatchAction.CharacterAndFuseable}
+
+	# Dispatch tables for tokenizing bytes, in the same order as the dispatch contexts of the table-driven tokenizer. A byte
+	# value is looked up directly, thus unlisted characters are resolved to the context's fallback action in advance.
+	__BYTE_DISPATCH_TABLES__ = (
+		_ByteDispatchTable(__DISPATCH_DEFAULT__,        DispatchAction.Character,            DispatchAction.MultiByteCharacter),
+		_ByteDispatchTable(__DISPATCH_AFTER_SPACE__,    DispatchAction.Character,            DispatchAction.MultiByteCharacter),
+		_ByteDispatchTable(__DISPATCH_AFTER_DOT__,      DispatchAction.Character,            DispatchAction.MultiByteCharacter),
+		_ByteDispatchTable(__DISPATCH_AFTER_DASH__,     DispatchAction.Character,            DispatchAction.MultiByteCharacter),
+		_ByteDispatchTable(__DISPATCH_AFTER_CR__,       DispatchAction.Character,            DispatchAction.MultiByteCharacter),
+		_ByteDispatchTable(__DISPATCH_AFTER_FUSEABLE__, DispatchAction.CharacterAndFuseable, DispatchAction.MultiByteCharacterAndFuseable)
+	)
+
+	__FUSED_CHARACTERS__ = frozenset(("=>", "**", ":=", "/=", "<=", ">=", "<>", "<<", ">>", "??", "?=", "?<", "?>", "?/=", "?<=", "?>="))
+	__BYTE_FUSED_CHARACTERS__ = frozenset(fused.encode("ascii") for fused in __FUSED_CHARACTERS__)
+
+	__WORD_RUN__ =         re_compile(r"[A-Za-z0-9_]*")
+	__SPACE_RUN__ =        re_compile(r"[ \t]*")
+	__DIGIT_RUN__ =        re_compile(r"[0-9_]*")
+	__LINE_RUN__ =         re_compile(r"[^\r\n]*")
+	__BYTE_RUNS__ =        tuple(re_compile(run.pattern.encode("ascii")) for run in (__WORD_RUN__, __SPACE_RUN__, __DIGIT_RUN__, __LINE_RUN__))
+
+	#: Default chunk size in characters (text files) or bytes (memory-mapped files).
+	CHUNK_SIZE = 64 * 1024
+	#: Default number of tokens per batch of :meth:`GetBatchedVHDLTokenizer`.
+	BATCH_SIZE = 1024
+
+	@classmethod
+	def ReadChunks(cls, file: Union[Path, str], chunkSize: int = CHUNK_SIZE, encoding: str = None) -> Generator[str, None, None]:
+		"""
+		Returns a generator, that reads a text file in chunks of decoded characters.
+
+		The file is opened on first iteration and closed, when the generator is exhausted or closed.
+
+		:param file:      Path to a VHDL source file.
+		:param chunkSize: Number of characters per chunk.
+		:param encoding:  Encoding of the file. By default, the platform's preferred encoding like :func:`open`.
+		:returns:         A generator of strings.
+		"""
+		with Path(file).open("r", encoding=encoding) as fileHandle:
+			while chunk := fileHandle.read(chunkSize):
+				yield chunk
+
+	@classmethod
+	def DecodeChunks(cls, buffer: Union[mmap, bytes], chunkSize: int = CHUNK_SIZE, encoding: str = "utf-8") -> Generator[str, None, None]:
+		"""
+		Returns a generator, that decodes a memory-mapped file or another bytes-like buffer in chunks.
+
+		Multi-byte characters spanning a chunk boundary are completed by an incremental decoder. Linebreaks are not
+		translated, thus ``\\r\\n`` is tokenized as one :class:`~pyVHDLParser.Token.LinebreakToken`.
+
+		:param buffer:    Buffer to decode.
+		:param chunkSize: Number of bytes per chunk.
+		:param encoding:  Encoding of the buffer.
+		:returns:         A generator of strings.
+		"""
+		decoder = getincrementaldecoder(encoding)()
+		for offset in range(0, len(buffer), chunkSize):
+			chunk = decoder.decode(buffer[offset:offset + chunkSize])
+			if chunk:
+				yield chunk
+
+		chunk = decoder.decode(b"", final=True)
+		if chunk:
+			yield chunk
+
+	@classmethod
+	def ReadMemoryMappedChunks(cls, file: Union[Path, str], chunkSize: int = CHUNK_SIZE, encoding: str = "utf-8") -> Generator[str, None, None]:
+		"""
+		Returns a generator, that memory-maps a file and decodes it in chunks (see :meth:`DecodeChunks`).
+
+		The file is mapped on first iteration and unmapped, when the generator is exhausted or closed.
+
+		:param file:      Path to a VHDL source file.
+		:param chunkSize: Number of bytes per chunk.
+		:param encoding:  Encoding of the file.
+		:returns:         A generator of strings.
+		"""
+		with Path(file).open("rb") as fileHandle:
+			# An empty file can't be mapped.
+			if fstat(fileHandle.fileno()).st_size == 0:
+				return
+
+			with mmap(fileHandle.fileno(), 0, access=ACCESS_READ) as mapped:
+				yield from cls.DecodeChunks(mapped, chunkSize, encoding)
+
+	@classmethod
+	def _GetCharacters(cls, source: Union[str, Iterable[str], mmap]) -> Iterable[str]:
+		"""Flatten an iterable of characters or chunks, or decode a memory-mapped file, to an iterable of characters."""
+		if isinstance(source, str):
+			return source
+		elif isinstance(source, mmap):
+			return chain.from_iterable(cls.DecodeChunks(source))
+
+		return chain.from_iterable(source)
 
 	@classmethod
-	def GetVHDLTokenizer(cls, iterable: Iterator[str]):
+	def GetVHDLTokenizer(cls, iterable: Union[str, Iterable[str], mmap]) -> Generator[Token, None, None]:
+		"""
+		Returns a generator, that emits a chain of tokens by a per-character state machine.
+
+		The source code is consumed character by character, so it doesn't need to be loaded as a whole. Besides a string, an
+		iterable of characters, an iterable of decoded chunks (e.g. from :meth:`ReadChunks` or :meth:`ReadMemoryMappedChunks`)
+		or a memory-mapped UTF-8 file are accepted. Tokens may span chunk boundaries. Note, the emitted tokens are still
+		double-linked, so all tokens are kept in memory as long as one token of the chain is referenced.
+
+		:param iterable: VHDL source code.
+		:returns:        A generator of tokens.
+		"""
 		previousToken = StartOfDocumentToken()
 		tokenKind =     cls.TokenKind.OtherChars
 		start =         SourceCodePosition(1, 1, 1)
@@ -92,7 +251,7 @@ class Tokenizer:
 
 		yield previousToken
 
-		for char in iterable:
+		for char in cls._GetCharacters(iterable):
 			absolute +=   1
 			column +=     1
 
@@ -511,3 +670,442 @@ class Tokenizer:
 
 		# End of document
 		yield EndOfDocumentToken(previousToken, SourceCodePosition(row, column, absolute))
+
+	@classmethod
+	def GetTableDrivenVHDLTokenizer(cls, content: Union[str, bytes], lazyPositions: bool = False, previousToken: Token = None, encoding: str = "utf-8") -> Iterator[Token]:
+		"""
+		Returns an iterator, that emits the same token chain as :meth:`GetVHDLTokenizer`.
+
+		Instead of a per-character state machine, the next character is classified by a precomputed dispatch table. Runs of
+		word characters, whitespace, digits and comment bodies are consumed as one slice by compiled regular expressions or
+		:meth:`str.find`. Source code positions are only computed at token boundaries.
+
+		In *lazy position* mode, tokens store only absolute offsets into ``content``. Row and column are computed on demand
+		by a :class:`~pyVHDLParser.SourceCodeIndex` shared by all tokens of the document, when :attr:`Token.Start` or
+		:attr:`Token.End` is accessed.
+
+		Tokens are created in batches by :meth:`GetBatchedVHDLTokenizer`, thus the tokenizer runs up to :attr:`BATCH_SIZE`
+		tokens ahead of the consumer.
+
+		If ``previousToken`` is given, tokenizing resumes at the line start following this token and new tokens are appended
+		to its token chain. The token must end a line (a ``\\n`` or ``\\r\\n`` linebreak or a single-line comment) and
+		``content`` must be unchanged up to this token. The position mode is taken from the existing token chain.
+
+		If ``content`` is a bytes-like object like the content of a file opened in binary mode, the bytes are classified by
+		dispatch tables with 256 entries and the document isn't decoded as a whole. Only the values of emitted tokens are
+		decoded by ``encoding``. Columns and absolute positions count bytes instead of characters, which differs only for
+		lines with multi-byte characters. A byte sequence, which can't be decoded, is reported as
+		:exc:`TokenizerException`.
+
+		:param content:       VHDL source code as string or as bytes.
+		:param lazyPositions: If true, don't create :class:`~pyVHDLParser.SourceCodePosition` objects per token.
+		:param previousToken: Optional token ending a line, after which tokenizing resumes.
+		:param encoding:      Encoding of token values, if ``content`` is bytes-like or memory-mapped.
+		:returns:             An iterator of tokens.
+		:raises TokenizerException: If ``previousToken`` doesn't end a line.
+		"""
+		return chain.from_iterable(cls.GetBatchedVHDLTokenizer(content, lazyPositions=lazyPositions, previousToken=previousToken, encoding=encoding))
+
+	@classmethod
+	def GetBatchedVHDLTokenizer(cls, content: Union[str, bytes], batchSize: int = BATCH_SIZE, lazyPositions: bool = False, previousToken: Token = None, encoding: str = "utf-8") -> Generator[List[Token], None, None]:
+		"""
+		Returns a generator, that emits the token chain of :meth:`GetTableDrivenVHDLTokenizer` as lists of tokens.
+
+		The tokenizer appends tokens to a list and suspends only when ``batchSize`` tokens are collected, instead of
+		suspending per token. A consumer like the block parser can iterate a batch with a plain loop. If the tokenizer
+		fails, the tokens before the error are emitted as a last batch before the exception is raised.
+
+		:param content:       VHDL source code as string or as bytes.
+		:param batchSize:     Number of tokens per batch. The last batch might be smaller.
+		:param lazyPositions: If true, don't create :class:`~pyVHDLParser.SourceCodePosition` objects per token.
+		:param previousToken: Optional token ending a line, after which tokenizing resumes.
+		:param encoding:      Encoding of token values, if ``content`` is bytes-like or memory-mapped.
+		:returns:             A generator of token lists.
+		:raises TokenizerException: If ``previousToken`` doesn't end a line.
+		"""
+		batch = []
+		try:
+			for _ in cls._TableDrivenTokenizer(content, lazyPositions, previousToken, batch, batchSize, encoding):
+				yield batch[:]
+				batch.clear()
+		except Exception:
+			if batch:
+				yield batch[:]
+			raise
+
+		if batch:
+			yield batch
+
+	@classmethod
+	def _TableDrivenTokenizer(cls, content: Union[str, bytes], lazyPositions: bool, previousToken: Token, batch: List[Token], batchSize: int, encoding: str) -> Generator[None, None, None]:
+		"""Tokenizer core of :meth:`GetBatchedVHDLTokenizer`, which appends tokens to ``batch`` and suspends, if it's full."""
+		if isinstance(content, mmap):
+			content = "".join(cls.DecodeChunks(content, encoding=encoding))
+		elif isinstance(content, (bytearray, memoryview)):
+			content = bytes(content)
+		elif not isinstance(content, (str, bytes)):
+			content = "".join(content)
+
+		Action =            cls.DispatchAction
+		CHARACTER =         Action.Character
+		CHARACTER_FUSE =    Action.CharacterAndFuseable
+		SPACE =             Action.Space
+		INTEGER =           Action.Integer
+		ALPHA =             Action.Alpha
+		DOT =               Action.Dot
+		CHARACTER_LITERAL = Action.CharacterLiteral
+		STRING_LITERAL =    Action.StringLiteral
+		EXTENDED_ID =       Action.ExtendedIdentifier
+		DASH =              Action.Dash
+		CR =                Action.CarriageReturn
+		LF =                Action.Linefeed
+		FUSEABLE =          Action.Fuseable
+		DIRECTIVE =         Action.Directive
+		MULTI_BYTE =        Action.MultiByteCharacter
+		MULTI_BYTE_FUSE =   Action.MultiByteCharacterAndFuseable
+
+		if isinstance(content, str):
+			# Characters are compared as strings of length one.
+			LINEFEED, QUOTE, MINUS, PERIOD, DIGITS = "\n", "'", "-", ".", "0123456789"
+			DOUBLE_DASH, COMMENT_START, COMMENT_END, QUESTION_SLASH = "--", "/*", "*/", "?/"
+
+			decode =          str
+			byteOrderMark =   ""
+
+			def characterEnd(index: int) -> int:
+				"""Returns the end of the character starting at ``index``."""
+				return index + 1
+
+			dispatchTables =  (cls.__DISPATCH_DEFAULT__, cls.__DISPATCH_AFTER_SPACE__, cls.__DISPATCH_AFTER_DOT__, cls.__DISPATCH_AFTER_DASH__, cls.__DISPATCH_AFTER_CR__, cls.__DISPATCH_AFTER_FUSEABLE__)
+			fusedCharacters = cls.__FUSED_CHARACTERS__
+			runs =            (cls.__WORD_RUN__, cls.__SPACE_RUN__, cls.__DIGIT_RUN__, cls.__LINE_RUN__)
+		else:
+			# Indexing bytes returns integers.
+			LINEFEED, QUOTE, MINUS, PERIOD, DIGITS = ord("\n"), ord("'"), ord("-"), ord("."), b"0123456789"
+			DOUBLE_DASH, COMMENT_START, COMMENT_END, QUESTION_SLASH = b"--", b"/*", b"*/", b"?/"
+
+			def decode(value: bytes) -> str:
+				"""Decode the value of a token starting at ``index``."""
+				try:
+					return str(value, encoding)
+				except UnicodeDecodeError as ex:
+					offset = index + ex.start
+					raise TokenizerException(f"Byte 0x{content[offset]:02x} can't be decoded as {encoding}.", sourceIndex.GetPosition(offset + 1) if lazyPositions else position(offset)) from ex
+
+			def characterEnd(index: int) -> int:
+				"""Returns the end of the character starting at ``index``, which might be encoded by multiple bytes."""
+				if content[index] < 0x80:
+					return index + 1
+
+				decoder = getincrementaldecoder(encoding)()
+				try:
+					for end in range(index + 1, length + 1):
+						if decoder.decode(content[end - 1:end]):
+							return end
+				except UnicodeDecodeError:
+					pass
+
+				# An invalid or incomplete byte sequence is reported by decode.
+				return index + 1
+
+			# A UTF-8 byte order mark isn't part of the source code.
+			byteOrderMark =   BOM_UTF8 if lookupCodec(encoding).name in ("utf-8", "utf-8-sig") else b""
+			dispatchTables =  cls.__BYTE_DISPATCH_TABLES__
+			fusedCharacters = cls.__BYTE_FUSED_CHARACTERS__
+			runs =            cls.__BYTE_RUNS__
+
+		# dispatch context: (table, action for unlisted characters, create a new start position)
+		afterToken =        (dispatchTables[0], CHARACTER,      True)
+		afterSpace =        (dispatchTables[1], CHARACTER,      True)
+		afterDot =          (dispatchTables[2], CHARACTER,      True)
+		afterDash =         (dispatchTables[3], CHARACTER,      False)
+		afterCR =           (dispatchTables[4], CHARACTER,      False)
+		afterFuseable =     (dispatchTables[5], CHARACTER_FUSE, False)
+
+		wordRun, spaceRun, digitRun, lineRun = (run.match for run in runs)
+
+		length =            len(content)
+		if previousToken is None:
+			index =           0
+			row =             1
+		else:
+			previousEnd =     previousToken.End
+			if not (isinstance(previousToken, (LinebreakToken, SingleLineCommentToken)) and content[previousEnd.Absolute - 1] == LINEFEED):
+				raise TokenizerException("Tokenizing can only be resumed after a linebreak.", previousEnd)
+
+			index =           previousEnd.Absolute
+			row =             previousEnd.Row + 1
+			lazyPositions =   previousToken.SourceIndex is not None
+		lineStart =         index   #: index of the first character in the current row
+		counted =           index   #: linebreaks before this index are accounted for in row and lineStart
+		if (index == 0) and byteOrderMark and content.startswith(byteOrderMark):
+			# The byte order mark is skipped, but it's counted in positions like all other bytes.
+			index =           len(byteOrderMark)
+
+		if lazyPositions:
+			sourceIndex = SourceCodeIndex(content) if previousToken is None else previousToken.SourceIndex
+
+			def position(index: int) -> int:
+				return index + 1
+
+			def endOfDocument() -> SourceCodePosition:
+				documentEnd = sourceIndex.GetPosition(length + 1)
+				documentEnd.Column -=   1
+				documentEnd.Absolute -= 1
+				return documentEnd
+		else:
+			sourceIndex = None
+
+			def position(index: int) -> SourceCodePosition:
+				nonlocal row, lineStart, counted
+				if index > counted:
+					linebreaks = content.count(LINEFEED, counted, index)
+					if linebreaks > 0:
+						row +=      linebreaks
+						lineStart = content.rfind(LINEFEED, counted, index) + 1
+					counted = index
+				return SourceCodePosition(row, index - lineStart + 1, index + 1)
+
+			def endOfDocument() -> SourceCodePosition:
+				position(length)
+				return SourceCodePosition(row, length - lineStart, length)
+
+		append = batch.append
+		if previousToken is None:
+			previousToken = StartOfDocumentToken(sourceIndex)
+			append(previousToken)
+
+		table, fallback, newStart = afterToken
+		start = None
+		while index < length:
+			if len(batch) >= batchSize:
+				yield
+			char = content[index]
+			action = table.get(char, fallback)
+			if newStart:
+				start = position(index)
+
+			carriageReturn = -1
+			table, fallback, newStart = afterToken
+
+			if action is ALPHA:
+				end = wordRun(content, index + 1).end()
+				previousToken = WordToken(previousToken, decode(content[index:end]), start, position(end) if end < length else endOfDocument())
+				append(previousToken)
+				index = end
+			elif action is SPACE:
+				end = spaceRun(content, index + 1).end()
+				if end < length:
+					spaceEnd = position(end - 1)
+				else:
+					documentEnd = endOfDocument()
+					spaceEnd =    SourceCodePosition(documentEnd.Row, documentEnd.Column - 1, documentEnd.Absolute - 1)
+
+				if isinstance(previousToken, (LinebreakToken, SingleLineCommentToken, StartOfDocumentToken)):
+					previousToken = IndentationToken(previousToken, decode(content[index:end]), start, spaceEnd)
+				else:
+					previousToken = SpaceToken(previousToken, decode(content[index:end]), start, spaceEnd)
+				append(previousToken)
+				index = end
+				table, fallback, newStart = afterSpace
+			elif action is LF:
+				previousToken = LinebreakToken(previousToken, "\n", start, start)
+				append(previousToken)
+				index += 1
+			elif action is CHARACTER:
+				previousToken = CharacterToken(previousToken, decode(content[index:index + 1]), start)
+				append(previousToken)
+				index += 1
+			elif (action is MULTI_BYTE) or (action is MULTI_BYTE_FUSE):
+				end =   characterEnd(index)
+				value = decode(content[index:end])
+				previousToken = CharacterToken(previousToken, value, start)
+				append(previousToken)
+				if action is MULTI_BYTE_FUSE:
+					# Like an unlisted character in fuseable character mode, which isn't fused (see below).
+					if end == length:
+						raise TokenizerException("End of document before ...", endOfDocument())
+
+					previousToken = CharacterToken(previousToken, value, start)
+					append(previousToken)
+					table, fallback, newStart = afterFuseable
+				index = end
+			elif (action is FUSEABLE) or (action is CHARACTER_FUSE):
+				if action is CHARACTER_FUSE:
+					previousToken = CharacterToken(previousToken, decode(content[index:index + 1]), start)
+					append(previousToken)
+
+				nextIndex = index + 1
+				while True:
+					if nextIndex == length:
+						raise TokenizerException("End of document before ...", endOfDocument())
+
+					fused = content[index:nextIndex + 1]
+					if fused in fusedCharacters:
+						previousToken = FusedCharacterToken(previousToken, decode(fused), start, position(nextIndex))
+						append(previousToken)
+						index = nextIndex + 1
+						break
+					elif fused == QUESTION_SLASH:
+						nextIndex += 1
+					elif fused == COMMENT_START:
+						end = content.find(COMMENT_END, nextIndex)
+						if end == -1:
+							raise TokenizerException("End of document before end of multi line comment.", endOfDocument())
+
+						previousToken = MultiLineCommentToken(previousToken, decode(content[index:end + 2]), start, position(end + 1))
+						append(previousToken)
+						index = end + 2
+						break
+					else:
+						previousToken = CharacterToken(previousToken, decode(content[index:index + 1]), start)
+						append(previousToken)
+						if nextIndex - index == 2:
+							previousToken = CharacterToken(previousToken, decode(content[index + 1:nextIndex]), start)
+							append(previousToken)
+
+						index = nextIndex
+						table, fallback, newStart = afterFuseable
+						break
+			elif action is INTEGER:
+				end = digitRun(content, index + 1).end()
+				if (end < length) and (content[end] == PERIOD):
+					end = digitRun(content, end + 1).end()
+					previousToken = RealLiteralToken(previousToken, decode(content[index:end]), start, position(end) if end < length else endOfDocument())
+				else:
+					previousToken = IntegerLiteralToken(previousToken, decode(content[index:end]), start, position(end) if end < length else endOfDocument())
+				append(previousToken)
+				index = end
+			elif action is DASH:
+				nextIndex = index + 1
+				if nextIndex == length:
+					raise TokenizerException("End of document before ...", endOfDocument())
+				elif content[nextIndex] == MINUS:
+					end = lineRun(content, nextIndex + 1).end()
+					if end == length:
+						previousToken = SingleLineCommentToken(previousToken, decode(content[index:]), start, endOfDocument())
+						append(previousToken)
+						index = end
+					elif content[end] == LINEFEED:
+						previousToken = SingleLineCommentToken(previousToken, decode(content[index:end + 1]), start, position(end))
+						append(previousToken)
+						index = end + 1
+					else:
+						carriageReturn = end
+				else:
+					previousToken = CharacterToken(previousToken, "-", start)
+					append(previousToken)
+					index = nextIndex
+					table, fallback, newStart = afterDash
+			elif action is CR:
+				carriageReturn = index
+			elif action is DOT:
+				nextIndex = index + 1
+				if nextIndex == length:
+					raise TokenizerException("End of document before ...", endOfDocument())
+				elif content[nextIndex] in DIGITS:
+					end = digitRun(content, nextIndex + 1).end()
+					previousToken = RealLiteralToken(previousToken, decode(content[index:end]), start, position(end) if end < length else endOfDocument())
+					append(previousToken)
+					index = end
+				else:
+					previousToken = CharacterToken(previousToken, ".", start)
+					append(previousToken)
+					index = nextIndex
+					table, fallback, newStart = afterDot
+			elif action is CHARACTER_LITERAL:
+				first = index + 1
+				if first == length:
+					raise TokenizerException("End of document before ...", endOfDocument())
+				elif content[first] == QUOTE:
+					previousToken = CharacterToken(previousToken, "'", start)
+					append(previousToken)
+					previousToken = CharacterToken(previousToken, "'", position(first))
+					append(previousToken)
+					index = first + 1
+				else:
+					# The character-based tokenizer doesn't count a linebreak directly following a single quote.
+					if content[first] == LINEFEED:
+						if lazyPositions:
+							sourceIndex.SkipLinebreak(first)
+						else:
+							position(first)
+							counted = first + 1
+
+					second = characterEnd(first)
+					if second == length:
+						raise TokenizerException("End of document before ...", endOfDocument())
+					elif content[second] == QUOTE:
+						previousToken = CharacterLiteralToken(previousToken, decode(content[index:second + 1]), start, position(second))
+						append(previousToken)
+						index = second + 1
+					else:
+						if lazyPositions:
+							# Tokens since the last new start share the start position, which is modified below.
+							offset = start
+							start =  sourceIndex.GetPosition(offset)
+							token =  previousToken
+							while token._start == offset:
+								token._start = start
+								if token._end == offset:
+									token._end = start
+								token = token.PreviousToken
+							if isinstance(token, LinebreakToken) and token._end == offset:
+								token._end = start
+
+						previousToken = CharacterToken(previousToken, "'", start)
+						append(previousToken)
+
+						start.Column +=   1
+						start.Absolute += 1
+						raise TokenizerException("Ambiguous syntax detected. buffer: '{buffer}'".format(buffer=decode(content[index:second])), start)
+			elif (action is STRING_LITERAL) or (action is EXTENDED_ID):
+				end = content.find(char, index + 1)
+				if end == -1:
+					raise TokenizerException("End of document before ...", endOfDocument())
+
+				tokenType = StringLiteralToken if action is STRING_LITERAL else ExtendedIdentifier
+				previousToken = tokenType(previousToken, decode(content[index:end + 1]), start, position(end))
+				append(previousToken)
+				index = end + 1
+			elif action is DIRECTIVE:
+				if isinstance(previousToken, (SpaceToken, LinebreakToken)):
+					end = lineRun(content, index + 1).end()
+					if end == length:
+						raise TokenizerException("End of document before ...", endOfDocument())
+					elif content[end] == LINEFEED:
+						previousToken = DirectiveToken(previousToken, decode(content[index:end + 1]), start, position(end))
+						append(previousToken)
+						index = end + 1
+					else:
+						carriageReturn = end
+				else:
+					previousToken = CharacterToken(previousToken, "`", start)
+					append(previousToken)
+					index += 1
+			else:
+				raise TokenizerException("Unknown dispatch action.", position(index))
+
+			# A '\r' was found: emit a '\r\n' or '\r' linebreak, or finish a single-line comment.
+			if carriageReturn >= 0:
+				nextIndex = carriageReturn + 1
+				if nextIndex == length:
+					raise TokenizerException("End of document before ...", endOfDocument())
+
+				end = position(nextIndex)
+				if content[nextIndex] == LINEFEED:
+					if content.startswith(DOUBLE_DASH, index):
+						previousToken = SingleLineCommentToken(previousToken, decode(content[index:nextIndex + 1]), start, end)
+					else:
+						previousToken = LinebreakToken(previousToken, "\r\n", start, end)
+					append(previousToken)
+					index = nextIndex + 1
+				else:
+					previousToken = LinebreakToken(previousToken, "\r", start, end)
+					append(previousToken)
+					start = end
+					index = nextIndex
+					table, fallback, newStart = afterCR
+
+		# End of document
+		append(EndOfDocumentToken(previousToken, endOfDocument()))
@@ -0,0 +1,351 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+"""
+A compact, column-oriented storage for token streams.
+
+A :class:`TokenStore` doesn't keep one linked :class:`~pyVHDLParser.Token.Token` object per lexeme. Instead, it stores
+per token a kind code, the absolute start and end position and an index into a table of interned values in
+:class:`array.array` columns. This needs only a few bytes per token, so token streams of a whole project can be kept
+in memory and scanned without walking a token chain.
+
+Token objects are created on demand as read-only views. A view is an instance of a subclass of the stored token class,
+so ``isinstance`` checks, :attr:`~pyVHDLParser.Token.Token.NextToken`, :meth:`~pyVHDLParser.Token.Token.GetIterator`
+and :class:`~pyVHDLParser.Token.TokenIterator` work as for a linked token chain. Views are cached while they are
+referenced, thus a token can be compared by identity, e.g. as a ``stopToken``.
+
+.. code-block:: Python
+
+   store = TokenStore.FromContent(content)
+   for token in store.Find("clk"):
+     print(f"{token.Start}: {token.Value}")
+"""
+from array                      import array
+from itertools                  import compress
+from sys                        import intern
+from typing                     import Dict, Iterable, Iterator, List, Optional, Tuple
+from weakref                    import WeakValueDictionary
+
+from pyTooling.Decorators       import export
+from pyTooling.MetaClasses      import ExtendedType
+
+from pyVHDLParser               import SourceCodePosition, SourceCodeIndex
+from pyVHDLParser.Token         import Token, ValuedToken
+
+
+NO_POSITION = -1  #: Position stored for a token without end position.
+NO_VALUE =    -1  #: Value index stored for a token without value.
+
+_viewClasses: Dict[type, type] = {}
+
+
+def _PreviousToken(self) -> Optional[Token]:
+	index = self._index
+	return self._store._GetView(index - 1) if index > 0 else None
+
+
+def _NextToken(self) -> Optional[Token]:
+	index = self._index + 1
+	return self._store._GetView(index) if index < len(self._store) else None
+
+
+def _GetViewClass(tokenClass: type) -> type:
+	"""Returns a cached view class for a token class, which resolves the previous and next token by the store."""
+	try:
+		return _viewClasses[tokenClass]
+	except KeyError:
+		pass
+
+	slots = ("_store", "_index") if tokenClass.__weakrefoffset__ != 0 else ("_store", "_index", "__weakref__")
+	members = {
+		"__slots__":     slots,
+		"__module__":    tokenClass.__module__,
+		"__qualname__":  tokenClass.__qualname__,
+		"__doc__":       f"Read-only view of a :class:`{tokenClass.__qualname__}` in a :class:`TokenStore`.",
+		"PreviousToken": property(_PreviousToken),
+		"NextToken":     property(_NextToken)
+	}
+	viewClass = type(tokenClass)(tokenClass.__name__, (tokenClass, ), members)
+
+	_viewClasses[tokenClass] = viewClass
+	return viewClass
+
+
+@export
+class TokenStore(metaclass=ExtendedType, useSlots=True):
+	"""
+	A token stream stored as columns of kind codes, positions and value indices.
+
+	Positions are stored as absolute character positions (1-based). Rows and columns are computed on demand by the
+	store's :class:`~pyVHDLParser.SourceCodeIndex`, like for tokens created in *lazy position* mode. The few positions,
+	which differ from the computed ones, e.g. of the end of document token, are kept as position objects.
+	"""
+
+	_kinds:       array                      #: Kind code per token. It's an index into :attr:`_kindTable`.
+	_starts:      array                      #: Absolute start position per token.
+	_ends:        array                      #: Absolute end position per token or :data:`NO_POSITION`.
+	_values:      array                      #: Index into :attr:`_valueTable` per token or :data:`NO_VALUE`.
+	_kindTable:   List[Tuple[type, bool]]    #: Token class and if the token has a :attr:`~pyVHDLParser.Token.ValuedToken.Key` per kind code.
+	_kindCodes:   Dict[Tuple[type, bool], int]  #: Kind code per token class and key flag.
+	_valueTable:  List[str]                  #: Interned token values.
+	_valueCodes:  Dict[str, int]             #: Index into :attr:`_valueTable` per value.
+	_sourceIndex: SourceCodeIndex            #: Index to compute positions from absolute positions.
+	_positions:   Dict[int, Tuple[Optional[SourceCodePosition], Optional[SourceCodePosition]]]  #: Start and end positions per token, which can't be computed by :attr:`_sourceIndex`.
+	_views:       WeakValueDictionary        #: Views, which are referenced outside the store.
+
+	def __init__(self, sourceIndex: SourceCodeIndex):
+		"""
+		Initializes an empty token store.
+
+		:param sourceIndex: Source code index used by all views to compute positions.
+		"""
+		self._kinds =       array("H")
+		self._starts =      array("i")
+		self._ends =        array("i")
+		self._values =      array("i")
+		self._kindTable =   []
+		self._kindCodes =   {}
+		self._valueTable =  []
+		self._valueCodes =  {}
+		self._sourceIndex = sourceIndex
+		self._positions =   {}
+		self._views =       WeakValueDictionary()
+
+	@classmethod
+	def FromContent(cls, content: str) -> 'TokenStore':
+		"""
+		Tokenize a source code buffer into a new token store.
+
+		The table-driven tokenizer is used in *lazy position* mode, so no position objects are created.
+
+		:param content: Source code buffer.
+		:returns:       A new token store.
+		"""
+		from pyVHDLParser.Token.Parser import Tokenizer
+
+		tokenStream = Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True)
+		startToken =  next(tokenStream)
+
+		store = cls(startToken.SourceIndex)
+		store.Append(startToken)
+		store.Extend(tokenStream)
+		return store
+
+	@classmethod
+	def FromTokens(cls, tokens: Iterable[Token], content: str = None) -> 'TokenStore':
+		"""
+		Copy a token stream or token chain into a new token store.
+
+		Specific tokens, e.g. keywords reclassified by the block parser, are stored with their specific class.
+
+		:param tokens:      Iterable of tokens, e.g. a tokenizer or ``startToken.GetIterator(inclusiveStartToken=True)``.
+		:param content:     Source code buffer, if the tokens weren't created in *lazy position* mode.
+		:returns:           A new token store.
+		:raises ValueError: If the tokens have no source code index and no content is given.
+		"""
+		tokens =     iter(tokens)
+		startToken = next(tokens)
+
+		sourceIndex = startToken.SourceIndex
+		if sourceIndex is not None:
+			sourceIndex = sourceIndex.Current
+		else:
+			if content is None:
+				raise ValueError("Parameter 'content' is required for tokens without a source code index.")
+			sourceIndex = SourceCodeIndex(content)
+
+		store = cls(sourceIndex)
+		store.Append(startToken)
+		store.Extend(tokens)
+		return store
+
+	@classmethod
+	def FromColumns(cls, sourceIndex: SourceCodeIndex, kindTable: List[Tuple[type, bool]], kinds: array, starts: array, ends: array, values: array, valueTable: List[str], positions: Dict[int, Tuple[Optional[SourceCodePosition], Optional[SourceCodePosition]]] = None) -> 'TokenStore':
+		"""
+		Create a token store from existing columns, e.g. loaded by :func:`~pyVHDLParser.Serialization.LoadTokenStore`.
+
+		The columns are used without copying them.
+
+		:param sourceIndex: Source code index used by all views to compute positions.
+		:param kindTable:   Token class and key flag per kind code.
+		:param kinds:       Kind code per token (typecode ``H``).
+		:param starts:      Absolute start position per token (typecode ``i``).
+		:param ends:        Absolute end position per token or :data:`NO_POSITION` (typecode ``i``).
+		:param values:      Index into ``valueTable`` per token or :data:`NO_VALUE` (typecode ``i``).
+		:param valueTable:  Distinct token values.
+		:param positions:   Start and end positions per token index, which can't be computed by ``sourceIndex``.
+		:returns:           A new token store.
+		"""
+		store = cls(sourceIndex)
+		store._kinds =      kinds
+		store._starts =     starts
+		store._ends =       ends
+		store._values =     values
+		store._kindTable =  list(kindTable)
+		store._kindCodes =  {kind: code for code, kind in enumerate(store._kindTable)}
+		store._valueTable = list(valueTable)
+		store._valueCodes = {value: code for code, value in enumerate(store._valueTable)}
+		if positions is not None:
+			store._positions.update(positions)
+		return store
+
+	def Append(self, token: Token) -> None:
+		"""Append a token to the store."""
+		kind =   (token.__class__, hasattr(token, "Key"))
+		code =   self._kindCodes.get(kind)
+		if code is None:
+			code = len(self._kindTable)
+			self._kindTable.append(kind)
+			self._kindCodes[kind] = code
+		self._kinds.append(code)
+
+		start =         token._start
+		end =           token._end
+		tokenIndex =    token._sourceIndex
+		if (tokenIndex is not self._sourceIndex) and (tokenIndex is not None):
+			# The token's source code index might be redirected after an edit (see SourceCodeIndex.Redirect).
+			if start.__class__ is int:
+				start = tokenIndex.GetAbsolute(start)
+			if end.__class__ is int:
+				end = tokenIndex.GetAbsolute(end)
+		startPosition = None if start.__class__ is int or self._IsComputable(start) else start
+		endPosition =   None if end is None or end.__class__ is int or self._IsComputable(end) else end
+		if startPosition is not None or endPosition is not None:
+			self._positions[len(self._starts)] = (startPosition, endPosition)
+
+		self._starts.append(start if start.__class__ is int else start.Absolute)
+		self._ends.append(NO_POSITION if end is None else end if end.__class__ is int else end.Absolute)
+
+		if isinstance(token, ValuedToken):
+			value = token.Value
+			code =  self._valueCodes.get(value)
+			if code is None:
+				code = len(self._valueTable)
+				self._valueTable.append(value)
+				self._valueCodes[value] = code
+			self._values.append(code)
+		else:
+			self._values.append(NO_VALUE)
+
+	def _IsComputable(self, position: SourceCodePosition) -> bool:
+		computed = self._sourceIndex.GetPosition(position.Absolute)
+		return computed.Row == position.Row and computed.Column == position.Column
+
+	def Extend(self, tokens: Iterable[Token]) -> None:
+		"""Append all tokens of an iterable to the store."""
+		for token in tokens:
+			self.Append(token)
+
+	def __len__(self) -> int:
+		"""Returns the number of stored tokens."""
+		return len(self._kinds)
+
+	def __getitem__(self, index: int) -> Token:
+		"""Returns a view of the token at ``index``."""
+		if index < 0:
+			index += len(self._kinds)
+		if not (0 <= index < len(self._kinds)):
+			raise IndexError(f"Token index {index} out of range.")
+
+		return self._GetView(index)
+
+	def __iter__(self) -> Iterator[Token]:
+		"""Iterate views of all tokens."""
+		for index in range(len(self._kinds)):
+			yield self._GetView(index)
+
+	def _GetView(self, index: int) -> Token:
+		view = self._views.get(index)
+		if view is not None:
+			return view
+
+		tokenClass, hasKey = self._kindTable[self._kinds[index]]
+		view = object.__new__(_GetViewClass(tokenClass))
+		view._store =         self
+		view._index =         index
+		view._previousToken = None
+		view._start =         self._starts[index]
+		view._end =           None if self._ends[index] == NO_POSITION else self._ends[index]
+		view._sourceIndex =   self._sourceIndex
+		if index in self._positions:
+			start, end = self._positions[index]
+			if start is not None:
+				view._start = start
+			if end is not None:
+				view._end = end
+
+		valueCode = self._values[index]
+		if valueCode != NO_VALUE:
+			view.Value = self._valueTable[valueCode]
+			if hasKey:
+				view.Key = intern(view.Value.lower())
+
+		self._views[index] = view
+		return view
+
+	def GetKind(self, index: int) -> type:
+		"""Returns the token class of the token at ``index`` without creating a view."""
+		return self._kindTable[self._kinds[index]][0]
+
+	def GetValue(self, index: int) -> Optional[str]:
+		"""Returns the value of the token at ``index`` without creating a view, or ``None`` for tokens without value."""
+		valueCode = self._values[index]
+		return None if valueCode == NO_VALUE else self._valueTable[valueCode]
+
+	def FindIndices(self, value: str, caseSensitive: bool = False) -> List[int]:
+		"""
+		Find all tokens with a value by scanning the value column.
+
+		A case-insensitive search matches words, identifiers and keywords by their lower-cased
+		:attr:`~pyVHDLParser.Token.ValuedToken.Key`. A case-sensitive search compares the values of all tokens.
+
+		:param value:         Value to search for.
+		:param caseSensitive: If true, compare values exactly.
+		:returns:             Ascending token indices.
+		"""
+		if caseSensitive:
+			codes = {self._valueCodes[value]} if value in self._valueCodes else set()
+		else:
+			key =   value.lower()
+			codes = {code for code, tableValue in enumerate(self._valueTable) if tableValue.lower() == key}
+		if not codes:
+			return []
+
+		indices = list(compress(range(len(self._values)), map(codes.__contains__, self._values)))
+		if caseSensitive:
+			return indices
+
+		keyed = {code for code, (_, hasKey) in enumerate(self._kindTable) if hasKey}
+		kinds = self._kinds
+		return [index for index in indices if kinds[index] in keyed]
+
+	def Find(self, value: str, caseSensitive: bool = False) -> Iterator[Token]:
+		"""Iterate views of all tokens found by :meth:`FindIndices`."""
+		for index in self.FindIndices(value, caseSensitive):
+			yield self._GetView(index)
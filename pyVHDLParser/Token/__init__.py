@@ -27,12 +27,13 @@
 # limitations under the License.                                                                                       #
 # ==================================================================================================================== #
 #
-from typing                   import Iterator
+from sys                      import intern
+from typing                   import Iterator, Union
 
 from pyTooling.Decorators     import export
 from pyTooling.MetaClasses import ExtendedType
 
-from pyVHDLParser             import SourceCodePosition, StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
+from pyVHDLParser             import SourceCodePosition, SourceCodeIndex, StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
 from pyVHDLParser.Base        import ParserException
 
 
@@ -167,12 +168,13 @@ class TokenReverseIterator(metaclass=ExtendedType, useSlots=True):
 class Token(metaclass=ExtendedType, useSlots=True):
 	"""Base-class for all token classes."""
 
-	_previousToken:  'Token'              #: Reference to the previous token
-	NextToken:       'Token'              #: Reference to the next token
-	Start:           SourceCodePosition   #: Position for the token start
-	End:             SourceCodePosition   #: Position for the token end
+	_previousToken:  'Token'                         #: Reference to the previous token
+	NextToken:       'Token'                         #: Reference to the next token
+	_start:          Union[SourceCodePosition, int]  #: Position or absolute offset for the token start
+	_end:            Union[SourceCodePosition, int]  #: Position or absolute offset for the token end
+	_sourceIndex:    SourceCodeIndex                 #: Index to compute positions from absolute offsets (lazy position mode)
 
-	def __init__(self, previousToken: 'Token', start: SourceCodePosition, end: SourceCodePosition = None):
+	def __init__(self, previousToken: 'Token', start: Union[SourceCodePosition, int], end: Union[SourceCodePosition, int] = None):
 		"""
 		Initializes a token object.
 
@@ -180,12 +182,17 @@ class Token(metaclass=ExtendedType, useSlots=True):
 
 		* link this token to previous token.
 		* link previous token to this token.
+		* share the previous token's source code index.
+
+		In *lazy position* mode, ``start`` and ``end`` are absolute character positions (integers), which are translated
+		on demand to :class:`~pyVHDLParser.SourceCodePosition` objects.
 		"""
 		previousToken.NextToken = self
 		self._previousToken =     previousToken
 		self.NextToken =          None
-		self.Start =              start
-		self.End =                end
+		self._start =             start
+		self._end =               end
+		self._sourceIndex =       previousToken._sourceIndex
 
 	def __len__(self) -> int:
 		return self.End.Absolute - self.Start.Absolute + 1
@@ -205,6 +212,35 @@ class Token(metaclass=ExtendedType, useSlots=True):
 		self._previousToken = value
 		value.NextToken =     self
 
+	@property
+	def Start(self) -> SourceCodePosition:
+		"""Position for the token start."""
+		start = self._start
+		if start.__class__ is int:
+			return self._sourceIndex.GetPosition(start)
+		return start
+
+	@Start.setter
+	def Start(self, value: Union[SourceCodePosition, int]):
+		self._start = value
+
+	@property
+	def End(self) -> SourceCodePosition:
+		"""Position for the token end."""
+		end = self._end
+		if end.__class__ is int:
+			return self._sourceIndex.GetPosition(end)
+		return end
+
+	@End.setter
+	def End(self, value: Union[SourceCodePosition, int]):
+		self._end = value
+
+	@property
+	def SourceIndex(self) -> SourceCodeIndex:
+		"""Returns the source code index, if the token stream was created in lazy position mode, otherwise ``None``."""
+		return self._sourceIndex
+
 	@property
 	def Length(self) -> int:
 		return len(self)
@@ -224,7 +260,9 @@ class ValuedToken(Token):
 	A ValuedToken contains a :attr:`Value` field for the underlying string from the source code file.
 	"""
 
-	Value: str  #: String value of this token.
+	Value:       str  #: String value of this token.
+	Key:         str  #: Lower-cased and interned value of a word (see :class:`WordToken`). Not set for other tokens.
+	KeywordKind: int  #: Keyword kind of a word set by :func:`~pyVHDLParser.Token.Keywords.ClassifyKeywords`. Not set otherwise.
 
 	def __init__(self, previousToken: Token, value: str, start: SourceCodePosition, end: SourceCodePosition = None):
 		"""Initializes a *valued* token object."""
@@ -257,12 +295,17 @@ class ValuedToken(Token):
 class StartOfToken(Token):
 	"""Base-class for meta-tokens representing the start of a token stream."""
 
-	def __init__(self):
-		"""Initializes a StartOfToken object."""
+	def __init__(self, sourceIndex: SourceCodeIndex = None):
+		"""
+		Initializes a StartOfToken object.
+
+		:param sourceIndex: Source code index shared by all tokens in the stream, if tokens store absolute offsets.
+		"""
 		self._previousToken = None
 		self.NextToken =      None
-		self.Start =          SourceCodePosition(1, 1, 1)
-		self.End =            None
+		self._start =         SourceCodePosition(1, 1, 1)
+		self._end =           None
+		self._sourceIndex =   sourceIndex
 
 	def __len__(self) -> int:
 		"""Returns always 0."""
@@ -335,7 +378,7 @@ class FusedCharacterToken(CharacterToken):
 	def __init__(self, previousToken: Token, value: str, start: SourceCodePosition, end: SourceCodePosition):
 		"""Initializes a FusedCharacterToken object."""
 		super().__init__(previousToken, value, start=start)
-		self.End = end
+		self._end = end
 
 	# FIXME: check if base-base class implementation could solve this question.
 	def __len__(self) -> int:
@@ -359,6 +402,20 @@ class SpaceToken(ValuedToken):
 class WordToken(ValuedToken):
 	"""Token representing a string."""
 
+	def __init__(self, previousToken: Token, value: str, start: SourceCodePosition, end: SourceCodePosition = None):
+		"""
+		Initializes a WordToken object.
+
+		The lower-cased value is interned once as :attr:`Key`, so keyword checks and identifier lookups compare or hash
+		interned strings. If the value is already lower case, :attr:`Value` shares the interned string.
+		"""
+		key = intern(value.lower())
+		if key == value:
+			value = key
+
+		super().__init__(previousToken, value, start, end)
+		self.Key = key
+
 	def __eq__(self, other: str) -> bool:
 		"""Return true if the internal value is equal to the second operand."""
 		return self.Value == other
@@ -369,7 +426,7 @@ class WordToken(ValuedToken):
 
 	def __le__(self, other: str) -> bool:
 		"""Return true if the internal value is equivalent (lower case, string compare) to the second operand."""
-		return self.Value.lower() == other
+		return self.Key == other
 
 	def __ge__(self, other: str) -> bool:
 		"""Return true if the internal value is equivalent (upper case, string compare) to the second operand."""
@@ -37,8 +37,11 @@ __license__ =   "Apache License, Version 2.0"
 __version__ =   "0.8.0"
 __keywords__ =  ["parser", "vhdl", "code generator", "hdl"]
 
-from pyTooling.Decorators import export
-from pyTooling.MetaClasses import ExtendedType
+from bisect                  import bisect_right
+from typing                  import List, Optional, Union
+
+from pyTooling.Decorators    import export
+from pyTooling.MetaClasses   import ExtendedType
 
 
 @export
@@ -63,6 +66,195 @@ class SourceCodePosition(metaclass=ExtendedType, useSlots=True):
 		return "(line: {0: >3}, col: {1: >2})".format(self.Row, self.Column)
 
 
+@export
+class SourceCodeIndex(metaclass=ExtendedType, useSlots=True):
+	"""
+	Index of line start offsets for a source code buffer.
+
+	Tokens created in *lazy position* mode store only absolute offsets into the source code buffer. A shared index per
+	document translates such an offset on demand into a :class:`SourceCodePosition` by using a binary search over all line
+	start offsets. The index is extended lazily, so only the part of the document, which was asked for, is scanned for
+	linebreaks.
+
+	After an edit, an index can be redirected to the index of the edited buffer (see :meth:`Redirect`). Tokens referring
+	to the redirected index keep their absolute positions, which are moved on demand by an offset delta map.
+	"""
+
+	_content:    Optional[Union[str, bytes]]  #: Source code buffer as characters or as bytes. None, if redirected.
+	_lineStarts: Optional[List[int]]          #: Offset of the first character per row. None, if redirected.
+	_scanned:    int                          #: Linebreaks before this offset are recorded in :attr:`_lineStarts`.
+	_skipped:    Optional[List[int]]          #: Offsets of linebreaks, which don't start a new row. None, if redirected.
+	_target:     Optional['SourceCodeIndex']  #: Index of the edited buffer, if this index was redirected.
+	_breaks:     List[int]                    #: Offsets, from which on the delta at the same list index applies.
+	_deltas:     List[int]                    #: Difference between an offset in the target's buffer and in this buffer.
+
+	def __init__(self, content: Union[str, bytes]):
+		"""Initializes a SourceCodeIndex object for a source code buffer."""
+
+		self._content =    content
+		self._lineStarts = [0]
+		self._scanned =    0
+		self._skipped =    []
+		self._target =     None
+		self._breaks =     [0]
+		self._deltas =     [0]
+
+	def Copy(self) -> 'SourceCodeIndex':
+		"""Returns an independent copy of this index, e.g. to apply an edit by :meth:`Edit` before redirecting this index."""
+
+		index = SourceCodeIndex(self._content)
+		index._lineStarts = self._lineStarts.copy()
+		index._scanned =    self._scanned
+		index._skipped =    self._skipped.copy()
+		return index
+
+	def Redirect(self, index: 'SourceCodeIndex', offset: int, removedLength: int, insertedLength: int) -> None:
+		"""
+		Translate all positions of this index by the index of an edited source code buffer.
+
+		Offsets (0-based) after the removed range are moved by the length difference of the edit. Offsets within the removed
+		range refer to removed characters, so they aren't translated meaningfully.
+
+		All lookups are forwarded to the target index afterwards, so the source code buffer and the line starts of this
+		index are released.
+
+		:param index:          Index of the edited source code buffer.
+		:param offset:         Offset of the first removed or inserted character.
+		:param removedLength:  Number of removed characters.
+		:param insertedLength: Number of inserted characters.
+		"""
+		self._target =     index
+		self._breaks =     [0, offset + removedLength]
+		self._deltas =     [0, insertedLength - removedLength]
+		self._content =    None
+		self._lineStarts = None
+		self._skipped =    None
+
+	def _Compose(self) -> None:
+		"""Skip a redirected target by combining its offset delta map with the map of this index."""
+		target =       self._target
+		breaks =       self._breaks
+		deltas =       self._deltas
+		newBreaks =    []
+		newDeltas =    []
+		targetBreaks = target._breaks
+		targetDeltas = target._deltas
+
+		for i, (start, delta) in enumerate(zip(breaks, deltas)):
+			# Offsets from start up to the next break are moved to a range in the target, which might contain target breaks.
+			j = bisect_right(targetBreaks, start + delta) - 1
+			newBreaks.append(start)
+			newDeltas.append(delta + targetDeltas[j])
+
+			end = breaks[i + 1] + delta if i + 1 < len(breaks) else None
+			j += 1
+			while (j < len(targetBreaks)) and ((end is None) or (targetBreaks[j] < end)):
+				newBreaks.append(targetBreaks[j] - delta)
+				newDeltas.append(delta + targetDeltas[j])
+				j += 1
+
+		self._breaks = newBreaks
+		self._deltas = newDeltas
+		self._target = target._target
+
+	@property
+	def Current(self) -> 'SourceCodeIndex':
+		"""Returns the index of the current source code buffer, which is this index, unless it was redirected."""
+		if self._target is None:
+			return self
+
+		while self._target._target is not None:
+			self._Compose()
+		return self._target
+
+	def GetAbsolute(self, absolute: int) -> int:
+		"""
+		Translate an absolute character position of this index into an absolute position in the current source code buffer.
+
+		:param absolute: Absolute character position (1-based).
+		:returns:        Absolute character position (1-based) in the buffer of :attr:`Current`.
+		"""
+		if self._target is None:
+			return absolute
+
+		while self._target._target is not None:
+			self._Compose()
+		return absolute + self._deltas[bisect_right(self._breaks, absolute - 1) - 1]
+
+	def SkipLinebreak(self, offset: int) -> None:
+		"""Exclude the linebreak at ``offset`` (0-based) from row counting."""
+
+		if offset in self._skipped:
+			return
+
+		self._skipped.append(offset)
+		if offset < self._scanned:
+			self._lineStarts.remove(offset + 1)
+
+	def Edit(self, offset: int, removedLength: int, insertedText: str) -> List[int]:
+		"""
+		Apply a text edit to the indexed source code buffer.
+
+		Line starts after ``offset`` (0-based) are dropped and rescanned on demand. Skipped linebreaks at or after ``offset``
+		are dropped too, because they depend on how the edited text is tokenized.
+
+		:param offset:        Offset of the first removed or inserted character.
+		:param removedLength: Number of removed characters.
+		:param insertedText:  Inserted text.
+		:returns:             Moved offsets of dropped skipped linebreaks after the removed range, which can be restored by
+		                      :meth:`SkipLinebreak` for an unchanged token chain.
+		"""
+		removedEnd = offset + removedLength
+		delta =      len(insertedText) - removedLength
+		moved =      [skipped + delta for skipped in self._skipped if skipped >= removedEnd]
+
+		self._content =    self._content[:offset] + insertedText + self._content[removedEnd:]
+		self._lineStarts = self._lineStarts[:bisect_right(self._lineStarts, offset)]
+		self._scanned =    min(self._scanned, offset)
+		self._skipped =    [skipped for skipped in self._skipped if skipped < offset]
+
+		return moved
+
+	def _Scan(self, offset: int) -> None:
+		find =       self._content.find
+		linefeed =   "\n" if isinstance(self._content, str) else b"\n"
+		lineStarts = self._lineStarts
+		skipped =    self._skipped
+
+		linebreak = find(linefeed, self._scanned, offset)
+		while linebreak != -1:
+			if linebreak not in skipped:
+				lineStarts.append(linebreak + 1)
+			linebreak = find(linefeed, linebreak + 1, offset)
+
+		self._scanned = offset
+
+	def GetPosition(self, absolute: int) -> SourceCodePosition:
+		"""
+		Translate an absolute character position into a source code position.
+
+		:param absolute: Absolute character position (1-based) like in :attr:`SourceCodePosition.Absolute`.
+		:returns:        A new source code position object.
+		"""
+		if self._target is not None:
+			return self.Current.GetPosition(self.GetAbsolute(absolute))
+
+		offset = absolute - 1
+		if offset > self._scanned:
+			self._Scan(offset)
+
+		lineStarts = self._lineStarts
+		row = bisect_right(lineStarts, offset)
+		return SourceCodePosition(row, offset - lineStarts[row - 1] + 1, absolute)
+
+	@property
+	def Content(self) -> str:
+		if self._target is not None:
+			return self.Current._content
+
+		return self._content
+
+
 @export
 class StartOf(metaclass=ExtendedType, useSlots=True):
 	"""Base-class (mixin) for all StartOf*** classes."""
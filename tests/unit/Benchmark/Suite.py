@@ -0,0 +1,103 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+from os                         import utime
+from pathlib                  import Path
+from tempfile                 import TemporaryDirectory
+from unittest                 import TestCase
+
+from pyVHDLParser.Benchmark   import BenchmarkStage, BenchmarkInput, CorpusInputs, SyntheticInput, RunBenchmark, ReadJSON, CompareResults
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+VHDL_DIRECTORY = Path(__file__).parent.parent.parent.parent / "vhdl"
+
+
+class Suite(TestCase):
+	def test_SyntheticInput(self):
+		small = SyntheticInput(2)
+		large = SyntheticInput(20)
+
+		self.assertEqual("synthetic-2", small.Name)
+		self.assertEqual(small.Content, SyntheticInput(2).Content)
+		self.assertGreater(large.Characters, 9 * small.Characters)
+
+	def test_CorpusInputs(self):
+		names = [input.Name for input in CorpusInputs(VHDL_DIRECTORY)]
+
+		self.assertIn("GHDL/all08.vhdl", names)
+		self.assertEqual(sorted(names), names)
+
+	def test_Measurements(self):
+		report = RunBenchmark([SyntheticInput(2)], repeat=2, antlr4=False)
+		stages = report.Inputs[0].Stages
+
+		self.assertEqual([BenchmarkStage.Tokenizer, BenchmarkStage.TableDrivenTokenizer, BenchmarkStage.Blocks, BenchmarkStage.Groups, BenchmarkStage.DocumentModel], list(stages))
+		for stage in (BenchmarkStage.Tokenizer, BenchmarkStage.TableDrivenTokenizer, BenchmarkStage.Blocks):
+			result = stages[stage]
+			self.assertIsNone(result.Error)
+			self.assertEqual(2, len(result.Durations))
+			self.assertGreater(result.Items, 0)
+			self.assertGreater(result.CharactersPerSecond, 0)
+			self.assertGreater(result.PeakMemory, 0)
+		self.assertEqual(stages[BenchmarkStage.Tokenizer].Items, stages[BenchmarkStage.TableDrivenTokenizer].Items)
+
+	def test_FailingStage(self):
+		report = RunBenchmark([BenchmarkInput("broken", "entity e is\n\tport (a : in bit\n")], repeat=1, antlr4=False, traceMemory=False)
+		stages = report.Inputs[0].Stages
+
+		self.assertIsNotNone(stages[BenchmarkStage.Blocks].Error)
+		self.assertGreater(stages[BenchmarkStage.Blocks].Items, 0)
+		self.assertTrue(stages[BenchmarkStage.Groups].Skipped)
+		self.assertIsNone(stages[BenchmarkStage.Groups].Duration)
+
+	def test_JSON(self):
+		report = RunBenchmark([SyntheticInput(1)], repeat=1, traceMemory=False)
+
+		with TemporaryDirectory() as directory:
+			file = Path(directory) / "results.json"
+			report.WriteJSON(file)
+			result = ReadJSON(file)
+
+		self.assertEqual(report.ToDict(), result)
+		self.assertIn("antlr4-parser", result["inputs"][0]["stages"])
+
+		comparisons = CompareResults(result, result)
+		self.assertGreater(len(comparisons), 0)
+		for comparison in comparisons:
+			self.assertEqual(1.0, comparison.Speedup)
+
+	def test_InvalidRepeat(self):
+		with self.assertRaises(ValueError):
+			RunBenchmark([SyntheticInput(1)], repeat=0)
@@ -0,0 +1,93 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+#
+#
+from json       import loads
+from pathlib    import Path
+from subprocess import run
+from sys        import executable
+from textwrap   import dedent
+from unittest   import TestCase
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+ROOT = Path(__file__).parents[3]
+
+IMPORT_ALL = dedent("""\
+	from importlib import import_module
+	from pkgutil   import walk_packages
+	import pyVHDLParser.Blocks
+
+	for module in walk_packages(pyVHDLParser.Blocks.__path__, "pyVHDLParser.Blocks."):
+		import_module(module.name)
+	""")
+
+DUMP_TABLES = dedent("""\
+	from json import dumps
+	from pyVHDLParser.Blocks import MetaBlock
+
+	print(dumps({
+		f"{block.__module__}.{block.__qualname__}": sorted(block.KEYWORD_TRANSITIONS)
+		for block in MetaBlock.BLOCKS if hasattr(block, "__cls_init__")
+	}))
+	""")
+
+PARSE = dedent("""\
+	from pyVHDLParser.Token.Parser import Tokenizer
+	from pyVHDLParser.Blocks       import TokenToBlockParser
+
+	for _ in TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer("entity e is end entity;"))():
+		pass
+	""")
+
+
+class TransitionTables(TestCase):
+	def _RunScript(self, *parts: str):
+		process = run([executable, "-c", "\n".join(parts)], cwd=ROOT, capture_output=True, text=True)
+		self.assertEqual(0, process.returncode, process.stderr)
+		return loads(process.stdout)
+
+	def test_ParserInitializesBlocks(self):
+		tables = self._RunScript(PARSE, DUMP_TABLES)
+
+		self.assertIn("entity", tables["pyVHDLParser.Blocks.StartOfDocumentBlock"])
+
+	def test_IndependentOfImportOrder(self):
+		importedFirst = self._RunScript(IMPORT_ALL, PARSE, DUMP_TABLES)
+		importedLater = self._RunScript(PARSE, IMPORT_ALL, PARSE, DUMP_TABLES)
+
+		self.assertIn("pyVHDLParser.Blocks.Structural.Component.NameBlock", importedLater)
+		self.assertEqual(importedFirst, importedLater)
@@ -36,7 +36,7 @@ from pyTooling.MetaClasses      import ExtendedType
 from pyVHDLParser.Base          import ParserException
 from pyVHDLParser.Token         import StartOfDocumentToken, EndOfDocumentToken, Token, CharacterTranslation
 from pyVHDLParser.Token.Parser  import Tokenizer, TokenizerException
-from pyVHDLParser.Blocks        import StartOfDocumentBlock, EndOfDocumentBlock, TokenToBlockParser, MetaBlock, Block, BlockParserException
+from pyVHDLParser.Blocks        import StartOfDocumentBlock, EndOfDocumentBlock, TokenToBlockParser, Block, BlockParserException, InitializeBlocks
 
 from tests.Interfaces           import ITestcase as ITC
 
@@ -47,11 +47,7 @@ from tests.Linking import TokenizerChecks
 class Initializer(metaclass=ExtendedType, singleton=True):
 	def __init__(self):
 		print("Init all blocks.")
-		for block in MetaBlock.BLOCKS:
-			try:
-				block.__cls_init__()
-			except AttributeError:
-				pass
+		InitializeBlocks()
 
 
 class Result(Flags):
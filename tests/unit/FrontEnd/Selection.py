@@ -0,0 +1,103 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+from os                         import utime
+from pathlib                    import Path
+from unittest                   import TestCase, skipIf, skipUnless
+
+from pyVHDLModel                import Document as ModelDocument
+
+from pyVHDLParser.Blocks        import BlockParserException
+from pyVHDLParser.FrontEnd      import FrontEnd, DetailLevel, IsAvailable, SelectFrontEnd, ParseDocument
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+VHDL_DIRECTORY = Path(__file__).parent.parent.parent.parent / "vhdl"
+
+ANTLR4_AVAILABLE = IsAvailable(FrontEnd.ANTLR4)
+
+
+class Selection(TestCase):
+	def test_DesignUnitsUseNative(self):
+		self.assertIs(FrontEnd.Native, SelectFrontEnd(DetailLevel.DesignUnits))
+
+	def test_InterfacesUseANTLR4IfAvailable(self):
+		expected = FrontEnd.ANTLR4 if ANTLR4_AVAILABLE else FrontEnd.Native
+
+		self.assertIs(expected, SelectFrontEnd(DetailLevel.Interfaces))
+		self.assertIs(expected, SelectFrontEnd(DetailLevel.Full))
+
+	@skipIf(ANTLR4_AVAILABLE, "ANTLR4 runtime is installed.")
+	def test_ANTLR4Missing(self):
+		with self.assertRaises(ImportError):
+			ParseDocument(VHDL_DIRECTORY / "AssertStatement.vhdl", frontEnd=FrontEnd.ANTLR4)
+
+
+class NativeDesignUnits(TestCase):
+	def test_Architecture(self):
+		document = ParseDocument(VHDL_DIRECTORY / "AssertStatement.vhdl", frontEnd=FrontEnd.Native)
+
+		self.assertIsInstance(document, ModelDocument)
+		self.assertEqual(["ent"], list(document.Architectures))
+		self.assertEqual("arch", document.Architectures["ent"]["arch"].Identifier)
+
+	def test_EntitiesAndPackages(self):
+		content = "entity e is\nend entity;\n\npackage p is\nend package;\n\npackage body p is\nend package body;\n"
+
+		document = ParseDocument("memory.vhdl", content=content)
+
+		self.assertEqual(Path("memory.vhdl"), document.Path)
+		self.assertEqual(["e"], list(document.Entities))
+		self.assertEqual(["p"], list(document.Packages))
+		self.assertEqual(["p"], list(document.PackageBodies))
+		self.assertEqual(3, len(document.DesignUnits))
+
+	def test_ParserException(self):
+		with self.assertRaises(BlockParserException):
+			ParseDocument(VHDL_DIRECTORY / "Use.vhdl")
+
+
+@skipUnless(ANTLR4_AVAILABLE, "ANTLR4 runtime is not installed.")
+class SharedModel(TestCase):
+	def test_SameDesignUnits(self):
+		file = VHDL_DIRECTORY / "AssertStatement.vhdl"
+
+		native = ParseDocument(file, frontEnd=FrontEnd.Native)
+		antlr4 = ParseDocument(file, frontEnd=FrontEnd.ANTLR4)
+
+		self.assertEqual(type(native), type(antlr4))
+		self.assertEqual(
+			[(unit.__class__.__name__, unit.NormalizedIdentifier) for unit in native.DesignUnits],
+			[(unit.__class__.__name__, unit.NormalizedIdentifier) for unit in antlr4.DesignUnits]
+		)
@@ -0,0 +1,116 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from gc                        import collect, get_objects
+from unittest                  import TestCase
+
+from pyVHDLParser.Token.Parser import Tokenizer
+from pyVHDLParser.Blocks       import Block, TokenToBlockParser
+from pyVHDLParser.Groups       import BlockToGroupParser, EndOfDocumentGroup
+from tests.unit.Common         import Initializer
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	Initializer()
+
+
+UNIT = """\
+library ieee;
+use ieee.std_logic_1164.all;
+-- comment
+package p{0} is
+end package;
+
+architecture a{0} of e is
+begin
+	assert false report message severity note;
+end architecture;
+"""
+
+
+def GroupParser(code: str) -> BlockToGroupParser:
+	return BlockToGroupParser(TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer(code))())
+
+
+def Blocks(group):
+	block = group.StartBlock
+	blocks = [block]
+	while block is not group.EndBlock:
+		block = block.NextBlock
+		blocks.append(block)
+	return blocks
+
+
+class TopLevelGroups(TestCase):
+	def test_Groups(self):
+		code = UNIT.format(0) + UNIT.format(1)
+
+		kept =     [(group.__class__, str(group)) for group in GroupParser(code).GetTopLevelGroups(release=False)]
+		released = [(group.__class__, str(group)) for group in GroupParser(code).GetTopLevelGroups()]
+
+		self.assertEqual(kept, released)
+		self.assertEqual(19, len(released))
+		self.assertIs(EndOfDocumentGroup, released[-1][0])
+
+	def test_Release(self):
+		parser = GroupParser(UNIT.format(0) + UNIT.format(1))
+		groups = parser.GetTopLevelGroups()
+
+		first =      next(groups)
+		startBlock = first.StartBlock.PreviousBlock
+		self.assertIs(first.StartBlock, startBlock.NextBlock)
+
+		# the previous group is released, when the next group is yielded
+		second = next(groups)
+		self.assertIsNone(first.StartBlock.PreviousBlock)
+		self.assertIsNone(first.EndBlock.NextBlock)
+		self.assertIsNone(first.EndBlock.EndToken.NextToken)
+		self.assertIs(second.StartBlock, startBlock.NextBlock)
+		self.assertIs(startBlock.StartToken, second.StartBlock.StartToken.PreviousToken)
+
+		for group in groups:
+			if isinstance(group, EndOfDocumentGroup):
+				break
+			# groups keep their own blocks
+			self.assertIs(group.EndBlock, Blocks(group)[-1])
+
+	def test_BoundedMemory(self):
+		for group in GroupParser("".join(UNIT.format(i) for i in range(200))).GetTopLevelGroups():
+			pass
+		del group
+		collect()
+
+		self.assertLess(sum(1 for obj in get_objects() if isinstance(obj, Block)), 100)
@@ -0,0 +1,204 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer, TokenizerException
+from pyVHDLParser.Blocks        import TokenToBlockParser, BlockParserException, InitializeBlocks
+from pyVHDLParser.Incremental   import IncrementalDocument
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+CODE = "".join(f"""entity e{i} is
+	generic (G : integer := {i});
+end entity;
+
+architecture rtl of e{i} is
+	signal s : bit;
+begin
+	-- comment {i}
+	process (a)
+	begin
+		null;
+	end process;
+end architecture;
+
+""" for i in range(4))
+
+
+def Position(position):
+	return position.Row, position.Column, position.Absolute
+
+
+def ChainSummary(startToken, startBlock):
+	tokens = []
+	token = startToken
+	while token is not None:
+		tokens.append((token.__class__, getattr(token, "Value", None), Position(token.Start), None if token.End is None else Position(token.End)))
+		token = token.NextToken
+
+	blocks = []
+	block = startBlock
+	while block is not None:
+		blocks.append((block.__class__, Position(block.StartToken.Start), None if block.EndToken is None else Position(block.EndToken.End)))
+		block = block.NextBlock
+
+	return tokens, blocks
+
+
+def FullParse(content, lazyPositions):
+	InitializeBlocks()
+
+	tokenStream = Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=lazyPositions)
+	parser =      TokenToBlockParser(tokenStream)
+	startBlock =  parser.NewBlock
+	try:
+		for _ in parser():
+			pass
+	except (TokenizerException, BlockParserException):
+		pass
+
+	return ChainSummary(startBlock.StartToken, startBlock)
+
+
+class Update(TestCase):
+	def assertFullParse(self, document: IncrementalDocument, lazyPositions: bool = False):
+		self.assertEqual(FullParse(document.Content, lazyPositions), ChainSummary(document.StartToken, document.StartBlock))
+
+	def test_Resynchronize(self):
+		for lazyPositions in (False, True):
+			with self.subTest(lazyPositions=lazyPositions):
+				document =  IncrementalDocument(CODE, lazyPositions=lazyPositions)
+				oldBlocks = list(document.StartBlock.GetIterator(inclusiveStartBlock=True))
+
+				offset = CODE.index("signal s", CODE.index("e1 is"))
+				update = document.Update(offset, 8, "signal s1 : bit;\n\tsignal s2")
+
+				self.assertTrue(update.Resynchronized)
+				self.assertIsNone(document.Error)
+				self.assertFullParse(document, lazyPositions)
+
+				# blocks before and after the edited line are reused
+				newBlocks = list(document.StartBlock.GetIterator(inclusiveStartBlock=True))
+				self.assertLess(update.BlockCount, 10)
+				self.assertIs(oldBlocks[-1], newBlocks[-1])
+				self.assertIs(oldBlocks[1], newBlocks[1])
+
+	def test_LazyPositionsAfterEdits(self):
+		document = IncrementalDocument(CODE, lazyPositions=True)
+		endBlock = list(document.StartBlock.GetIterator(inclusiveStartBlock=True))[-4]
+		start =    endBlock.StartToken._start
+
+		for marker, removedLength, insertedText in (("signal s", 8, "signal s1 : bit;\n\tsignal s2"), ("-- comment 2", 0, "\n\n"), ("e1 is", 2, "e11")):
+			update = document.Update(document.Content.index(marker), removedLength, insertedText)
+
+			self.assertTrue(update.Resynchronized)
+			self.assertFullParse(document, True)
+
+			# tokens after the edit aren't touched, their positions are moved by the source code index
+			self.assertEqual(start, endBlock.StartToken._start)
+			self.assertEqual(document.Content.rindex("end architecture"), endBlock.StartToken.Start.Absolute - 1)
+
+	def test_RedirectedIndicesReleaseContent(self):
+		document = IncrementalDocument(CODE, lazyPositions=True)
+		offset =   CODE.index("-- comment 2")
+
+		for i in range(50):
+			document.Update(offset, 0, "x" if i % 2 == 0 else "\n")
+			self.assertFullParse(document, True)
+
+		# indices referred by tokens and their redirection targets
+		indices = {}
+		token =   document.StartToken
+		while token is not None:
+			index = token.SourceIndex
+			while index is not None:
+				indices[id(index)] = index
+				index = index._target
+			token = token.NextToken
+
+		self.assertLessEqual(len(indices), 51)
+		self.assertEqual([document.Content], [index._content for index in indices.values() if index._content is not None])
+		self.assertEqual(document.Content, document.StartToken.SourceIndex.Content)
+
+	def test_EditAtDocumentStart(self):
+		document = IncrementalDocument(CODE)
+		update =   document.Update(0, 0, "-- header\n")
+
+		self.assertTrue(update.Resynchronized)
+		self.assertFullParse(document)
+
+	def test_ErrorAndUndo(self):
+		for lazyPositions in (False, True):
+			with self.subTest(lazyPositions=lazyPositions):
+				document = IncrementalDocument(CODE, lazyPositions=lazyPositions)
+				offset =   CODE.index("end process;", CODE.index("e2 is"))
+
+				update = document.Update(offset, 3, "\"")
+				self.assertFalse(update.Resynchronized)
+				self.assertIsInstance(document.Error, TokenizerException)
+				self.assertFullParse(document, lazyPositions)
+
+				update = document.Update(offset, 1, "end")
+				self.assertEqual(CODE, document.Content)
+				self.assertIsNone(document.Error)
+				self.assertFullParse(document, lazyPositions)
+
+	def test_KeepErrorAfterEdit(self):
+		content =  CODE + "entity broken is\n\tfoo;\nend entity;\n"
+		document = IncrementalDocument(content)
+		self.assertIsInstance(document.Error, BlockParserException)
+
+		update = document.Update(content.index("-- comment 0"), 0, "\n")
+
+		self.assertTrue(update.Resynchronized)
+		self.assertIsInstance(document.Error, BlockParserException)
+		self.assertEqual(document.Content[:document.Content.index("foo")].count("\n") + 1, document.Error.Token.Start.Row)
+		self.assertFullParse(document)
+
+	def test_OutsideOfDocument(self):
+		document = IncrementalDocument(CODE)
+
+		with self.assertRaises(ValueError):
+			document.Update(len(CODE), 1, "")
+
+	def test_ResumeTokenizerAfterLinebreak(self):
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer("a b\nc"))
+		with self.assertRaises(TokenizerException):
+			list(Tokenizer.GetTableDrivenVHDLTokenizer("a b\nc", previousToken=tokens[2]))
+
+		resumed = list(Tokenizer.GetTableDrivenVHDLTokenizer("a b\nd", previousToken=tokens[4]))
+		self.assertEqual(["d", None], [getattr(token, "Value", None) for token in resumed])
+		self.assertIs(resumed[0], tokens[4].NextToken)
+		self.assertEqual((2, 1, 5), Position(resumed[0].Start))
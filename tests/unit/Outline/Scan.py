@@ -0,0 +1,104 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from unittest                  import TestCase
+
+from pyVHDLParser.Outline      import OutlineKind, GetOutline, ScanOutline
+from pyVHDLParser.Token.Parser import Tokenizer
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+CODE = """\
+-- counter
+library ieee;
+use ieee.std_logic_1164.all, ieee.numeric_std.all;
+
+entity counter is
+	port (clock : in std_logic);
+	attribute a of f : function is true;
+end entity;
+
+architecture rtl of counter is
+	component c is end component;
+	function f return integer is begin if true then return 1; end if; end function;
+	function g return integer is new work.h;
+begin
+	u0: component c;
+	g0: for i in 0 to 3 generate
+		p: process use work.p.all; begin case i is when others => loop exit; end loop; end case; end process;
+	end generate;
+end architecture;
+
+package p is new work.gp generic map (W => 8);
+
+context ctx is
+	library ieee;
+	context ieee.ieee_std_context;
+end context;
+"""
+
+
+class Outline(TestCase):
+	def test_Outline(self):
+		outline = [(item.Kind, item.Names, item.Start.Row) for item in GetOutline(CODE)]
+
+		self.assertEqual([
+			(OutlineKind.Comment,              ("-- counter\n", ),                             1),
+			(OutlineKind.Library,              ("ieee", ),                                     2),
+			(OutlineKind.Use,                  ("ieee.std_logic_1164.all", "ieee.numeric_std.all"), 3),
+			(OutlineKind.Entity,               ("counter", ),                                  5),
+			(OutlineKind.EndOfDesignUnit,      ("counter", ),                                  8),
+			(OutlineKind.Architecture,         ("rtl", "counter"),                             10),
+			(OutlineKind.Use,                  ("work.p.all", ),                               17),
+			(OutlineKind.EndOfDesignUnit,      ("rtl", "counter"),                             19),
+			(OutlineKind.PackageInstantiation, ("p", "work.gp"),                               21),
+			(OutlineKind.Context,              ("ctx", ),                                      23),
+			(OutlineKind.Library,              ("ieee", ),                                     24),
+			(OutlineKind.ContextReference,     ("ieee.ieee_std_context", ),                    25),
+			(OutlineKind.EndOfDesignUnit,      ("ctx", ),                                      26),
+		], outline)
+
+	def test_CommentsOnly(self):
+		outline = list(GetOutline(CODE, structure=False))
+
+		self.assertEqual([OutlineKind.Comment], [item.Kind for item in outline])
+
+	def test_StructureOnly(self):
+		tokens =  list(Tokenizer.GetVHDLTokenizer(CODE))
+		outline = list(ScanOutline(tokens, comments=False))
+
+		self.assertNotIn(OutlineKind.Comment, [item.Kind for item in outline])
+		self.assertIs(tokens[-3], outline[-1].EndToken)
+		self.assertEqual("end", outline[-1].StartToken.Value)
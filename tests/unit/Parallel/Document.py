@@ -0,0 +1,342 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from unittest                   import TestCase
+
+from pyVHDLParser.Token         import StartOfDocumentToken, EndOfDocumentToken
+from pyVHDLParser.Token.Parser  import Tokenizer, TokenizerException
+from pyVHDLParser.Blocks        import TokenToBlockParser, BlockParserException
+from pyVHDLParser.Groups        import BlockToGroupParser, GroupParserException, StartOfDocumentGroup, EndOfDocumentGroup
+from pyVHDLParser.Parallel      import ParseInParallel, TokenizeInParallel, _FindBoundaries, _FindLineBoundaries
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+UNIT = """-- unit {index}
+library ieee;
+use     ieee.std_logic_1164.all;
+
+architecture rtl of e{index} is
+begin
+end architecture;
+/* block comment
+architecture commented of e{index} is
+*/
+package p{index} is
+end package;
+
+package body p{index} is
+end package body;
+"""
+
+CODE = "".join(UNIT.format(index=index) for index in range(8))
+
+# A sequential parse of this unit fails with an AttributeError.
+FAILING_UNIT = """package body q is
+	function f(a : integer) return string is
+		procedure p is
+		begin
+		end procedure;
+	begin
+	end function;
+end package body;
+"""
+
+
+def Position(position):
+	return None if position is None else (position.Row, position.Column, position.Absolute)
+
+
+def Summary(tokens, blocks, groups):
+	"""Summarize tokens, blocks and all groups reachable from the emitted groups by classes, values, positions and links."""
+	tokenIndices = {id(token): index for index, token in enumerate(tokens)}
+	blockIndices = {id(block): index for index, block in enumerate(blocks)}
+	tokenSummary = [(token.__class__, getattr(token, "Value", None), Position(token.Start), Position(token.End)) for token in tokens]
+	blockSummary = [
+		(block.__class__, tokenIndices[id(block.StartToken)], tokenIndices.get(id(block.EndToken)), block.MultiPart)
+		for block in blocks
+	]
+
+	ordered =      list(groups)
+	groupIndices = {id(group): index for index, group in enumerate(ordered)}
+
+	def index(group):
+		if group is None:
+			return None
+		if id(group) not in groupIndices:
+			groupIndices[id(group)] = len(ordered)
+			ordered.append(group)
+		return groupIndices[id(group)]
+
+	groupSummary = []
+	for group in ordered:
+		subGroups = getattr(group, "_subGroups", None)
+		groupSummary.append((
+			group.__class__,
+			blockIndices.get(id(group.StartBlock)),
+			blockIndices.get(id(group.EndBlock)),
+			index(group.PreviousGroup),
+			index(group.NextGroup),
+			index(getattr(group, "InnerGroup", None)),
+			None if subGroups is None else {cls: [index(subGroup) for subGroup in members] for cls, members in subGroups.items()}
+		))
+
+	return tokenSummary, blockSummary, groupSummary
+
+
+def Parse(content, groups=True):
+	"""Parse sequentially like a pipeline of generators. Returns all passed tokens, blocks and groups and the exception."""
+	tokens = []
+	blocks = []
+	result = []
+
+	def collect(iterator, items):
+		for item in iterator:
+			items.append(item)
+			yield item
+
+	try:
+		blockStream = collect(TokenToBlockParser(collect(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True), tokens))(), blocks)
+		if groups:
+			result.extend(BlockToGroupParser(blockStream)())
+		else:
+			for _ in blockStream:
+				pass
+	except (TokenizerException, BlockParserException, GroupParserException) as ex:
+		return tokens, blocks, result, ex
+
+	return tokens, blocks, result, None
+
+
+def Tokenize(content):
+	"""Tokenize sequentially. Returns all tokens and the exception."""
+	tokens = []
+	try:
+		tokens.extend(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True))
+	except TokenizerException as ex:
+		return tokens, ex
+
+	return tokens, None
+
+
+class Segments(TestCase):
+	def test_Boundaries(self):
+		boundaries = _FindBoundaries(CODE, 1)
+
+		self.assertEqual(0, boundaries[0])
+		self.assertEqual(len(CODE), boundaries[-1])
+		for boundary in boundaries[1:-1]:
+			self.assertEqual("\n", CODE[boundary - 1])
+			self.assertRegex(CODE[boundary:boundary + 12], r"^(library|use|architecture|package)\b")
+
+	def test_Sparse(self):
+		boundaries = _FindBoundaries(CODE, 500)
+
+		for start, end in zip(boundaries, boundaries[1:-1]):
+			self.assertGreaterEqual(end - start, 500)
+
+	def test_Merged(self):
+		document = ParseInParallel(CODE, maxWorkers=2, segmentLength=1)
+
+		self.assertIsNone(document.Error)
+		self.assertEqual(0, document.Segments[0][0])
+		self.assertEqual(len(CODE), document.Segments[-1][1])
+		starts = [start for start, _ in document.Segments]
+		for boundary in _FindBoundaries(CODE, 1)[:-1]:
+			if CODE.startswith("architecture commented", boundary):
+				self.assertNotIn(boundary, starts)
+			else:
+				self.assertIn(boundary, starts)
+
+	def test_SingleWorker(self):
+		document = ParseInParallel(CODE, maxWorkers=1, segmentLength=1)
+
+		self.assertEqual([(0, len(CODE))], document.Segments)
+
+
+class Equivalence(TestCase):
+	def _Check(self, content, groups=True, maxWorkers=2, segmentLength=1):
+		tokens, blocks, result, error = Parse(content, groups)
+		document = ParseInParallel(content, maxWorkers=maxWorkers, segmentLength=segmentLength, groups=groups)
+
+		self.assertIsNone(error)
+		self.assertIsNone(document.Error)
+		self.assertEqual(Summary(tokens, blocks, result), Summary(document.Tokens, document.Blocks, document.Groups))
+		return document
+
+	def test_Text(self):
+		self._Check(CODE)
+
+	def test_WindowsLinebreaks(self):
+		self._Check(CODE.replace("\n", "\r\n"))
+
+	def test_Bytes(self):
+		self._Check(CODE.encode("utf-8"))
+
+	def test_BlocksOnly(self):
+		document = self._Check(CODE, groups=False)
+
+		self.assertEqual([], document.Groups)
+		self.assertIsNone(document.StartGroup)
+
+	def test_UseClauseInArchitecture(self):
+		self._Check(CODE.replace("begin\nend architecture", "use work.p0.all;\nbegin\nend architecture"))
+
+	def test_SingleWorker(self):
+		self._Check(CODE, maxWorkers=1)
+
+	def test_Chains(self):
+		document = self._Check(CODE)
+
+		self.assertIsInstance(document.StartToken, StartOfDocumentToken)
+		self.assertIsInstance(document.Tokens[-1], EndOfDocumentToken)
+		self.assertIs(document.StartBlock.StartToken, document.StartToken)
+		self.assertIsInstance(document.StartGroup, StartOfDocumentGroup)
+		self.assertIsInstance(document.Groups[-1], EndOfDocumentGroup)
+
+		for previous, token in zip(document.Tokens, document.Tokens[1:]):
+			self.assertIs(token, previous.NextToken)
+			self.assertIs(previous, token.PreviousToken)
+		for previous, block in zip(document.Blocks, document.Blocks[1:]):
+			self.assertIs(block, previous.NextBlock)
+			self.assertIs(previous, block.PreviousBlock)
+
+		sourceIndex = document.StartToken.SourceIndex
+		for token in document.Tokens:
+			self.assertIs(sourceIndex, token.SourceIndex)
+
+
+class Errors(TestCase):
+	def _Check(self, content, groups=True):
+		tokens, blocks, result, error = Parse(content, groups)
+		document = ParseInParallel(content, maxWorkers=2, segmentLength=1, groups=groups)
+
+		self.assertIsNotNone(error)
+		self.assertIs(error.__class__, document.Error.__class__)
+		self.assertEqual(str(error), str(document.Error))
+
+		expected = Summary(tokens, [], [])[0]
+		self.assertEqual(expected, Summary(document.Tokens, [], [])[0][:len(expected)])
+		return error, document
+
+	def test_Tokenizer(self):
+		error, document = self._Check(CODE + "/* unterminated\npackage q is\n")
+
+		self.assertEqual(Position(error.Position), Position(document.Error.Position))
+
+	def test_BlockParser(self):
+		error, document = self._Check(CODE.replace("package p5 is", "package p5 is is"), groups=False)
+
+		self.assertEqual(Position(error.Token.Start), Position(document.Error.Token.Start))
+		self.assertLess(document.Segments[-1][1], len(CODE))
+
+	def test_Failure(self):
+		with self.assertRaises(AttributeError):
+			ParseInParallel(CODE + FAILING_UNIT + CODE, maxWorkers=2, segmentLength=1, groups=False)
+
+	def test_FailureAfterError(self):
+		# The package body fails with an AttributeError in a sequential parse, but only after the first error.
+		error, document = self._Check(CODE.replace("package p2 is", "package p2 is is") + FAILING_UNIT, groups=False)
+
+		self.assertIsInstance(error, BlockParserException)
+		self.assertEqual(Position(error.Token.Start), Position(document.Error.Token.Start))
+
+	def test_GroupParser(self):
+		error, document = self._Check(CODE.replace("package p3 is", "entity e3 is\nend entity;\n\npackage p3 is"))
+
+		self.assertEqual(Position(error.Block.StartToken.Start), Position(document.Error.Block.StartToken.Start))
+
+
+class Tokenization(TestCase):
+	def _Check(self, content):
+		tokens, error = Tokenize(content)
+		document =      TokenizeInParallel(content, maxWorkers=2, segmentLength=1)
+
+		self.assertIsNone(error)
+		self.assertIsNone(document.Error)
+		self.assertEqual([], document.Blocks)
+		self.assertEqual(Summary(tokens, [], [])[0], Summary(document.Tokens, [], [])[0])
+		for previous, token in zip(document.Tokens, document.Tokens[1:]):
+			self.assertIs(token, previous.NextToken)
+			self.assertIs(previous, token.PreviousToken)
+		return document
+
+	def test_LineBoundaries(self):
+		boundaries = _FindLineBoundaries(CODE, 40)
+
+		self.assertEqual(0, boundaries[0])
+		self.assertEqual(len(CODE), boundaries[-1])
+		for start, end in zip(boundaries, boundaries[1:-1]):
+			self.assertEqual("\n", CODE[end - 1])
+			self.assertGreaterEqual(end - start, 40)
+
+	def test_Text(self):
+		self._Check(CODE)
+
+	def test_WindowsLinebreaks(self):
+		self._Check(CODE.replace("\n", "\r\n"))
+
+	def test_Bytes(self):
+		self._Check(CODE.replace("block comment", "Größe").encode("utf-8"))
+
+	def test_MultiLineComment(self):
+		document = self._Check(CODE)
+
+		starts = [start for start, _ in document.Segments]
+		for boundary in _FindLineBoundaries(CODE, 1)[:-1]:
+			if CODE.startswith("architecture commented", boundary) or CODE.startswith("*/", boundary):
+				self.assertNotIn(boundary, starts)
+			else:
+				self.assertIn(boundary, starts)
+
+	def test_LinefeedAfterCharacter(self):
+		# The linefeed after '.' is a character token, so the next line starts with a space token instead of an indentation token.
+		document = self._Check("x\n\t.\n\tb\n")
+
+		self.assertEqual([(0, 2), (2, 8)], document.Segments)
+
+	def test_UnterminatedComment(self):
+		content =       CODE + "/* unterminated\npackage q is\n"
+		tokens, error = Tokenize(content)
+		document =      TokenizeInParallel(content, maxWorkers=2, segmentLength=1)
+
+		self.assertIsInstance(document.Error, TokenizerException)
+		self.assertEqual(str(error), str(document.Error))
+		self.assertEqual(Summary(tokens, [], [])[0], Summary(document.Tokens, [], [])[0])
+
+	def test_SingleWorker(self):
+		document = TokenizeInParallel(CODE, maxWorkers=1, segmentLength=1)
+
+		self.assertEqual([(0, len(CODE))], document.Segments)
+		self.assertIsInstance(document.Tokens[-1], EndOfDocumentToken)
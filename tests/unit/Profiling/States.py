@@ -0,0 +1,142 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from pathlib                        import Path
+from pstats                         import Stats
+from tempfile                       import TemporaryDirectory
+from textwrap                       import dedent
+from unittest                       import TestCase
+
+from pyVHDLParser.Decorators        import ExecutionCounter, ExecutionTimer
+from pyVHDLParser.Token.Parser      import Tokenizer
+from pyVHDLParser.Blocks            import TokenToBlockParser, MetaBlock, BlockParserException
+from pyVHDLParser.Blocks.Structural import Architecture, Entity
+from pyVHDLParser.Blocks.Type       import ResolutionIndication
+from pyVHDLParser.Groups            import BlockToGroupParser
+from pyVHDLParser.Profiling         import StateProfiler
+from tests.unit.Common              import Initializer
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	Initializer()
+
+
+CODE = dedent("""\
+	architecture a of e is
+	begin
+		assert false report message severity note;
+	end architecture;
+	""")
+
+
+class Profiler(TestCase):
+	def setUp(self) -> None:
+		self._profiler = StateProfiler()
+		blockStream = TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer(CODE), profiler=self._profiler)()
+		for _ in BlockToGroupParser(blockStream, profiler=self._profiler)():
+			pass
+
+	def test_States(self):
+		statistics = {entry.Name: entry for entry in self._profiler.GetStateStatistics()}
+
+		self.assertEqual(1, statistics["Architecture.NameBlock.stateArchitectureKeyword"].Count)
+		self.assertIn("DesignUnit.ArchitectureGroup.stateParse", statistics)
+		self.assertEqual(self._profiler.Count, sum(entry.Count for entry in statistics.values()))
+		for entry in statistics.values():
+			self.assertLessEqual(entry.OwnTime, entry.TotalTime)
+
+	def test_Classes(self):
+		statistics = {entry.Name: entry for entry in self._profiler.GetClassStatistics()}
+
+		self.assertIn("Architecture.NameBlock", statistics)
+		self.assertEqual(self._profiler.Count, sum(entry.Count for entry in statistics.values()))
+		self.assertIn("Architecture.NameBlock", self._profiler.Report(perClass=True))
+
+	def test_UnusedStates(self):
+		unused = self._profiler.GetUnusedStates([Architecture.NameBlock, Entity.NameBlock])
+
+		self.assertEqual(sorted("Entity.NameBlock." + state.__name__ for state in Entity.NameBlock.__STATES__), unused)
+
+	def test_PStats(self):
+		with TemporaryDirectory() as directory:
+			file = Path(directory) / "states.pstats"
+			self._profiler.WritePStats(file)
+			stats = Stats(str(file))
+
+		self.assertEqual(len(self._profiler), len(stats.stats))
+		self.assertEqual(self._profiler.Count, stats.total_calls)
+
+
+class PlainFunctionState(TestCase):
+	"""The port list pushes ``SimpleResolutionIndicationBlock.stateResolutionFunction``, which isn't a classmethod."""
+
+	def setUp(self) -> None:
+		self._profiler = StateProfiler()
+		content = "entity e is\n  port (\n    a : in std_logic\n  );\nend entity;\n"
+		try:
+			for _ in TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer(content), profiler=self._profiler)():
+				pass
+		except BlockParserException:   # The parser doesn't continue correctly after this state.
+			pass
+
+	def test_Report(self):
+		report = self._profiler.Report()
+
+		self.assertIn("ResolutionIndication.SimpleResolutionIndicationBlock.stateResolutionFunction", report)
+		self.assertIn("ResolutionIndication.SimpleResolutionIndicationBlock", self._profiler.Report(perClass=True))
+
+	def test_PStats(self):
+		names = [name for _, _, name in self._profiler.GetPStats()]
+
+		self.assertIn("ResolutionIndication.SimpleResolutionIndicationBlock.stateResolutionFunction", names)
+
+	def test_UnusedStates(self):
+		unused = self._profiler.GetUnusedStates(MetaBlock.BLOCKS)
+
+		self.assertNotIn("ResolutionIndication.SimpleResolutionIndicationBlock.stateResolutionFunction", unused)
+		self.assertIn(ResolutionIndication.SimpleResolutionIndicationBlock.stateResolutionFunction, ResolutionIndication.SimpleResolutionIndicationBlock.__STATES__)
+
+
+class Decorators(TestCase):
+	def test_FirstEntry(self):
+		counter = ExecutionCounter()
+		counter.IncrementCallCounter(print)
+		counter.IncrementCallCounter(print)
+		timer = ExecutionTimer()
+		timer.AddExecutionTime(print, 0.5)
+
+		self.assertEqual({print: 2}, counter._counts)
+		self.assertEqual({print: [0.5]}, timer._times)
@@ -0,0 +1,120 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+from os                         import utime
+from pathlib                    import Path
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+
+from pyVHDLParser.Project       import ParseFile, ParseFiles
+from pyVHDLParser.Project.Cache import ParseCache
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+VHDL_DIRECTORY = Path(__file__).parent.parent.parent.parent / "vhdl"
+
+
+class Cache(TestCase):
+	def setUp(self) -> None:
+		self._temporaryDirectory = TemporaryDirectory()
+		self.addCleanup(self._temporaryDirectory.cleanup)
+		self._directory = Path(self._temporaryDirectory.name)
+
+	def test_Key(self):
+		key = ParseCache.Key("entity e is end entity;", option=1)
+
+		self.assertEqual(key, ParseCache.Key("entity e is end entity;", option=1))
+		self.assertNotEqual(key, ParseCache.Key("entity f is end entity;", option=1))
+		self.assertNotEqual(key, ParseCache.Key("entity e is end entity;", option=2))
+
+	def test_GetPut(self):
+		cache = ParseCache(self._directory)
+
+		self.assertIsNone(cache.Get("00aa"))
+		cache.Put("00aa", ["value"])
+		self.assertEqual(["value"], cache.Get("00aa"))
+		self.assertEqual((1, 1), (cache.Hits, cache.Misses))
+
+		reopened = ParseCache(self._directory)
+		self.assertEqual(1, len(reopened))
+		self.assertEqual(cache.Size, reopened.Size)
+		self.assertEqual(["value"], reopened.Get("00aa"))
+
+	def test_CorruptEntry(self):
+		cache = ParseCache(self._directory)
+		cache.Put("00aa", "value")
+		(self._directory / "00" / "00aa.pickle").write_bytes(b"garbage")
+
+		self.assertIsNone(cache.Get("00aa"))
+		self.assertEqual(0, len(cache))
+
+	def test_Eviction(self):
+		cache = ParseCache(self._directory, maxSize=3500)
+		for index in range(3):
+			key = f"{index:02x}"
+			cache.Put(key, "x" * 1000)
+			utime(self._directory / key[:2] / f"{key}.pickle", (index, index))
+
+		cache.Get("00")
+		utime(self._directory / "00" / "00.pickle", (10, 10))
+		cache.Put("03", "x" * 1000)
+
+		self.assertLessEqual(cache.Size, 3500)
+		self.assertEqual(3, len(cache))
+		self.assertIsNotNone(cache.Get("00"))
+		self.assertIsNone(cache.Get("01"))
+
+	def test_ParseFile(self):
+		cache = ParseCache(self._directory)
+
+		first =  ParseFile(VHDL_DIRECTORY / "Architecture.vhdl", cache=cache)
+		second = ParseFile(VHDL_DIRECTORY / "Architecture.vhdl", cache=cache)
+
+		self.assertFalse(first.Cached)
+		self.assertTrue(second.Cached)
+		self.assertEqual(first.DesignUnits, second.DesignUnits)
+		self.assertEqual(first.TokenCount, second.TokenCount)
+
+	def test_ParseFiles(self):
+		cache =   ParseCache(self._directory)
+		pattern = VHDL_DIRECTORY / "*.vhdl"
+
+		uncached = ParseFiles(pattern, maxWorkers=1)
+		first =    ParseFiles(pattern, maxWorkers=2, cache=cache)
+		second =   ParseFiles(pattern, maxWorkers=2, cache=cache)
+
+		self.assertEqual([result.File for result in uncached], [result.File for result in second])
+		self.assertEqual([result.DesignUnits for result in uncached], [result.DesignUnits for result in second])
+		self.assertFalse(any(result.Cached for result in first))
+		self.assertTrue(all(result.Cached for result in second))
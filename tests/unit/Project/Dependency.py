@@ -0,0 +1,161 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from os                              import utime
+from pathlib                         import Path
+from tempfile                        import TemporaryDirectory
+from unittest                        import TestCase
+
+from pyVHDLParser.Project.Dependency import DependencyGraph, DependencyCycleError, ExtractDependencies
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+VHDL_DIRECTORY = Path(__file__).parent.parent.parent.parent / "vhdl"
+
+FILES = {
+	"top.vhdl":   "library ieee;\nuse ieee.std_logic_1164.all;\nuse work.pkg.all;\nentity top is\nend entity;\n\narchitecture rtl of top is\nbegin\nend architecture;\n",
+	"body.vhdl":  "package body pkg is\nend package body;\n",
+	"pkg.vhdl":   "use work.types.all;\npackage pkg is\nend package;\n",
+	"types.vhdl": "package types is\nend package;\n",
+	"other.vhdl": "use lib.util.all;\nentity other is\nend entity;\n"
+}
+
+
+class Dependencies(TestCase):
+	def setUp(self) -> None:
+		self._temporaryDirectory = TemporaryDirectory()
+		self.addCleanup(self._temporaryDirectory.cleanup)
+		self._directory = Path(self._temporaryDirectory.name)
+
+		for name, content in FILES.items():
+			(self._directory / name).write_text(content)
+
+		self._graph = DependencyGraph(maxWorkers=1)
+		self._graph.AddFiles(self._directory / name for name in FILES)
+
+	def Names(self, files):
+		return [file.name for file in files]
+
+	def Modify(self, name: str, content: str) -> None:
+		file = self._directory / name
+		file.write_text(content)
+		utime(file, ns=(file.stat().st_atime_ns, file.stat().st_mtime_ns + 1_000_000_000))
+
+	def test_Extract(self):
+		result = ExtractDependencies(self._directory / "top.vhdl")
+
+		self.assertEqual(0, len(result.Diagnostics))
+		self.assertEqual(["entity top", "architecture rtl of top"], [str(unit.Unit) for unit in result.Units])
+		self.assertEqual(["ieee"], result.Units[0].Libraries)
+		self.assertEqual([("ieee", "std_logic_1164"), ("work", "pkg")], result.Units[0].References)
+		self.assertEqual([], result.Units[1].References)
+
+	def test_AnalysisOrder(self):
+		self.assertEqual(["types.vhdl", "pkg.vhdl", "top.vhdl", "body.vhdl", "other.vhdl"], self.Names(self._graph.Update()))
+		self.assertEqual({self._directory / "types.vhdl"}, self._graph.GetDependencies(self._directory / "pkg.vhdl"))
+		self.assertEqual({"top.vhdl", "body.vhdl", "pkg.vhdl"}, set(self.Names(self._graph.GetDependents(self._directory / "types.vhdl", transitive=True))))
+		self.assertEqual({("ieee", "std_logic_1164")}, self._graph.GetUnresolvedReferences(self._directory / "top.vhdl"))
+		self.assertEqual({("lib", "util")}, self._graph.GetUnresolvedReferences(self._directory / "other.vhdl"))
+
+	def test_Library(self):
+		graph = DependencyGraph(maxWorkers=1)
+		graph.AddFile(self._directory / "types.vhdl", library="lib")
+		graph.AddFile(self._directory / "other.vhdl")
+		graph.Update()
+
+		self.assertEqual(self._directory / "types.vhdl", graph.GetDeclaringFile("LIB", "Types"))
+		self.assertEqual({("lib", "util")}, graph.GetUnresolvedReferences(self._directory / "other.vhdl"))
+
+	def test_Update(self):
+		self._graph.Update()
+		self.assertEqual([], self._graph.Update())
+
+		self.Modify("pkg.vhdl", "use work.types.all;\npackage pkg is\n  -- modified\nend package;\n")
+		self.assertEqual(["pkg.vhdl", "top.vhdl", "body.vhdl"], self.Names(self._graph.Update()))
+
+		self._graph.RemoveFile(self._directory / "types.vhdl")
+		self.assertEqual(["pkg.vhdl", "top.vhdl", "body.vhdl"], self.Names(self._graph.Update()))
+		self.assertEqual({("work", "types")}, self._graph.GetUnresolvedReferences(self._directory / "pkg.vhdl"))
+
+	def test_Cycle(self):
+		self._graph.Update()
+		self.Modify("types.vhdl", "use work.pkg.all;\npackage types is\nend package;\n")
+
+		with self.assertRaises(DependencyCycleError) as context:
+			self._graph.Update()
+		self.assertEqual(["pkg.vhdl", "types.vhdl"], self.Names(context.exception.Files))
+
+		self.Modify("types.vhdl", "package types is\nend package;\n")
+		self.assertEqual(["types.vhdl", "pkg.vhdl", "top.vhdl", "body.vhdl"], self.Names(self._graph.Update()))
+
+	def test_ContextReference(self):
+		(self._directory / "ctx.vhdl").write_text("context ctx is\n  library ieee;\n  use ieee.std_logic_1164.all;\nend context;\n")
+		(self._directory / "user.vhdl").write_text("context work.ctx;\nentity user is\nend entity;\n\narchitecture rtl of user is\nbegin\nend architecture;\n")
+		self._graph.AddFile(self._directory / "user.vhdl")
+		self._graph.AddFile(self._directory / "ctx.vhdl")
+
+		result = ExtractDependencies(self._directory / "user.vhdl")
+		self.assertTrue(result.Complete)
+		self.assertEqual(["entity user", "architecture rtl of user"], [str(unit.Unit) for unit in result.Units])
+		self.assertEqual([("work", "ctx")], result.Units[0].References)
+
+		order = self.Names(self._graph.Update())
+		self.assertLess(order.index("ctx.vhdl"), order.index("user.vhdl"))
+
+	def test_IncompleteFile(self):
+		self._graph.Update()
+		self.Modify("types.vhdl", "package types is\n  constant c : string := \"abc;\nend package;\n")
+
+		self.assertEqual([], self._graph.Update())
+		self.assertFalse(self._graph[self._directory / "types.vhdl"].Complete)
+		self.assertEqual({"types.vhdl", "pkg.vhdl", "top.vhdl", "body.vhdl"}, set(self.Names(self._graph.GetUnresolvedFiles())))
+		self.assertEqual(["other.vhdl"], self.Names(self._graph.GetAnalysisOrder()))
+
+		self.Modify("types.vhdl", "package types is\nend package;\n")
+		self.assertEqual(["types.vhdl", "pkg.vhdl", "top.vhdl", "body.vhdl"], self.Names(self._graph.Update()))
+
+	def test_SerialAndParallel(self):
+		# Simple_1.vhdl and Example_1.vhdl declare the same units, which form a dependency cycle.
+		files = sorted(file for file in VHDL_DIRECTORY.glob("*.vhdl") if file.name != "Simple_1.vhdl")
+
+		serial = DependencyGraph(maxWorkers=1)
+		serial.AddFiles(files)
+		parallel = DependencyGraph(maxWorkers=2)
+		parallel.AddFiles(files)
+
+		order = serial.Update()
+		self.assertEqual(len(files), len(order))
+		self.assertEqual(order, parallel.Update())
+		self.assertLess(order.index(VHDL_DIRECTORY / "Package.vhdl"), order.index(VHDL_DIRECTORY / "PackageBody.vhdl"))
@@ -0,0 +1,126 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from pathlib                    import Path
+from pathlib                import Path
+from pickle                 import dumps, loads
+from tempfile               import TemporaryDirectory
+from unittest               import TestCase
+
+from pyVHDLParser.Project   import ParseFile, ParseFiles, ParserStage
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+VHDL_DIRECTORY = Path(__file__).parent.parent.parent.parent / "vhdl"
+
+
+def ResultSummary(result):
+	return (
+		result.File,
+		[(unit.Kind, unit.Name, unit.EntityName, unit.Row) for unit in result.DesignUnits],
+		[str(diagnostic) for diagnostic in result.Diagnostics],
+		result.TokenCount,
+		result.BlockCount,
+		result.GroupCount,
+		sorted(stage.value for stage in result.Timings)
+	)
+
+
+class ParallelParsing(TestCase):
+	def test_ParseFile(self):
+		result = ParseFile(VHDL_DIRECTORY / "AssertStatement.vhdl")
+
+		self.assertTrue(result.Successful)
+		self.assertGreater(result.TokenCount, 0)
+		self.assertGreater(result.BlockCount, 0)
+		self.assertGreater(result.GroupCount, 0)
+		self.assertEqual([ParserStage.Tokenizer, ParserStage.Blocks, ParserStage.Groups], list(result.Timings))
+		self.assertEqual(1, len(result.DesignUnits))
+		self.assertEqual("architecture arch of ent", str(result.DesignUnits[0]))
+
+	def test_DesignUnitKinds(self):
+		result = ParseFile(VHDL_DIRECTORY / "PackageBody.vhdl")
+
+		self.assertEqual(("package body", "myPackage0", None, 1), (result.DesignUnits[0].Kind, result.DesignUnits[0].Name, result.DesignUnits[0].EntityName, result.DesignUnits[0].Row))
+
+	def test_Diagnostics(self):
+		result = ParseFile(VHDL_DIRECTORY / "Use.vhdl")
+
+		self.assertFalse(result.Successful)
+		self.assertEqual(1, len(result.Diagnostics))
+		self.assertIs(ParserStage.Blocks, result.Diagnostics[0].Stage)
+		self.assertEqual((23, 4), (result.Diagnostics[0].Row, result.Diagnostics[0].Column))
+
+	def test_MissingFile(self):
+		result = ParseFile(VHDL_DIRECTORY / "missing.vhdl")
+
+		self.assertFalse(result.Successful)
+		self.assertIs(ParserStage.Read, result.Diagnostics[0].Stage)
+		self.assertEqual(0, result.TokenCount)
+
+	def test_InvalidEncoding(self):
+		with TemporaryDirectory() as directory:
+			file = Path(directory) / "latin1.vhdl"
+			file.write_bytes("-- Größe\nentity e is\nend entity;\n".encode("latin-1"))
+
+			result = ParseFile(file)
+
+		self.assertFalse(result.Successful)
+		self.assertIs(ParserStage.Tokenizer, result.Diagnostics[0].Stage)
+		self.assertEqual((1, 6), (result.Diagnostics[0].Row, result.Diagnostics[0].Column))
+
+	def test_ByteOrderMark(self):
+		with TemporaryDirectory() as directory:
+			file = Path(directory) / "bom.vhdl"
+			file.write_bytes(b"\xef\xbb\xbf" + (VHDL_DIRECTORY / "AssertStatement.vhdl").read_bytes())
+
+			result = ParseFile(file)
+
+		self.assertTrue(result.Successful)
+		self.assertEqual("architecture arch of ent", str(result.DesignUnits[0]))
+
+	def test_Pickle(self):
+		result = ParseFile(VHDL_DIRECTORY / "Architecture.vhdl")
+
+		self.assertEqual(ResultSummary(result), ResultSummary(loads(dumps(result))))
+
+	def test_SerialAndParallel(self):
+		pattern = VHDL_DIRECTORY / "*.vhdl"
+
+		serial =   ParseFiles(pattern, maxWorkers=1)
+		parallel = ParseFiles(pattern, maxWorkers=2)
+
+		self.assertGreater(len(serial), 1)
+		self.assertEqual([ResultSummary(result) for result in serial], [ResultSummary(result) for result in parallel])
@@ -0,0 +1,279 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from struct                                        import pack
+from unittest                                      import TestCase
+
+from pyVHDLParser.Token                            import StartOfDocumentToken
+from pyVHDLParser.Token.Parser                     import Tokenizer
+from pyVHDLParser.Blocks                           import TokenToBlockParser, BlockParserCheckpoint
+from pyVHDLParser.Blocks.Type.ResolutionIndication import SimpleResolutionIndicationBlock
+from pyVHDLParser.Serialization                    import MAGIC, FORMAT_VERSION, SerializationException, Dump, Load, LoadTokenStore
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+CODE = """library ieee;
+use     ieee.std_logic_1164.all;
+
+entity e is
+	generic (
+		G : integer := 8   -- width
+	);
+end entity;
+
+/* block
+   comment */
+architecture rtl of e is
+	constant C : string := "Größe";
+begin
+	process (Clock)
+	begin
+		null;
+	end process;
+end architecture;
+"""
+
+
+def Position(position):
+	return position.Row, position.Column, position.Absolute
+
+
+def TokenSummary(tokens):
+	return [
+		(token.__class__, getattr(token, "Value", None), getattr(token, "Key", None), Position(token.Start), None if token.End is None else Position(token.End))
+		for token in tokens
+	]
+
+
+def BlockSummary(blocks, tokens):
+	indices = {id(token): index for index, token in enumerate(tokens)}
+	return [
+		(block.__class__, indices[id(block.StartToken)], None if block.EndToken is None else indices[id(block.EndToken)], block.MultiPart)
+		for block in blocks
+	]
+
+
+def Parse(content, lazyPositions=False):
+	tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=lazyPositions))
+	blocks = list(TokenToBlockParser(tokens)())
+	return tokens, blocks
+
+
+class RoundTrip(TestCase):
+	def _Check(self, content, lazyPositions=False):
+		tokens, blocks = Parse(content, lazyPositions)
+		document = Load(Dump(tokens[0], blocks[0], content=content))
+
+		self.assertEqual(content, document.Content)
+		self.assertEqual(TokenSummary(tokens), TokenSummary(document.Tokens))
+		self.assertEqual(BlockSummary(blocks, tokens), BlockSummary(document.Blocks, document.Tokens))
+		return document
+
+	def test_Text(self):
+		self._Check(CODE)
+
+	def test_LazyPositions(self):
+		self._Check(CODE, lazyPositions=True)
+
+	def test_WindowsLinebreaks(self):
+		self._Check(CODE.replace("\n", "\r\n"))
+
+	def test_Bytes(self):
+		self._Check(CODE.encode("utf-8"))
+
+	def test_Chains(self):
+		document = self._Check(CODE)
+
+		self.assertIsInstance(document.StartToken, StartOfDocumentToken)
+		self.assertIs(document.StartBlock.StartToken, document.StartToken)
+
+		token = document.StartToken
+		for expected in document.Tokens:
+			self.assertIs(expected, token)
+			if token.NextToken is not None:
+				self.assertIs(token, token.NextToken.PreviousToken)
+			token = token.NextToken
+		self.assertIsNone(token)
+
+		block = document.StartBlock
+		for expected in document.Blocks:
+			self.assertIs(expected, block)
+			block = block.NextBlock
+		self.assertIsNone(block)
+
+	def test_TokensOnly(self):
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(CODE))
+		document = Load(Dump(tokens[0], content=CODE))
+
+		self.assertEqual(TokenSummary(tokens), TokenSummary(document.Tokens))
+		self.assertEqual([], document.Blocks)
+		self.assertIsNone(document.StartBlock)
+
+	def test_LazyTokensWithoutContent(self):
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(CODE, lazyPositions=True))
+		document = Load(Dump(tokens[0]))
+
+		self.assertEqual(CODE, document.Content)
+		self.assertEqual(TokenSummary(tokens), TokenSummary(document.Tokens))
+
+	def test_ContentRequired(self):
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(CODE))
+
+		with self.assertRaises(ValueError):
+			Dump(tokens[0])
+
+	def test_TokenStore(self):
+		tokens, blocks = Parse(CODE)
+		store = LoadTokenStore(Dump(tokens[0], blocks[0], content=CODE))
+
+		self.assertEqual(len(tokens), len(store))
+		for token, view in zip(tokens, store):
+			self.assertIsInstance(view, token.__class__)
+			self.assertEqual(repr(token), repr(view))
+			self.assertEqual(Position(token.Start), Position(view.Start))
+
+
+def ParseWithCheckpoints(content):
+	parser =      TokenToBlockParser(Tokenizer.GetTableDrivenVHDLTokenizer(content, lazyPositions=True))
+	blocks =      []
+	checkpoints = []
+	for block in parser():
+		blocks.append(block)
+		checkpoint = parser.GetCheckpoint()
+		if (checkpoint is not None) and (checkpoint.GetResumeOffset(content) is not None):
+			checkpoints.append(checkpoint)
+	return blocks, checkpoints
+
+
+def ChainSummary(startToken, startBlock):
+	tokens = []
+	token = startToken
+	while token is not None:
+		tokens.append(token)
+		token = token.NextToken
+
+	blocks = []
+	block = startBlock
+	while block is not None:
+		blocks.append(block)
+		block = block.NextBlock
+
+	return TokenSummary(tokens), BlockSummary(blocks, tokens)
+
+
+class Resume(TestCase):
+	def setUp(self) -> None:
+		blocks, self._checkpoints = ParseWithCheckpoints(CODE)
+		self._blocks = blocks
+		self._data =   Dump(blocks[0].StartToken, blocks[0], checkpoints=self._checkpoints)
+
+	def test_Checkpoints(self):
+		document = Load(self._data)
+
+		self.assertEqual(len(self._checkpoints), len(document.Checkpoints))
+		for checkpoint, loaded in zip(self._checkpoints, document.Checkpoints):
+			self.assertTrue(checkpoint.IsEquivalent(loaded))
+			self.assertIs(document.Blocks[self._blocks.index(checkpoint.LastBlock)], loaded.LastBlock)
+
+	def test_FunctionState(self):
+		state =      SimpleResolutionIndicationBlock.stateResolutionFunction
+		checkpoint = BlockParserCheckpoint(self._blocks[1], state, 0, ((self._checkpoints[0].NextState, 2), ))
+		document =   Load(Dump(self._blocks[0].StartToken, self._blocks[0], checkpoints=[checkpoint]))
+
+		self.assertTrue(checkpoint.IsEquivalent(document.Checkpoints[0]))
+
+	def test_ChangedTail(self):
+		content =  CODE.replace("null;", "null;\n\t\tnull;")
+		document = Load(self._data)
+		parser =   document.Resume(content)
+
+		self.assertIsNotNone(parser)
+		self.assertLess(len(document.Blocks), len(self._blocks))
+		newBlocks = list(parser())
+
+		self.assertIs(document.Blocks[-1], newBlocks[0].PreviousBlock)
+		self.assertEqual(content, document.Content)
+		blocks, _ = ParseWithCheckpoints(content)
+		self.assertEqual(ChainSummary(blocks[0].StartToken, blocks[0]), ChainSummary(document.StartToken, document.StartBlock))
+
+	def test_Bytes(self):
+		blocks, checkpoints = ParseWithCheckpoints(CODE.encode("utf-8"))
+		content =  CODE.replace("rtl", "behavior").encode("utf-8")
+		document = Load(Dump(blocks[0].StartToken, blocks[0], checkpoints=checkpoints))
+		for _ in document.Resume(content)():
+			pass
+
+		blocks, _ = ParseWithCheckpoints(content)
+		self.assertEqual(ChainSummary(blocks[0].StartToken, blocks[0]), ChainSummary(document.StartToken, document.StartBlock))
+
+	def test_ChangedFirstLine(self):
+		document = Load(self._data)
+		tokens =   len(document.Tokens)
+
+		self.assertIsNone(document.Resume("library work;" + CODE[CODE.index("\n"):]))
+		self.assertEqual(CODE, document.Content)
+		self.assertEqual(tokens, len(document.Tokens))
+
+	def test_ContentType(self):
+		with self.assertRaises(TypeError):
+			Load(self._data).Resume(CODE.encode("utf-8"))
+
+	def test_BlocksRequired(self):
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(CODE, lazyPositions=True))
+
+		with self.assertRaises(ValueError):
+			Dump(tokens[0], checkpoints=self._checkpoints)
+
+
+class InvalidData(TestCase):
+	def setUp(self) -> None:
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(CODE, lazyPositions=True))
+		self._data = Dump(tokens[0])
+
+	def test_Magic(self):
+		with self.assertRaises(SerializationException):
+			Load(b"XXXX" + self._data[4:])
+
+	def test_Version(self):
+		with self.assertRaises(SerializationException):
+			Load(MAGIC + pack("<H", FORMAT_VERSION + 1) + self._data[6:])
+
+	def test_Truncated(self):
+		with self.assertRaises(SerializationException):
+			Load(self._data[:len(self._data) // 2])
+
+	def test_Empty(self):
+		with self.assertRaises(SerializationException):
+			Load(b"")
@@ -0,0 +1,83 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from mmap                       import mmap, ACCESS_READ
+from pathlib                    import Path
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+
+from tests.unit.Tokenizer.TableDriven import TokenSummary
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+CODE = "entity e is\r\n\tgeneric (G : string := \"äöü\");\r\nend entity; -- ©\r\n/* multi\nline */ a <= b;\n"
+
+
+class ChunkedInput(TestCase):
+	def setUp(self) -> None:
+		self._temporaryDirectory = TemporaryDirectory()
+		self.addCleanup(self._temporaryDirectory.cleanup)
+		self._file = Path(self._temporaryDirectory.name) / "chunked.vhdl"
+		self._file.write_bytes(CODE.encode("utf-8"))
+
+	def test_Chunks(self) -> None:
+		expected = TokenSummary(Tokenizer.GetVHDLTokenizer(CODE))
+
+		for chunkSize in (1, 2, 3, 7, 1024):
+			with self.subTest(chunkSize=chunkSize):
+				chunks = [CODE[i:i + chunkSize] for i in range(0, len(CODE), chunkSize)]
+				self.assertEqual(expected, TokenSummary(Tokenizer.GetVHDLTokenizer(iter(chunks))))
+
+	def test_ReadChunks(self) -> None:
+		expected = TokenSummary(Tokenizer.GetVHDLTokenizer(self._file.read_text(encoding="utf-8")))
+
+		self.assertEqual(expected, TokenSummary(Tokenizer.GetVHDLTokenizer(Tokenizer.ReadChunks(self._file, chunkSize=5, encoding="utf-8"))))
+
+	def test_MemoryMapped(self) -> None:
+		expected = TokenSummary(Tokenizer.GetVHDLTokenizer(CODE))
+
+		# Chunks of single bytes split all multi-byte characters.
+		self.assertEqual(expected, TokenSummary(Tokenizer.GetVHDLTokenizer(Tokenizer.ReadMemoryMappedChunks(self._file, chunkSize=1))))
+
+		with self._file.open("rb") as fileHandle, mmap(fileHandle.fileno(), 0, access=ACCESS_READ) as mapped:
+			self.assertEqual(expected, TokenSummary(Tokenizer.GetVHDLTokenizer(mapped)))
+			self.assertEqual(expected, TokenSummary(Tokenizer.GetTableDrivenVHDLTokenizer(mapped)))
+
+	def test_EmptyFile(self) -> None:
+		self._file.write_bytes(b"")
+
+		self.assertEqual(TokenSummary(Tokenizer.GetVHDLTokenizer("")), TokenSummary(Tokenizer.GetVHDLTokenizer(Tokenizer.ReadMemoryMappedChunks(self._file))))
@@ -0,0 +1,85 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from inspect                      import isclass
+from unittest                     import TestCase
+
+from pyVHDLParser.Token           import WordToken
+from pyVHDLParser.Token           import Keywords
+from pyVHDLParser.Token.Keywords  import EntityKeyword, EndKeyword, IsKeyword, ModuloOperator, RemainderOperator, KEYWORD_CLASSES, RESERVED_WORDS, NO_KEYWORD, ClassifyKeywords, GetKeywordClass
+from pyVHDLParser.Token.Parser    import Tokenizer
+from pyVHDLParser.Blocks          import TokenToBlockParser, InitializeBlocks
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+CODE = "ENTITY e IS\nEND ENTITY;\n"
+
+
+class KeywordClassification(TestCase):
+	def test_ReservedWords(self) -> None:
+		self.assertEqual(len(KEYWORD_CLASSES), len(RESERVED_WORDS))
+		self.assertIs(EntityKeyword, GetKeywordClass(RESERVED_WORDS["entity"]))
+		self.assertIsNone(GetKeywordClass(NO_KEYWORD))
+		with self.assertRaises(TypeError):
+			RESERVED_WORDS["foo"] = 1
+
+	def test_AllReservedWords(self) -> None:
+		keywordClasses = [cls for cls in vars(Keywords).values() if isclass(cls) and cls.__dict__.get("__KEYWORD__", "").isidentifier()]
+
+		self.assertEqual(len(keywordClasses), len(RESERVED_WORDS))
+		for keywordClass in keywordClasses:
+			with self.subTest(keyword=keywordClass.__KEYWORD__):
+				self.assertIs(keywordClass, GetKeywordClass(RESERVED_WORDS[keywordClass.__KEYWORD__]))
+
+		self.assertIs(ModuloOperator, GetKeywordClass(RESERVED_WORDS["mod"]))
+		self.assertIs(RemainderOperator, GetKeywordClass(RESERVED_WORDS["rem"]))
+		self.assertNotIn("<=", RESERVED_WORDS)
+
+	def test_ClassifyKeywords(self) -> None:
+		tokens = list(ClassifyKeywords(Tokenizer.GetVHDLTokenizer(CODE)))
+		words =  [token for token in tokens if isinstance(token, WordToken)]
+
+		self.assertEqual([EntityKeyword, None, IsKeyword, EndKeyword, EntityKeyword], [GetKeywordClass(word.KeywordKind) for word in words])
+		self.assertEqual(NO_KEYWORD, words[1].KeywordKind)
+
+	def test_BlockParser(self) -> None:
+		tokens = list(ClassifyKeywords(Tokenizer.GetTableDrivenVHDLTokenizer(CODE)))
+
+		InitializeBlocks()
+		for _ in TokenToBlockParser(tokens)():
+			pass
+
+		self.assertIsInstance(tokens[1], EntityKeyword)
+		self.assertEqual(RESERVED_WORDS["entity"], tokens[1].KeywordKind)
@@ -0,0 +1,119 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from unittest                     import TestCase
+
+from pyVHDLParser.Token           import WordToken, StartOfDocumentToken
+from pyVHDLParser.Token.Keywords  import EntityKeyword, IdentifierToken, IsKeyword
+from pyVHDLParser.Token.Parser    import Tokenizer, TokenizerException
+from pyVHDLParser.Blocks          import TokenToBlockParser, InitializeBlocks
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+CODE = "ENTITY e IS\nEND ENTITY;\n"
+
+
+def ParseBlocks(tokens, replaceTokens=False):
+	InitializeBlocks()
+	return list(TokenToBlockParser(tokens, replaceTokens=replaceTokens)())
+
+
+def TokenChain(startToken):
+	result = []
+	token = startToken
+	while token is not None:
+		result.append(token)
+		token = token.NextToken
+	return result
+
+
+class Reclassification(TestCase):
+	def test_InPlace(self) -> None:
+		tokens = list(Tokenizer.GetVHDLTokenizer(CODE))
+		word =   tokens[1]
+
+		ParseBlocks(tokens)
+
+		self.assertIsInstance(word, EntityKeyword)
+		self.assertEqual("entity", word.Value)
+		self.assertIsInstance(tokens[3], IdentifierToken)
+		self.assertEqual([id(token) for token in tokens], [id(token) for token in TokenChain(tokens[0])])
+		for previousToken, token in zip(tokens, tokens[1:]):
+			self.assertIs(previousToken, token.PreviousToken)
+
+	def test_Replacement(self) -> None:
+		tokens = list(Tokenizer.GetVHDLTokenizer(CODE))
+		word =   tokens[1]
+
+		blocks = ParseBlocks(tokens, replaceTokens=True)
+
+		chain = TokenChain(tokens[0])
+		self.assertIs(WordToken, word.__class__)
+		self.assertEqual("ENTITY", word.Value)
+		self.assertIsInstance(chain[1], EntityKeyword)
+		self.assertIsNot(word, chain[1])
+		self.assertEqual([token.__class__ for token in chain], [token.__class__ for token in TokenChain(self._ParseInPlace())])
+		for previousToken, token in zip(chain, chain[1:]):
+			self.assertIs(previousToken, token.PreviousToken)
+
+		chainIds = {id(token) for token in chain}
+		for block in blocks:
+			self.assertIn(id(block.StartToken), chainIds)
+			if block.EndToken is not None:
+				self.assertIn(id(block.EndToken), chainIds)
+
+	def test_ReplacementPerParser(self) -> None:
+		replaced = list(Tokenizer.GetVHDLTokenizer(CODE))
+		inPlace =  list(Tokenizer.GetVHDLTokenizer(CODE))
+
+		replacingParser = TokenToBlockParser(replaced, replaceTokens=True)()
+		inPlaceParser =   TokenToBlockParser(inPlace)()
+		for _ in zip(replacingParser, inPlaceParser):
+			pass
+
+		self.assertIs(WordToken, replaced[1].__class__)
+		self.assertIsInstance(inPlace[1], EntityKeyword)
+
+	def test_WrongKeyword(self) -> None:
+		word = WordToken(StartOfDocumentToken(), "entity", None, None)
+
+		with self.assertRaises(TokenizerException):
+			IsKeyword(fromExistingToken=word)
+		self.assertIs(WordToken, word.__class__)
+
+	def _ParseInPlace(self) -> StartOfDocumentToken:
+		tokens = list(Tokenizer.GetVHDLTokenizer(CODE))
+		ParseBlocks(tokens)
+		return tokens[0]
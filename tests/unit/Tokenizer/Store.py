@@ -0,0 +1,104 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from unittest                     import TestCase
+
+from pyVHDLParser.Token           import WordToken, EndOfDocumentToken, TokenIterator
+from pyVHDLParser.Token.Keywords  import EntityKeyword, IdentifierToken
+from pyVHDLParser.Token.Parser    import Tokenizer
+from pyVHDLParser.Token.Store     import TokenStore
+from pyVHDLParser.Blocks          import TokenToBlockParser, InitializeBlocks
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+CODE = "entity e is\n  port (\n    Clk : in std_logic;\n    clk_en : in STD_LOGIC\n  );\nend entity;\n"
+
+
+class Store(TestCase):
+	def test_FromContent(self) -> None:
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(CODE))
+		store =  TokenStore.FromContent(CODE)
+
+		self.assertEqual(len(tokens), len(store))
+		for token, view in zip(tokens, store):
+			self.assertIsInstance(view, token.__class__)
+			self.assertEqual(repr(token), repr(view))
+			self.assertEqual((token.Start.Row, token.Start.Column, token.Start.Absolute), (view.Start.Row, view.Start.Column, view.Start.Absolute))
+
+	def test_FromTokenChain(self) -> None:
+		code =   "entity e is\nend entity;\n"
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer(code))
+		InitializeBlocks()
+		for _ in TokenToBlockParser(tokens)():
+			pass
+
+		store = TokenStore.FromTokens(tokens, content=code)
+
+		self.assertIsInstance(store[1], EntityKeyword)
+		self.assertIsInstance(store[3], IdentifierToken)
+		self.assertEqual("e", store[3].Key)
+		self.assertIs(EntityKeyword, store.GetKind(1))
+
+	def test_FromTokensWithoutContent(self) -> None:
+		with self.assertRaises(ValueError):
+			TokenStore.FromTokens(Tokenizer.GetTableDrivenVHDLTokenizer(CODE))
+
+	def test_Iterator(self) -> None:
+		store =  TokenStore.FromContent(CODE)
+		values = [token.Value for token in store.Find("std_logic")]
+
+		first, second = store.Find("std_logic")
+		self.assertEqual(["std_logic", "STD_LOGIC"], values)
+		token = second
+		while token is not first:
+			token = token.PreviousToken
+		self.assertEqual(len(store) - 1, len(list(store[0].GetIterator())))
+		self.assertIsInstance(store[-1], EndOfDocumentToken)
+		self.assertIsNone(store[-1].NextToken)
+
+		iterator = TokenIterator(first, stopToken=second)
+		self.assertIs(second, list(iterator)[-1])
+
+	def test_FindIndices(self) -> None:
+		store = TokenStore.FromContent(CODE)
+
+		self.assertEqual(1, len(store.FindIndices("CLK")))
+		self.assertEqual(2, len(store.FindIndices("std_logic")))
+		self.assertEqual(1, len(store.FindIndices("std_logic", caseSensitive=True)))
+		self.assertEqual([], store.FindIndices("clk_enable"))
+		for index in store.FindIndices("clk"):
+			self.assertIs(WordToken, store.GetKind(index))
+			self.assertEqual("clk", store[index].Key)
+		self.assertEqual(["Clk"], [store.GetValue(index) for index in store.FindIndices("Clk", caseSensitive=True)])
@@ -0,0 +1,199 @@
+# ==================================================================================================================== #
+#            __     ___   _ ____  _     ____                                                                           #
+#  _ __  _   \ \   / / | | |  _ \| |   |  _ \ __ _ _ __ ___  ___ _ __                                                  #
+# | '_ \| | | \ \ / /| |_| | | | | |   | |_) / _` | '__/ __|/ _ \ '__|                                                 #
+# | |_) | |_| |\ V / |  _  | |_| | |___|  __/ (_| | |  \__ \  __/ |                                                    #
+# | .__/ \__, | \_/  |_| |_|____/|_____|_|   \__,_|_|  |___/\___|_|                                                    #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+# ==================================================================================================================== #
+#
+#
+from pathlib                    import Path
+from unittest                   import TestCase
+
+from pyVHDLParser               import SourceCodeIndex
+from pyVHDLParser.Token.Parser  import Tokenizer, TokenizerException
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def TokenSummary(tokenStream):
+	result = []
+	for token in tokenStream:
+		result.append((
+			token.__class__,
+			getattr(token, "Value", None),
+			None if token.Start is None else (token.Start.Row, token.Start.Column, token.Start.Absolute),
+			None if token.End is None else (token.End.Row, token.End.Column, token.End.Absolute)
+		))
+	return result
+
+
+class TableDrivenTokenizer(TestCase):
+	def assertSameTokenChain(self, code: str, lazyPositions: bool = False) -> None:
+		expected = TokenSummary(Tokenizer.GetVHDLTokenizer(code))
+		actual =   TokenSummary(Tokenizer.GetTableDrivenVHDLTokenizer(code, lazyPositions=lazyPositions))
+
+		self.assertEqual(len(expected), len(actual), msg="Token chains have different length.")
+		for expectedToken, actualToken in zip(expected, actual):
+			self.assertEqual(expectedToken, actualToken)
+
+	def test_Sequences(self) -> None:
+		self.assertSameTokenChain("a bbb 1 23 3.4 45.6 5.67 67.89 .7 .89 ( ) < > = . , ; & / + - * << >> /= <= >= => := ** ?= ?/= ?< ?> <> ")
+		self.assertSameTokenChain("""abc   \\def\\ \t 'a' "abc" /* help */ -- foo\n """)
+		self.assertSameTokenChain("""abc\n123\n456.789\n'Z'\n"Hallo"\n\\foo\\\n-- comment\n/* comment */\n;\n  \nabc\r\n123\r\n456.789\r\n'Z'\r\n"Hallo"\r\n\\foo\\\r\n-- comment\r\n/* comment */\r\n;\r\n  \r\n\tabc """)
+
+	def test_Quirks(self) -> None:
+		self.assertSameTokenChain("a*(b);")
+		self.assertSameTokenChain("a -\nb")
+		self.assertSameTokenChain("/*/ x")
+		self.assertSameTokenChain("-- comment\r\r\n  `directive\r\n\t")
+
+	def test_Files(self) -> None:
+		for file in (Path(__file__).parents[3] / "vhdl").glob("*.vhdl"):
+			with self.subTest(file=file.name):
+				content = file.read_text()
+				self.assertSameTokenChain(content)
+				self.assertSameTokenChain(content.replace("\n", "\r\n"))
+
+	def test_Exceptions(self) -> None:
+		for code in ("a'range", "/* open comment", "a <"):
+			with self.subTest(code=code):
+				with self.assertRaises(TokenizerException) as expected:
+					TokenSummary(Tokenizer.GetVHDLTokenizer(code))
+				with self.assertRaises(TokenizerException) as actual:
+					TokenSummary(Tokenizer.GetTableDrivenVHDLTokenizer(code))
+
+				self.assertEqual(str(expected.exception), str(actual.exception))
+
+
+class LazyPositions(TableDrivenTokenizer):
+	def assertSameTokenChain(self, code: str, lazyPositions: bool = True) -> None:
+		super().assertSameTokenChain(code, lazyPositions)
+
+	def test_SourceIndex(self) -> None:
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer("entity e is\nend entity;\n", lazyPositions=True))
+
+		self.assertIsInstance(tokens[0].SourceIndex, SourceCodeIndex)
+		for token in tokens[1:-1]:
+			self.assertIs(tokens[0].SourceIndex, token.SourceIndex)
+			self.assertIsInstance(token._start, int)
+
+		self.assertEqual((2, 5, 17), (tokens[9].Start.Row, tokens[9].Start.Column, tokens[9].Start.Absolute))
+		self.assertEqual("entity", tokens[9].Value)
+
+	def test_GetPosition(self) -> None:
+		index = SourceCodeIndex("ab\ncd\r\n\nef")
+
+		for absolute, expected in ((4, (2, 1)), (10, (4, 2)), (1, (1, 1)), (3, (1, 3)), (7, (2, 4)), (9, (4, 1))):
+			with self.subTest(absolute=absolute):
+				position = index.GetPosition(absolute)
+				self.assertEqual(expected, (position.Row, position.Column))
+				self.assertEqual(absolute, position.Absolute)
+
+
+class ByteContent(TableDrivenTokenizer):
+	def assertSameTokenChain(self, code: str, lazyPositions: bool = False) -> None:
+		expected = TokenSummary(Tokenizer.GetVHDLTokenizer(code))
+		actual =   TokenSummary(Tokenizer.GetTableDrivenVHDLTokenizer(code.encode("utf-8"), lazyPositions=lazyPositions))
+
+		self.assertEqual(expected, actual)
+
+	def test_Decoding(self) -> None:
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer("-- Größe\nentity e is".encode("utf-8")))
+
+		self.assertEqual("-- Größe\n", tokens[1].Value)
+		# Columns count bytes.
+		self.assertEqual((1, 11), (tokens[1].End.Row, tokens[1].End.Column))
+		self.assertEqual("entity", tokens[2].Value)
+
+	def test_Encoding(self) -> None:
+		tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer("x <= \"Größe\";".encode("latin-1"), encoding="latin-1"))
+
+		self.assertEqual("Größe", tokens[5].Value)
+		self.assertEqual((1, 12), (tokens[5].End.Row, tokens[5].End.Column))
+
+	def assertSameValues(self, code: str) -> None:
+		expected = [(token.__class__, getattr(token, "Value", None)) for token in Tokenizer.GetVHDLTokenizer(code)]
+		for lazyPositions in (False, True):
+			with self.subTest(lazyPositions=lazyPositions):
+				actual = [(token.__class__, getattr(token, "Value", None)) for token in Tokenizer.GetTableDrivenVHDLTokenizer(code.encode("utf-8"), lazyPositions=lazyPositions)]
+
+				self.assertEqual(expected, actual)
+
+	def test_ByteOrderMark(self) -> None:
+		for lazyPositions in (False, True):
+			with self.subTest(lazyPositions=lazyPositions):
+				tokens = list(Tokenizer.GetTableDrivenVHDLTokenizer("\ufeffentity e is\nend;".encode("utf-8"), lazyPositions=lazyPositions))
+
+				self.assertEqual("entity", tokens[1].Value)
+				# The byte order mark is skipped, but counted like other bytes.
+				self.assertEqual((1, 4, 4), (tokens[1].Start.Row, tokens[1].Start.Column, tokens[1].Start.Absolute))
+
+	def test_NonASCIICharacterLiteral(self) -> None:
+		self.assertSameValues("x <= 'é';\n")
+		self.assertSameValues("x <= '€' & 'ä';\n")
+
+	def test_NonASCIIIdentifier(self) -> None:
+		self.assertSameValues("signal café : bit;\n")
+		self.assertSameValues("signal ärger, x<ö : bit;\n")
+
+	def test_InvalidByteSequence(self) -> None:
+		for lazyPositions in (False, True):
+			with self.subTest(lazyPositions=lazyPositions):
+				with self.assertRaises(TokenizerException) as context:
+					list(Tokenizer.GetTableDrivenVHDLTokenizer(b"entity e is\n-- \xff\nend;", lazyPositions=lazyPositions))
+
+				self.assertEqual((2, 4, 16), (context.exception.Position.Row, context.exception.Position.Column, context.exception.Position.Absolute))
+
+
+class ByteContentLazyPositions(ByteContent):
+	def assertSameTokenChain(self, code: str, lazyPositions: bool = True) -> None:
+		super().assertSameTokenChain(code, lazyPositions)
+
+
+class Batches(TestCase):
+	def test_Batches(self) -> None:
+		code =     (Path(__file__).parents[3] / "vhdl" / "Entity.vhdl").read_text()
+		expected = TokenSummary(Tokenizer.GetTableDrivenVHDLTokenizer(code))
+
+		for batchSize in (1, 7, 1024):
+			with self.subTest(batchSize=batchSize):
+				batches = list(Tokenizer.GetBatchedVHDLTokenizer(code, batchSize=batchSize))
+
+				self.assertEqual(expected, TokenSummary(token for batch in batches for token in batch))
+				for batch in batches[:-1]:
+					self.assertGreaterEqual(len(batch), batchSize)
+				for batch, nextBatch in zip(batches, batches[1:]):
+					self.assertIs(batch[-1].NextToken, nextBatch[0])
+
+	def test_Exception(self) -> None:
+		batches = Tokenizer.GetBatchedVHDLTokenizer("entity e is\n/* open comment", batchSize=1024)
+
+		self.assertEqual("is", next(batches)[-2].Value)
+		with self.assertRaises(TokenizerException):
+			next(batches)
@@ -310,3 +310,26 @@ class Tokenizer_ExceptionInKeyword(TestCase, ExpectedDataMixin, TokenSequence):
 		with self.assertRaises(TokenizerException) as ex:
 			_ = EntityKeyword(fromExistingToken=keywordToken)
 		# TODO: check exception message
+
+
+class WordTokenKey(TestCase):
+	def test_Key(self) -> None:
+		tokens = [token for token in Tokenizer.GetVHDLTokenizer("Clk clk CLK entity") if isinstance(token, WordToken)]
+
+		self.assertEqual(["Clk", "clk", "CLK", "entity"], [token.Value for token in tokens])
+		self.assertEqual(["clk", "clk", "clk", "entity"], [token.Key for token in tokens])
+		self.assertIs(tokens[0].Key, tokens[2].Key)
+		self.assertIs(tokens[1].Key, tokens[1].Value)
+		self.assertTrue(tokens[2] <= "clk")
+
+	def test_TableDriven(self) -> None:
+		tokens = [token for token in Tokenizer.GetTableDrivenVHDLTokenizer("Clk clk", lazyPositions=True) if isinstance(token, WordToken)]
+
+		self.assertIs(tokens[0].Key, tokens[1].Key)
+
+	def test_Keyword(self) -> None:
+		word = WordToken(StartOfDocumentToken(), "ENTITY", None, None)
+		keyword = EntityKeyword(fromExistingToken=word)
+
+		self.assertEqual("entity", keyword.Value)
+		self.assertEqual("entity", keyword.Key)